@@ -3,37 +3,38 @@
 Comprehensive benchmarking suite for comparing Python vs C++ implementations.
 """
 
-import time
+import argparse
+import csv
+import dataclasses
+import itertools
 import json
-import sys
 import os
-import statistics
-from typing import Dict, List, Any, Callable
-from dataclasses import dataclass
-try:
-    import matplotlib.pyplot as plt
+import sys
+import time
+import timeit
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING, Any, Callable
+
+import numpy as np
+
+if TYPE_CHECKING:
     import pandas as pd
-    PLOTTING_AVAILABLE = True
-except ImportError:
-    PLOTTING_AVAILABLE = False
-    print("Warning: matplotlib and/or pandas not available. Plotting features disabled.")
 
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 # Import both implementations
-from python.data.models import (
-    Drawing as PyDrawing, 
-    Circle as PyCircle, 
-    Rectangle as PyRectangle,
-    Point as PyPoint, 
-    Color as PyColor
-)
+from python.data.models import Color as PyColor  # noqa: E402
+from python.data.models import Drawing as PyDrawing  # noqa: E402
+from python.data.models import FillStyle as PyFillStyle  # noqa: E402
+from python.data.models import Layer as PyLayer  # noqa: E402
 
 # Import C++ implementation
 sys.path.insert(0, 'cpp')
 try:
     import drawing_cpp
+
     from python.drawing_cpp_wrapper import DrawingCpp
     CPP_AVAILABLE = True
 except ImportError:
@@ -44,6 +45,12 @@ except ImportError:
     sys.exit(1)
 
 
+def circle_coordinates(n: int) -> tuple[np.ndarray, np.ndarray]:
+    """x/y columns of the benchmark dataset, n circles on a 1000-wide grid."""
+    indices = np.arange(n, dtype=np.float32)
+    return indices % 1000, indices // 1000
+
+
 @dataclass
 class BenchmarkResult:
     name: str
@@ -53,70 +60,84 @@ class BenchmarkResult:
     time_ms: float
     memory_bytes: int
     objects_per_second: float
-    
+
 
 class Benchmark:
     """Base class for benchmarks."""
-    
+
     def __init__(self, name: str):
         self.name = name
-        self.results: List[BenchmarkResult] = []
-    
-    def measure_time(self, func: Callable, *args, **kwargs) -> float:
-        """Measure execution time in milliseconds."""
-        start = time.perf_counter()
-        result = func(*args, **kwargs)
-        end = time.perf_counter()
-        return (end - start) * 1000, result
-    
-    def run(self, sizes: List[int]) -> List[BenchmarkResult]:
+        self.results: list[BenchmarkResult] = []
+
+    def measure_time(self, func: Callable, *args, repeat: int = 5, **kwargs) -> tuple[float, Any]:
+        """Measure execution time in milliseconds.
+
+        The number of calls per sample is auto-scaled (timeit autorange, >= 0.2s)
+        and the best of `repeat` samples is reported, together with the result
+        of the last call.
+        """
+        result = None
+
+        def call():
+            nonlocal result
+            result = func(*args, **kwargs)
+
+        timer = timeit.Timer(call)
+        number, _ = timer.autorange()
+        samples = timer.repeat(repeat=repeat, number=number)
+        return min(samples) / number * 1000, result
+
+    def build_circle_drawing(self, xs: np.ndarray, ys: np.ndarray):
+        """Build a C++ test drawing of circles at xs/ys, returns (drawing, ids)."""
+        drawing = DrawingCpp(5000, 5000)
+        ids = drawing.add_circles_batch(xs, ys, 5.0)
+        return drawing, ids
+
+    def run(self, sizes: list[int]) -> list[BenchmarkResult]:
         """Run benchmark for different object counts."""
         raise NotImplementedError
 
 
 class CreationBenchmark(Benchmark):
     """Benchmark object creation performance."""
-    
+
     def __init__(self):
         super().__init__("Object Creation")
-    
+
     def create_python_objects(self, n: int) -> PyDrawing:
         drawing = PyDrawing(width=5000, height=5000)
-        layer = drawing.add_layer("default")
-        
-        for i in range(n):
-            circle = PyCircle(
-                center=PyPoint(x=float(i % 1000), y=float(i // 1000)),
-                radius=5.0,
-                fill=PyColor(r=255, g=0, b=0)
-            )
-            layer.add_object(circle)
-        
+        layer = PyLayer(name="default")
+        drawing.add_layer(layer)
+
+        indices = np.arange(n)
+        xs = (indices % 1000).astype(float).tolist()
+        ys = (indices // 1000).astype(float).tolist()
+        fill = PyFillStyle(color=PyColor(r=255, g=0, b=0))
+
+        layer.ingest_circles(xs, ys, [5.0] * n, fill=fill)
+
         return drawing
-    
+
     def create_cpp_objects(self, n: int) -> DrawingCpp:
         drawing = DrawingCpp(5000, 5000)
-        
-        for i in range(n):
-            drawing.add_circle(
-                x=float(i % 1000),
-                y=float(i // 1000),
-                radius=5.0,
-                fill_color=(255, 0, 0)
-            )
-        
+
+        indices = np.arange(n, dtype=np.float32)
+        xs = indices % 1000
+        ys = indices // 1000
+        drawing.add_circles_batch(xs, ys, 5.0, fill_color=(255, 0, 0))
+
         return drawing
-    
-    def run(self, sizes: List[int]) -> List[BenchmarkResult]:
+
+    def run(self, sizes: list[int]) -> list[BenchmarkResult]:
         results = []
-        
+
         for n in sizes:
             # Python implementation
             time_ms, py_drawing = self.measure_time(self.create_python_objects, n)
-            
+
             # Estimate memory (rough approximation)
             py_memory = n * 800  # ~800 bytes per object in Python
-            
+
             results.append(BenchmarkResult(
                 name=self.name,
                 implementation="Python",
@@ -126,10 +147,10 @@ class CreationBenchmark(Benchmark):
                 memory_bytes=py_memory,
                 objects_per_second=n / (time_ms / 1000) if time_ms > 0 else 0
             ))
-            
+
             # C++ implementation
             time_ms, cpp_drawing = self.measure_time(self.create_cpp_objects, n)
-            
+
             results.append(BenchmarkResult(
                 name=self.name,
                 implementation="C++",
@@ -139,29 +160,44 @@ class CreationBenchmark(Benchmark):
                 memory_bytes=cpp_drawing.memory_usage,
                 objects_per_second=n / (time_ms / 1000) if time_ms > 0 else 0
             ))
-        
+
         return results
 
 
 class SerializationBenchmark(Benchmark):
     """Benchmark serialization performance."""
-    
+
     def __init__(self):
         super().__init__("Serialization")
-    
-    def run(self, sizes: List[int]) -> List[BenchmarkResult]:
+
+    @staticmethod
+    def drop_page_cache(filename: str) -> bool:
+        """Evict a file from the page cache so the next read is cold."""
+        if not hasattr(os, "posix_fadvise"):
+            return False
+        fd = os.open(filename, os.O_RDONLY)
+        try:
+            os.fsync(fd)  # dirty pages are not dropped
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(fd)
+        return True
+
+    def run(self, sizes: list[int]) -> list[BenchmarkResult]:
         results = []
-        
+        # Per-process names so parallel runs don't collide
+        bin_file = f"temp_bench_{os.getpid()}.bin"
+        json_file = f"temp_bench_{os.getpid()}.json"
+
+        # Generate the largest dataset once, each size bulk-loads a prefix of it
+        xs, ys = circle_coordinates(max(sizes))
+
         for n in sizes:
-            # Create test data
-            cpp_drawing = DrawingCpp(5000, 5000)
-            for i in range(n):
-                cpp_drawing.add_circle(i % 1000, i // 1000, 5)
-            
+            cpp_drawing, _ = self.build_circle_drawing(xs[:n], ys[:n])
+
             # Binary save
-            time_ms, _ = self.measure_time(cpp_drawing.save_binary, "temp_bench.bin")
-            file_size = os.path.getsize("temp_bench.bin")
-            
+            time_ms, file_size = self.measure_time(cpp_drawing.save_binary, bin_file)
+
             results.append(BenchmarkResult(
                 name=self.name,
                 implementation="C++",
@@ -171,10 +207,26 @@ class SerializationBenchmark(Benchmark):
                 memory_bytes=file_size,
                 objects_per_second=n / (time_ms / 1000) if time_ms > 0 else 0
             ))
-            
-            # Binary load
-            time_ms, _ = self.measure_time(DrawingCpp.load_binary, "temp_bench.bin")
-            
+
+            # Binary load, cold cache - a single run, repeats would be warm
+            if self.drop_page_cache(bin_file):
+                start = time.perf_counter()
+                DrawingCpp.load_binary(bin_file)
+                time_ms = (time.perf_counter() - start) * 1000
+
+                results.append(BenchmarkResult(
+                    name=self.name,
+                    implementation="C++",
+                    operation="load_binary_cold",
+                    num_objects=n,
+                    time_ms=time_ms,
+                    memory_bytes=file_size,
+                    objects_per_second=n / (time_ms / 1000) if time_ms > 0 else 0
+                ))
+
+            # Binary load, warm cache
+            time_ms, _ = self.measure_time(DrawingCpp.load_binary, bin_file)
+
             results.append(BenchmarkResult(
                 name=self.name,
                 implementation="C++",
@@ -184,12 +236,25 @@ class SerializationBenchmark(Benchmark):
                 memory_bytes=file_size,
                 objects_per_second=n / (time_ms / 1000) if time_ms > 0 else 0
             ))
-            
+
+            # Binary load via mmap, warm cache - compare against load_binary
+            time_ms, _ = self.measure_time(DrawingCpp.load_binary_mmap, bin_file)
+
+            results.append(BenchmarkResult(
+                name=self.name,
+                implementation="C++",
+                operation="load_binary_mmap",
+                num_objects=n,
+                time_ms=time_ms,
+                memory_bytes=file_size,
+                objects_per_second=n / (time_ms / 1000) if time_ms > 0 else 0
+            ))
+
             # JSON save (smaller dataset due to size)
             if n <= 10000:
-                time_ms, _ = self.measure_time(cpp_drawing.save_json, "temp_bench.json")
-                json_size = os.path.getsize("temp_bench.json")
-                
+                time_ms, _ = self.measure_time(cpp_drawing.save_json, json_file)
+                json_size = os.path.getsize(json_file)
+
                 results.append(BenchmarkResult(
                     name=self.name,
                     implementation="C++",
@@ -199,38 +264,48 @@ class SerializationBenchmark(Benchmark):
                     memory_bytes=json_size,
                     objects_per_second=n / (time_ms / 1000) if time_ms > 0 else 0
                 ))
-                
-                os.remove("temp_bench.json")
-            
-            os.remove("temp_bench.bin")
-        
+
+        # Files are rewritten in place across sizes and only removed at the end
+        os.remove(bin_file)
+        if os.path.exists(json_file):
+            os.remove(json_file)
+
         return results
 
 
 class BatchOperationsBenchmark(Benchmark):
     """Benchmark batch operations performance."""
-    
+
     def __init__(self):
         super().__init__("Batch Operations")
-    
-    def run(self, sizes: List[int]) -> List[BenchmarkResult]:
+
+    @staticmethod
+    def alternating(func: Callable, storage, ids, forward: tuple, back: tuple) -> Callable:
+        """Return a call that applies func with `forward` and `back` in turn.
+
+        measure_time repeats a call thousands of times on the same drawing;
+        undoing every other call keeps the coordinates near their starting
+        values instead of drifting towards inf or denormals.
+        """
+        steps = itertools.cycle((forward, back))
+        return lambda: func(storage, ids, *next(steps))
+
+    def run(self, sizes: list[int]) -> list[BenchmarkResult]:
         results = []
-        
+
+        # Build the largest dataset once, smaller sizes use a prefix of its ids
+        drawing, all_ids = self.build_circle_drawing(*circle_coordinates(max(sizes)))
+        storage = drawing._drawing.get_storage()
+
         for n in sizes:
-            # Create test data
-            drawing = DrawingCpp(5000, 5000)
-            ids = []
-            for i in range(n):
-                ids.append(drawing.add_circle(i % 1000, i // 1000, 5))
-            
-            storage = drawing._drawing.get_storage()
-            
+            ids = all_ids[:n]
+
             # Translate
-            time_ms, _ = self.measure_time(
+            time_ms, _ = self.measure_time(self.alternating(
                 drawing_cpp.BatchOperations.translate_objects,
-                storage, ids, 10.0, 20.0
-            )
-            
+                storage, ids, (10.0, 20.0), (-10.0, -20.0)
+            ))
+
             results.append(BenchmarkResult(
                 name=self.name,
                 implementation="C++",
@@ -240,13 +315,13 @@ class BatchOperationsBenchmark(Benchmark):
                 memory_bytes=0,
                 objects_per_second=n / (time_ms / 1000) if time_ms > 0 else 0
             ))
-            
+
             # Scale
-            time_ms, _ = self.measure_time(
+            time_ms, _ = self.measure_time(self.alternating(
                 drawing_cpp.BatchOperations.scale_objects,
-                storage, ids, 1.5, 1.5
-            )
-            
+                storage, ids, (1.5, 1.5), (1 / 1.5, 1 / 1.5)
+            ))
+
             results.append(BenchmarkResult(
                 name=self.name,
                 implementation="C++",
@@ -256,13 +331,13 @@ class BatchOperationsBenchmark(Benchmark):
                 memory_bytes=0,
                 objects_per_second=n / (time_ms / 1000) if time_ms > 0 else 0
             ))
-            
+
             # Calculate bounding box
             time_ms, _ = self.measure_time(
                 drawing_cpp.BatchOperations.calculate_bounding_box,
                 storage, ids
             )
-            
+
             results.append(BenchmarkResult(
                 name=self.name,
                 implementation="C++",
@@ -272,34 +347,74 @@ class BatchOperationsBenchmark(Benchmark):
                 memory_bytes=0,
                 objects_per_second=n / (time_ms / 1000) if time_ms > 0 else 0
             ))
-        
+
         return results
 
 
+def _run_pinned(benchmark: Benchmark, sizes: list[int], cpus: list[int]) -> list[BenchmarkResult]:
+    """Worker entry point for parallel runs - pin to `cpus`, then run."""
+    if cpus and hasattr(os, "sched_setaffinity"):
+        os.sched_setaffinity(0, cpus)
+    return benchmark.run(sizes)
+
+
 class BenchmarkRunner:
     """Run all benchmarks and generate reports."""
-    
+
     def __init__(self):
         self.benchmarks = [
             CreationBenchmark(),
             SerializationBenchmark(),
             BatchOperationsBenchmark()
         ]
-        self.results: List[BenchmarkResult] = []
-    
-    def run_all(self, sizes: List[int] = None):
-        """Run all benchmarks."""
+        self.results: list[BenchmarkResult] = []
+        self._df = None
+
+    @property
+    def results_frame(self) -> "pd.DataFrame":
+        """Results as a DataFrame, built once and reused by plots and report."""
+        import pandas as pd
+
+        if self._df is None:
+            self._df = pd.DataFrame.from_records([asdict(r) for r in self.results])
+        return self._df
+
+    def run_parallel(self, sizes: list[int]) -> list[list[BenchmarkResult]]:
+        """Run each benchmark in its own process, pinned to disjoint CPU sets.
+
+        The benchmarks use independent data, so wall time becomes roughly the
+        slowest benchmark instead of the sum - at the cost of some contention
+        for memory bandwidth between them.
+        """
+        available = sorted(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else []
+        n = len(self.benchmarks)
+        cpu_sets = [available[i::n] for i in range(n)] if len(available) >= n else [[]] * n
+
+        with ProcessPoolExecutor(max_workers=n) as executor:
+            futures = [
+                executor.submit(_run_pinned, benchmark, sizes, cpus)
+                for benchmark, cpus in zip(self.benchmarks, cpu_sets)
+            ]
+            return [future.result() for future in futures]
+
+    def run_all(self, sizes: list[int] = None, parallel: bool = False):
+        """Run all benchmarks, optionally in parallel processes."""
         if sizes is None:
             sizes = [100, 1000, 10000, 100000]
-        
+
         print("Running benchmarks...")
         print("=" * 60)
-        
-        for benchmark in self.benchmarks:
+
+        if parallel:
+            all_results = self.run_parallel(sizes)
+        else:
+            all_results = (benchmark.run(sizes) for benchmark in self.benchmarks)
+
+        for benchmark, results in zip(self.benchmarks, all_results):
             print(f"\n{benchmark.name}:")
-            results = benchmark.run(sizes)
             self.results.extend(results)
-            
+            self._df = None
+
             # Print summary
             for result in results:
                 if result.time_ms > 0:
@@ -307,42 +422,66 @@ class BenchmarkRunner:
                           f"({result.num_objects:,} objects): "
                           f"{result.time_ms:.2f}ms, "
                           f"{result.objects_per_second/1e6:.2f}M obj/s")
-    
-    def save_results(self, filename: str = "benchmark_results.json"):
-        """Save results to JSON file."""
-        data = [
-            {
-                "name": r.name,
-                "implementation": r.implementation,
-                "operation": r.operation,
-                "num_objects": r.num_objects,
-                "time_ms": r.time_ms,
-                "memory_bytes": r.memory_bytes,
-                "objects_per_second": r.objects_per_second
-            }
-            for r in self.results
-        ]
-        
-        with open(filename, 'w') as f:
-            json.dump(data, f, indent=2)
-        
+
+    def save_results(self, filename: str = "benchmark_results.jsonl"):
+        """Save results as JSON Lines, one compact record per line."""
+        try:
+            from orjson import dumps
+        except ImportError:
+            def dumps(record: dict) -> bytes:
+                return json.dumps(record, separators=(',', ':')).encode()
+
+        with open(filename, 'wb') as f:
+            f.writelines(dumps(asdict(r)) + b'\n' for r in self.results)
+
         print(f"\nResults saved to {filename}")
-    
+
+    def save_csv(self, filename: str = "benchmark_results.csv",
+                 gnuplot_script: str = "benchmark_results.gp"):
+        """Save results as CSV plus a gnuplot script - no pandas/matplotlib needed."""
+        fields = [field.name for field in dataclasses.fields(BenchmarkResult)]
+        with open(filename, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(fields)
+            writer.writerows([getattr(r, field) for field in fields] for r in self.results)
+
+        # Creation throughput per implementation, log-scaled like generate_plots
+        col = {field: i + 1 for i, field in enumerate(fields)}
+        with open(gnuplot_script, 'w') as f:
+            f.write(
+                "set datafile separator ','\n"
+                "set terminal pngcairo size 800,600\n"
+                "set output 'benchmark_results.png'\n"
+                "set logscale x\n"
+                "set xlabel 'Number of Objects'\n"
+                "set ylabel 'Million Objects/Second'\n"
+                "set title 'Object Creation Performance'\n"
+                "set key autotitle columnhead\n"
+                f"plot for [impl in 'Python C++'] '{filename}' "
+                f"using (strcol({col['operation']}) eq 'create' && "
+                f"strcol({col['implementation']}) eq impl ? ${col['num_objects']} : 1/0):"
+                f"(${col['objects_per_second']}/1e6) with linespoints title impl\n"
+            )
+
+        print(f"\nResults saved to {filename} (plot with: gnuplot {gnuplot_script})")
+
     def generate_plots(self):
         """Generate performance comparison plots."""
-        df = pd.DataFrame([r.__dict__ for r in self.results])
-        
+        import matplotlib.pyplot as plt
+
+        df = self.results_frame
+
         # Create figure with subplots
         fig, axes = plt.subplots(2, 2, figsize=(12, 10))
         fig.suptitle('Performance Comparison: Python vs C++', fontsize=16)
-        
+
         # 1. Creation performance
         creation_data = df[df['operation'] == 'create']
         if not creation_data.empty:
             ax = axes[0, 0]
             for impl in creation_data['implementation'].unique():
                 data = creation_data[creation_data['implementation'] == impl]
-                ax.plot(data['num_objects'], data['objects_per_second']/1e6, 
+                ax.plot(data['num_objects'], data['objects_per_second']/1e6,
                        marker='o', label=impl)
             ax.set_xlabel('Number of Objects')
             ax.set_ylabel('Million Objects/Second')
@@ -350,14 +489,13 @@ class BenchmarkRunner:
             ax.legend()
             ax.grid(True)
             ax.set_xscale('log')
-        
+
         # 2. Memory usage
         ax = axes[0, 1]
-        creation_data = df[df['operation'] == 'create']
         if not creation_data.empty:
             for impl in creation_data['implementation'].unique():
                 data = creation_data[creation_data['implementation'] == impl]
-                ax.plot(data['num_objects'], data['memory_bytes']/1024/1024, 
+                ax.plot(data['num_objects'], data['memory_bytes']/1024/1024,
                        marker='o', label=impl)
             ax.set_xlabel('Number of Objects')
             ax.set_ylabel('Memory (MB)')
@@ -365,14 +503,14 @@ class BenchmarkRunner:
             ax.legend()
             ax.grid(True)
             ax.set_xscale('log')
-        
+
         # 3. Serialization performance
         ax = axes[1, 0]
         save_data = df[df['operation'].str.contains('save')]
         if not save_data.empty:
             for op in save_data['operation'].unique():
                 data = save_data[save_data['operation'] == op]
-                ax.plot(data['num_objects'], data['time_ms'], 
+                ax.plot(data['num_objects'], data['time_ms'],
                        marker='o', label=op)
             ax.set_xlabel('Number of Objects')
             ax.set_ylabel('Time (ms)')
@@ -380,14 +518,14 @@ class BenchmarkRunner:
             ax.legend()
             ax.grid(True)
             ax.set_xscale('log')
-        
+
         # 4. Batch operations
         ax = axes[1, 1]
         batch_data = df[df['name'] == 'Batch Operations']
         if not batch_data.empty:
             for op in batch_data['operation'].unique():
                 data = batch_data[batch_data['operation'] == op]
-                ax.plot(data['num_objects'], data['objects_per_second']/1e6, 
+                ax.plot(data['num_objects'], data['objects_per_second']/1e6,
                        marker='o', label=op)
             ax.set_xlabel('Number of Objects')
             ax.set_ylabel('Million Objects/Second')
@@ -395,22 +533,22 @@ class BenchmarkRunner:
             ax.legend()
             ax.grid(True)
             ax.set_xscale('log')
-        
+
         plt.tight_layout()
         plt.savefig('benchmark_results.png', dpi=150)
         print("\nPlots saved to benchmark_results.png")
-    
+
     def generate_report(self):
         """Generate a markdown report."""
         report = ["# Drawing Library Performance Benchmark Report\n"]
         report.append(f"Generated on: {time.strftime('%Y-%m-%d %H:%M:%S')}\n")
-        
+
         # Summary statistics
         report.append("## Summary\n")
-        
+
         # Group results by operation
-        df = pd.DataFrame([r.__dict__ for r in self.results])
-        
+        df = self.results_frame
+
         # Memory efficiency
         creation_data = df[df['operation'] == 'create']
         if not creation_data.empty:
@@ -419,20 +557,22 @@ class BenchmarkRunner:
             if py_mem > 0 and cpp_mem > 0:
                 report.append(f"- **Memory Reduction**: {py_mem/cpp_mem:.1f}x "
                             f"(Python: {py_mem/1e6:.1f}MB vs C++: {cpp_mem/1e6:.1f}MB)\n")
-        
+
         # Performance improvements
         report.append("\n## Performance Metrics\n")
         report.append("| Operation | C++ Performance | Notes |\n")
         report.append("|-----------|-----------------|-------|\n")
-        
+
         # Find best performances
         metrics = {
             'create': 'Object Creation',
             'translate': 'Batch Translate',
             'save_binary': 'Binary Save',
-            'load_binary': 'Binary Load'
+            'load_binary': 'Binary Load',
+            'load_binary_cold': 'Binary Load (cold cache)',
+            'load_binary_mmap': 'Binary Load (mmap)'
         }
-        
+
         for op, name in metrics.items():
             op_data = df[df['operation'] == op]
             if not op_data.empty:
@@ -441,52 +581,62 @@ class BenchmarkRunner:
                     best = cpp_data.loc[cpp_data['objects_per_second'].idxmax()]
                     report.append(f"| {name} | {best['objects_per_second']/1e6:.1f}M objects/sec | "
                                 f"{best['num_objects']:,} objects |\n")
-        
+
         # Detailed results
         report.append("\n## Detailed Results\n")
-        
+
         for benchmark_name in df['name'].unique():
             report.append(f"\n### {benchmark_name}\n")
             benchmark_data = df[df['name'] == benchmark_name]
-            
+
             report.append("| Implementation | Operation | Objects | Time (ms) | Objects/sec | Memory (MB) |\n")
             report.append("|----------------|-----------|---------|-----------|-------------|-------------|\n")
-            
+
             for _, row in benchmark_data.iterrows():
                 report.append(f"| {row['implementation']} | {row['operation']} | "
                             f"{row['num_objects']:,} | {row['time_ms']:.2f} | "
                             f"{row['objects_per_second']/1e6:.2f}M | "
                             f"{row['memory_bytes']/1e6:.2f} |\n")
-        
+
         # Write report
         with open('benchmark_report.md', 'w') as f:
             f.write(''.join(report))
-        
+
         print("\nReport saved to benchmark_report.md")
 
 
 def main():
     """Run all benchmarks and generate reports."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--parallel", action="store_true",
+                        help="run the benchmarks in parallel processes on disjoint CPUs")
+    parser.add_argument("--format", choices=["png", "csv"], default="png",
+                        help="png: matplotlib plots and markdown report (needs pandas), "
+                             "csv: CSV and a gnuplot script only")
+    args = parser.parse_args()
+
     runner = BenchmarkRunner()
-    
+
     # Run with different sizes
     sizes = [100, 1000, 10000, 100000, 1000000]
-    runner.run_all(sizes)
-    
+    runner.run_all(sizes, parallel=args.parallel)
+
     # Save results
     runner.save_results()
-    
-    # Generate visualizations
-    try:
-        runner.generate_plots()
-    except ImportError:
-        print("Note: Install matplotlib and pandas for plots: pip install matplotlib pandas")
-    
-    # Generate report
-    runner.generate_report()
-    
+
+    if args.format == "csv":
+        runner.save_csv()
+    else:
+        # Generate visualizations and report
+        try:
+            runner.generate_plots()
+            runner.generate_report()
+        except ImportError:
+            print("Note: Install matplotlib and pandas for plots: pip install matplotlib pandas")
+            runner.save_csv()
+
     print("\nBenchmarking complete!")
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -44,6 +44,14 @@ public:
     static std::vector<CollisionPair> find_collisions(const ObjectStorage& storage,
                                                       const std::vector<ObjectID>& ids);
     
+    // Every pair of objects in storage whose bounding boxes come within
+    // expand of each other - one Hilbert R-tree query per object
+    static std::vector<CollisionPair> all_pair_collisions(const ObjectStorage& storage,
+                                                          float expand = 0.0f);
+    
+    // Number of pairs all_pair_collisions would return, without storing them
+    static size_t count_pair_collisions(const ObjectStorage& storage, float expand = 0.0f);
+    
     // Batch alignment operations
     static void align_objects_left(ObjectStorage& storage,
                                   const std::vector<ObjectID>& ids);
@@ -109,12 +117,12 @@ private:
 // SIMD-optimized batch operations (when available)
 namespace simd {
     
-    // Process 4 circles at once using SSE/AVX
+    // Operate on a contiguous run of circles
     void translate_circles_simd(CompactCircle* circles, size_t count, float dx, float dy);
-    void scale_circles_simd(CompactCircle* circles, size_t count, float scale, 
+    void scale_circles_simd(CompactCircle* circles, size_t count, float sx, float sy,
                            float center_x, float center_y);
     
-    // Process 4 rectangles at once
+    // Operate on a contiguous run of rectangles
     void translate_rectangles_simd(CompactRectangle* rects, size_t count, float dx, float dy);
     void scale_rectangles_simd(CompactRectangle* rects, size_t count, 
                               float sx, float sy, float center_x, float center_y);
@@ -37,6 +37,14 @@ public:
     void add_object(ObjectID id) {
         object_ids.push_back(id);
     }
+
+    void reserve(size_t count) {
+        ObjectStorage::reserve_more(object_ids, count);
+    }
+
+    void add_objects(const std::vector<ObjectID>& ids) {
+        object_ids.insert(object_ids.end(), ids.begin(), ids.end());
+    }
     
     void remove_object(ObjectID id) {
         object_ids.erase(
@@ -61,6 +69,24 @@ private:
     std::vector<std::unique_ptr<Layer>> layers;
     ObjectStorage storage;
     uint8_t next_layer_id;
+
+    // Shared tail of the bulk add_* methods: ids for records
+    // [first, first + count) of one type, registered on the layer
+    template<typename Records>
+    std::vector<ObjectID> register_batch(Records& records, ObjectType type,
+                                         uint32_t first, size_t count, uint8_t layer_id) {
+        std::vector<ObjectID> ids(count);
+        for (size_t i = 0; i < count; ++i) {
+            ids[i] = ObjectStorage::make_id(type, first + i);
+        }
+        if (auto* layer = get_layer(layer_id)) {
+            layer->add_objects(ids);
+            for (size_t i = 0; i < count; ++i) {
+                records[first + i].base.layer_id = layer_id;
+            }
+        }
+        return ids;
+    }
     
 public:
     Drawing(float width = 800, float height = 600) 
@@ -99,6 +125,15 @@ public:
         return layers; 
     }
     
+    // Room for count more objects of one type on a layer, so a long run of
+    // single adds never reallocates
+    void reserve(size_t count, ObjectType type = ObjectType::Circle, uint8_t layer_id = 0) {
+        storage.reserve(type, count);
+        if (auto* layer = get_layer(layer_id)) {
+            layer->reserve(count);
+        }
+    }
+
     // Object creation shortcuts (adds to current/first layer)
     ObjectID add_circle(float x, float y, float radius, uint8_t layer_id = 0) {
         auto id = storage.add_circle(x, y, radius);
@@ -110,7 +145,14 @@ public:
         }
         return id;
     }
-    
+
+    // Bulk circle creation - one call instead of one binding crossing per circle
+    std::vector<ObjectID> add_circles(const float* xs, const float* ys, const float* radii,
+                                      size_t count, uint8_t layer_id = 0) {
+        uint32_t first = storage.add_circles(xs, ys, radii, count);
+        return register_batch(storage.circles, ObjectType::Circle, first, count, layer_id);
+    }
+
     ObjectID add_rectangle(float x, float y, float w, float h, float corner_radius = 0, uint8_t layer_id = 0) {
         auto id = storage.add_rectangle(x, y, w, h, corner_radius);
         if (auto* layer = get_layer(layer_id)) {
@@ -122,6 +164,13 @@ public:
         return id;
     }
     
+    std::vector<ObjectID> add_rectangles(const float* xs, const float* ys, const float* widths,
+                                         const float* heights, size_t count, uint8_t layer_id = 0,
+                                         float corner_radius = 0) {
+        uint32_t first = storage.add_rectangles(xs, ys, widths, heights, count, corner_radius);
+        return register_batch(storage.rectangles, ObjectType::Rectangle, first, count, layer_id);
+    }
+    
     ObjectID add_line(float x1, float y1, float x2, float y2, LineStyle line_style = LineStyle::Solid, uint8_t layer_id = 0) {
         auto id = storage.add_line(x1, y1, x2, y2, line_style);
         if (auto* layer = get_layer(layer_id)) {
@@ -133,6 +182,13 @@ public:
         return id;
     }
     
+    std::vector<ObjectID> add_lines(const float* x1s, const float* y1s, const float* x2s,
+                                    const float* y2s, size_t count, uint8_t layer_id = 0,
+                                    LineStyle line_style = LineStyle::Solid) {
+        uint32_t first = storage.add_lines(x1s, y1s, x2s, y2s, count, line_style);
+        return register_batch(storage.lines, ObjectType::Line, first, count, layer_id);
+    }
+    
     ObjectID add_polygon(const std::vector<Point>& points, bool closed = true, uint8_t layer_id = 0) {
         auto id = storage.add_polygon(points, closed);
         if (auto* layer = get_layer(layer_id)) {
@@ -204,6 +260,17 @@ public:
         return id;
     }
     
+    std::vector<ObjectID> add_paths(const std::vector<std::string>& path_data, uint8_t layer_id = 0) {
+        uint32_t first = storage.add_paths(path_data);
+        return register_batch(storage.paths, ObjectType::Path, first, path_data.size(), layer_id);
+    }
+    
+    std::vector<ObjectID> add_paths(const PathCommand* commands, size_t command_count,
+                                    const float* params, size_t count, uint8_t layer_id = 0) {
+        uint32_t first = storage.add_paths(commands, command_count, params, count);
+        return register_batch(storage.paths, ObjectType::Path, first, count, layer_id);
+    }
+    
     ObjectID add_group(uint8_t layer_id = 0) {
         auto id = storage.add_group();
         if (auto* layer = get_layer(layer_id)) {
@@ -227,6 +294,12 @@ public:
         return id;
     }
     
+    std::vector<ObjectID> add_groups(const ObjectID* children, size_t count, size_t group_size,
+                                     uint8_t layer_id = 0) {
+        uint32_t first = storage.add_groups(children, count, group_size);
+        return register_batch(storage.groups, ObjectType::Group, first, count, layer_id);
+    }
+    
     void add_to_group(ObjectID group_id, ObjectID child_id) {
         storage.add_to_group(group_id, child_id);
     }
@@ -268,6 +341,11 @@ public:
         storage.set_object_metadata(id, key, value);
     }
     
+    void set_object_metadata(const std::vector<ObjectID>& ids,
+                             const std::vector<std::pair<std::string, std::string>>& items) {
+        storage.set_object_metadata(ids, items);
+    }
+    
     std::string get_object_metadata(ObjectID id, const std::string& key) const {
         return storage.get_object_metadata(id, key);
     }
@@ -5,7 +5,11 @@
 #include <vector>
 #include <algorithm>
 #include <string>
+#include <string_view>
+#include <functional>
 #include <cctype>
+#include <cstdlib>
+#include <stdexcept>
 
 namespace drawing {
 
@@ -145,7 +149,7 @@ struct CompactPolyline {
     }
 };
 
-// Compact Arc (44 bytes total)
+// Compact Arc (48 bytes total)
 struct CompactArc {
     CompactObject base;     // 28 bytes
     float x, y;             // 8 bytes - center position
@@ -234,6 +238,18 @@ enum class PathCommand : uint8_t {
     Close = 5        // Z
 };
 
+// Number of parameters each path command takes
+inline uint8_t path_param_count(PathCommand cmd) {
+    switch (cmd) {
+        case PathCommand::MoveTo:
+        case PathCommand::LineTo:  return 2;
+        case PathCommand::QuadTo:  return 4;
+        case PathCommand::CurveTo: return 6;
+        case PathCommand::ArcTo:   return 7;
+        default:                   return 0;
+    }
+}
+
 // Compact path command storage
 struct PathSegment {
     PathCommand cmd;
@@ -325,7 +341,7 @@ struct CompactPath {
     }
 };
 
-// Compact Group (40 bytes total) - container for nested objects
+// Compact Group (44 bytes total) - container for nested objects
 struct CompactGroup {
     CompactObject base;     // 28 bytes
     uint32_t child_offset;  // 4 bytes - offset into group children array
@@ -344,6 +360,74 @@ struct CompactGroup {
                               const class ObjectStorage& storage) const;
 };
 
+// Record sizes are part of the binary file format and set the memory traffic
+// of the batch kernels. Coordinates are float32 on purpose - keep it that way.
+static_assert(sizeof(CompactObject) == 28, "CompactObject layout changed");
+static_assert(sizeof(CompactCircle) == 40, "CompactCircle layout changed");
+static_assert(sizeof(CompactRectangle) == 48, "CompactRectangle layout changed");
+static_assert(sizeof(CompactLine) == 48, "CompactLine layout changed");
+static_assert(sizeof(CompactEllipse) == 48, "CompactEllipse layout changed");
+static_assert(sizeof(CompactArc) == 48, "CompactArc layout changed");
+static_assert(sizeof(CompactGroup) == 44, "CompactGroup layout changed");
+
+// Open-addressing hash index over a table of unique strings, so interning
+// a string doesn't scan the table. Slots hold table positions rather than
+// pointers, so a copied index stays valid for the copied table.
+class StringIndex {
+public:
+    static constexpr uint32_t NOT_FOUND = 0xFFFFFFFF;
+
+    // Position of s in table, or NOT_FOUND
+    uint32_t find(const std::vector<std::string>& table, std::string_view s) const {
+        if (indexed != table.size()) {
+            // Table changed behind the index's back, fall back to a scan
+            auto it = std::find(table.begin(), table.end(), s);
+            return it == table.end() ? NOT_FOUND : static_cast<uint32_t>(it - table.begin());
+        }
+        if (slots.empty()) return NOT_FOUND;
+        for (size_t i = slot_for(s);; i = (i + 1) & (slots.size() - 1)) {
+            if (slots[i] == NOT_FOUND || table[slots[i]] == s) return slots[i];
+        }
+    }
+
+    // Position of s in table, appending it first if it isn't there
+    uint32_t find_or_add(std::vector<std::string>& table, std::string_view s) {
+        if (indexed != table.size() || (table.size() + 1) * 2 > slots.size()) {
+            rebuild(table);
+        }
+        size_t i = slot_for(s);
+        for (; slots[i] != NOT_FOUND; i = (i + 1) & (slots.size() - 1)) {
+            if (table[slots[i]] == s) return slots[i];
+        }
+        slots[i] = static_cast<uint32_t>(table.size());
+        table.emplace_back(s);
+        indexed = table.size();
+        return slots[i];
+    }
+
+    size_t memory_usage() const { return sizeof(uint32_t) * slots.size(); }
+
+private:
+    std::vector<uint32_t> slots;  // power-of-two size, at most half full
+    size_t indexed = 0;           // table size the slots were built for
+
+    size_t slot_for(std::string_view s) const {
+        return std::hash<std::string_view>{}(s) & (slots.size() - 1);
+    }
+
+    void rebuild(const std::vector<std::string>& table) {
+        size_t size = 16;
+        while (size < (table.size() + 1) * 4) size *= 2;
+        slots.assign(size, NOT_FOUND);
+        for (uint32_t idx = 0; idx < table.size(); ++idx) {
+            size_t i = slot_for(table[idx]);
+            while (slots[i] != NOT_FOUND) i = (i + 1) & (size - 1);
+            slots[i] = idx;
+        }
+        indexed = table.size();
+    }
+};
+
 // Object storage using Structure-of-Arrays for better cache performance
 class ObjectStorage {
 public:
@@ -382,6 +466,32 @@ public:
 private:
     std::vector<Transform2D> transforms;
     
+    // Hash lookups into object_names, metadata_keys and metadata_values
+    StringIndex name_index;
+    StringIndex key_index;
+    StringIndex value_index;
+    
+    // Objects without the metadata flag have no entries before the current
+    // end, so only entries added from there on need checking for their keys
+    size_t metadata_scan_start(const CompactObject& obj) const {
+        return obj.flags.has_metadata() ? 0 : metadata_entries.size();
+    }
+    
+    void put_metadata_entry(CompactObject& obj, ObjectID id, uint32_t key_idx,
+                            uint32_t val_idx, size_t scan_start) {
+        // Update the value if the object already has this key
+        for (size_t i = scan_start; i < metadata_entries.size(); ++i) {
+            auto& entry = metadata_entries[i];
+            if (entry.object_id == id && entry.key_index == key_idx) {
+                entry.value_index = val_idx;
+                return;
+            }
+        }
+        
+        metadata_entries.emplace_back(key_idx, val_idx, id);
+        obj.flags.set_metadata(true);
+    }
+    
     // Spatial index (to be implemented)
     // std::unique_ptr<RTree> spatial_index;
     
@@ -397,22 +507,80 @@ public:
     static constexpr uint32_t get_index(ObjectID id) {
         return id & 0xFFFFFF;
     }
+
+    // Grow to fit count more elements, but never below doubling - an exact
+    // reserve on every bulk add would reallocate on every call
+    template<typename T>
+    static void reserve_more(std::vector<T>& vec, size_t count) {
+        size_t needed = vec.size() + count;
+        if (needed > vec.capacity()) {
+            vec.reserve(std::max(needed, 2 * vec.capacity()));
+        }
+    }
     
+    // Room for count more objects of one type, ahead of a run of adds
+    void reserve(ObjectType type, size_t count) {
+        switch (type) {
+            case ObjectType::Circle:    reserve_more(circles, count); break;
+            case ObjectType::Rectangle: reserve_more(rectangles, count); break;
+            case ObjectType::Line:      reserve_more(lines, count); break;
+            case ObjectType::Ellipse:   reserve_more(ellipses, count); break;
+            case ObjectType::Polygon:   reserve_more(polygons, count); break;
+            case ObjectType::Polyline:  reserve_more(polylines, count); break;
+            case ObjectType::Arc:       reserve_more(arcs, count); break;
+            case ObjectType::Text:      reserve_more(texts, count); break;
+            case ObjectType::Path:      reserve_more(paths, count); break;
+            case ObjectType::Group:     reserve_more(groups, count); break;
+            default: break;
+        }
+    }
+
     // Add objects
     ObjectID add_circle(float x, float y, float radius) {
         circles.emplace_back(x, y, radius);
         return make_id(ObjectType::Circle, circles.size() - 1);
     }
-    
+
+    // Bulk circle creation - returns the index of the first new circle,
+    // the remaining circles follow contiguously
+    uint32_t add_circles(const float* xs, const float* ys, const float* radii, size_t count) {
+        uint32_t first = circles.size();
+        reserve_more(circles, count);
+        for (size_t i = 0; i < count; ++i) {
+            circles.emplace_back(xs[i], ys[i], radii[i]);
+        }
+        return first;
+    }
+
     ObjectID add_rectangle(float x, float y, float width, float height, float corner_radius = 0) {
         rectangles.emplace_back(x, y, width, height, corner_radius);
         return make_id(ObjectType::Rectangle, rectangles.size() - 1);
     }
+
+    uint32_t add_rectangles(const float* xs, const float* ys, const float* widths,
+                            const float* heights, size_t count, float corner_radius = 0) {
+        uint32_t first = rectangles.size();
+        reserve_more(rectangles, count);
+        for (size_t i = 0; i < count; ++i) {
+            rectangles.emplace_back(xs[i], ys[i], widths[i], heights[i], corner_radius);
+        }
+        return first;
+    }
     
     ObjectID add_line(float x1, float y1, float x2, float y2, LineStyle style = LineStyle::Solid) {
         lines.emplace_back(x1, y1, x2, y2, style);
         return make_id(ObjectType::Line, lines.size() - 1);
     }
+
+    uint32_t add_lines(const float* x1s, const float* y1s, const float* x2s,
+                       const float* y2s, size_t count, LineStyle style = LineStyle::Solid) {
+        uint32_t first = lines.size();
+        reserve_more(lines, count);
+        for (size_t i = 0; i < count; ++i) {
+            lines.emplace_back(x1s[i], y1s[i], x2s[i], y2s[i], style);
+        }
+        return first;
+    }
     
     ObjectID add_ellipse(float x, float y, float rx, float ry, float rotation = 0) {
         ellipses.emplace_back(x, y, rx, ry, rotation);
@@ -460,6 +628,9 @@ public:
         return make_id(ObjectType::Text, texts.size() - 1);
     }
     
+    // Path segments and paths address path_parameters with 16-bit offsets
+    static constexpr size_t MAX_PATH_PARAMETERS = UINT16_MAX;
+    
     ObjectID add_path(const std::string& path_data) {
         // Parse SVG path string and create path
         uint32_t seg_offset = path_segments.size();
@@ -494,25 +665,14 @@ public:
                 i++;
             }
             
-            // Parse parameters based on command
-            std::vector<float> params;
-            int expected_params = 0;
-            switch (current_cmd) {
-                case PathCommand::MoveTo:
-                case PathCommand::LineTo:
-                    expected_params = 2; break;
-                case PathCommand::QuadTo:
-                    expected_params = 4; break;
-                case PathCommand::CurveTo:
-                    expected_params = 6; break;
-                case PathCommand::ArcTo:
-                    expected_params = 7; break;
-                default:
-                    break;
-            }
+            // Parse parameters based on command, at most 7 (ArcTo)
+            float params[7];
+            int param_count = 0;
+            int expected_params = path_param_count(current_cmd);
             
-            // Parse numbers
-            for (int p = 0; p < expected_params; ++p) {
+            // Parse numbers in place - strtof reads straight from the string,
+            // no substring copy per number
+            for (; param_count < expected_params; ++param_count) {
                 // Skip whitespace and commas
                 while (i < path_data.length() && 
                        (std::isspace(path_data[i]) || path_data[i] == ',')) i++;
@@ -520,16 +680,25 @@ public:
                 if (i >= path_data.length()) break;
                 
                 // Parse number
-                size_t end;
-                float value = std::stof(path_data.substr(i), &end);
-                params.push_back(value);
-                i += end;
+                const char* start = path_data.c_str() + i;
+                char* end;
+                float value = std::strtof(start, &end);
+                if (end == start) {
+                    throw std::invalid_argument("invalid number in path data");
+                }
+                params[param_count] = value;
+                i += end - start;
             }
             
-            if (params.size() == static_cast<size_t>(expected_params)) {
+            if (param_count == expected_params) {
+                if (path_parameters.size() + param_count > MAX_PATH_PARAMETERS) {
+                    path_segments.resize(seg_offset);
+                    path_parameters.resize(param_offset);
+                    throw std::length_error("path parameters exceed the 16-bit offset range");
+                }
                 uint16_t param_idx = path_parameters.size();
-                path_segments.emplace_back(current_cmd, params.size(), param_idx);
-                path_parameters.insert(path_parameters.end(), params.begin(), params.end());
+                path_segments.emplace_back(current_cmd, param_count, param_idx);
+                path_parameters.insert(path_parameters.end(), params, params + param_count);
             }
         }
         
@@ -540,6 +709,58 @@ public:
         return make_id(ObjectType::Path, paths.size() - 1);
     }
     
+    // Adds every path, or none of them if one fails to parse or fit.
+    // Returns the first path's index
+    uint32_t add_paths(const std::vector<std::string>& path_data) {
+        uint32_t first = paths.size();
+        size_t segment_count = path_segments.size();
+        size_t parameter_count = path_parameters.size();
+        reserve_more(paths, path_data.size());
+        try {
+            for (const auto& data : path_data) {
+                add_path(data);
+            }
+        } catch (...) {
+            paths.resize(first);
+            path_segments.resize(segment_count);
+            path_parameters.resize(parameter_count);
+            throw;
+        }
+        return first;
+    }
+    
+    // Adds count paths that share one command sequence, params holds one
+    // row of the commands' parameters per path. Returns the first path's index
+    uint32_t add_paths(const PathCommand* commands, size_t command_count,
+                       const float* params, size_t count) {
+        size_t row_size = 0;
+        for (size_t k = 0; k < command_count; ++k) {
+            row_size += path_param_count(commands[k]);
+        }
+        if (command_count > UINT16_MAX) {
+            throw std::length_error("path has more segments than a 16-bit count holds");
+        }
+        if (row_size != 0 && count > (MAX_PATH_PARAMETERS - path_parameters.size()) / row_size) {
+            throw std::length_error("path parameters exceed the 16-bit offset range");
+        }
+        uint32_t first = paths.size();
+        reserve_more(paths, count);
+        reserve_more(path_segments, count * command_count);
+        reserve_more(path_parameters, count * row_size);
+        for (size_t i = 0; i < count; ++i) {
+            uint32_t seg_offset = path_segments.size();
+            uint16_t param_offset = path_parameters.size();
+            for (size_t k = 0; k < command_count; ++k) {
+                uint8_t n = path_param_count(commands[k]);
+                path_segments.emplace_back(commands[k], n, path_parameters.size());
+                path_parameters.insert(path_parameters.end(), params, params + n);
+                params += n;
+            }
+            paths.emplace_back(seg_offset, command_count, param_offset, row_size);
+        }
+        return first;
+    }
+    
     ObjectID add_group() {
         uint32_t child_offset = group_children.size();
         groups.emplace_back(child_offset, 0);
@@ -557,6 +778,23 @@ public:
         return make_id(ObjectType::Group, groups.size() - 1);
     }
     
+    // Bulk group creation from a row-major count x group_size block of
+    // children - returns the index of the first new group
+    uint32_t add_groups(const ObjectID* children, size_t count, size_t group_size) {
+        if (group_size > UINT16_MAX) {
+            throw std::length_error("group has more children than a 16-bit count holds");
+        }
+        uint32_t first = groups.size();
+        reserve_more(groups, count);
+        reserve_more(group_children, count * group_size);
+        for (size_t i = 0; i < count; ++i) {
+            groups.emplace_back(group_children.size(), group_size);
+            group_children.insert(group_children.end(), children + i * group_size,
+                                  children + (i + 1) * group_size);
+        }
+        return first;
+    }
+    
     void add_to_group(ObjectID group_id, ObjectID child_id) {
         if (get_type(group_id) != ObjectType::Group) return;
         uint32_t idx = get_index(group_id);
@@ -636,14 +874,8 @@ public:
     }
     
     uint32_t add_object_name(const std::string& name) {
-        // Check if name already exists to avoid duplicates
-        for (size_t i = 0; i < object_names.size(); ++i) {
-            if (object_names[i] == name) {
-                return static_cast<uint32_t>(i);
-            }
-        }
-        object_names.push_back(name);
-        return object_names.size() - 1;
+        // Names are interned, objects sharing a name share one string
+        return name_index.find_or_add(object_names, name);
     }
     
     void set_object_name(ObjectID id, const std::string& name) {
@@ -664,55 +896,45 @@ public:
     
     // Metadata management
     uint32_t find_or_add_key(const std::string& key) {
-        for (size_t i = 0; i < metadata_keys.size(); ++i) {
-            if (metadata_keys[i] == key) {
-                return static_cast<uint32_t>(i);
-            }
-        }
-        metadata_keys.push_back(key);
-        return metadata_keys.size() - 1;
+        return key_index.find_or_add(metadata_keys, key);
     }
     
     uint32_t find_or_add_value(const std::string& value) {
-        for (size_t i = 0; i < metadata_values.size(); ++i) {
-            if (metadata_values[i] == value) {
-                return static_cast<uint32_t>(i);
-            }
-        }
-        metadata_values.push_back(value);
-        return metadata_values.size() - 1;
+        return value_index.find_or_add(metadata_values, value);
     }
     
     void set_object_metadata(ObjectID id, const std::string& key, const std::string& value) {
         CompactObject* obj = get_object_base(id);
         if (!obj) return;
         
-        uint32_t key_idx = find_or_add_key(key);
-        uint32_t val_idx = find_or_add_value(value);
+        put_metadata_entry(*obj, id, find_or_add_key(key), find_or_add_value(value),
+                           metadata_scan_start(*obj));
+    }
+    
+    // Several key/value pairs on each of ids, e.g. from a dict - every key and
+    // value is looked up once for the whole call rather than once per object
+    void set_object_metadata(const std::vector<ObjectID>& ids,
+                             const std::vector<std::pair<std::string, std::string>>& items) {
+        std::vector<std::pair<uint32_t, uint32_t>> indices;
+        indices.reserve(items.size());
+        for (const auto& [key, value] : items) {
+            indices.emplace_back(find_or_add_key(key), find_or_add_value(value));
+        }
+        reserve_more(metadata_entries, ids.size() * items.size());
         
-        // Check if metadata entry already exists for this object and key
-        for (auto& entry : metadata_entries) {
-            if (entry.object_id == id && entry.key_index == key_idx) {
-                entry.value_index = val_idx;  // Update existing value
-                return;
+        for (ObjectID id : ids) {
+            CompactObject* obj = get_object_base(id);
+            if (!obj) continue;
+            size_t scan_start = metadata_scan_start(*obj);
+            for (auto [key_idx, val_idx] : indices) {
+                put_metadata_entry(*obj, id, key_idx, val_idx, scan_start);
             }
         }
-        
-        // Add new metadata entry
-        metadata_entries.emplace_back(key_idx, val_idx, id);
-        obj->flags.set_metadata(true);
     }
     
     std::string get_object_metadata(ObjectID id, const std::string& key) const {
-        uint32_t key_idx = 0xFFFFFFFF;
-        for (size_t i = 0; i < metadata_keys.size(); ++i) {
-            if (metadata_keys[i] == key) {
-                key_idx = static_cast<uint32_t>(i);
-                break;
-            }
-        }
-        
-        if (key_idx == 0xFFFFFFFF) return "";
+        uint32_t key_idx = key_index.find(metadata_keys, key);
+        if (key_idx == StringIndex::NOT_FOUND) return "";
         
         for (const auto& entry : metadata_entries) {
             if (entry.object_id == id && entry.key_index == key_idx) {
@@ -1009,7 +1231,9 @@ public:
                sizeof(Transform2D) * transforms.size() +
                sizeof(CompactGradient) * gradients.size() +
                sizeof(GradientStop) * gradient_stops.size() +
-               sizeof(MetadataEntry) * metadata_entries.size();
+               sizeof(MetadataEntry) * metadata_entries.size() +
+               name_index.memory_usage() + key_index.memory_usage() +
+               value_index.memory_usage();
         
         // Add string storage
         size_t string_size = 0;
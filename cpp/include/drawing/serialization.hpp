@@ -3,8 +3,18 @@
 #include "drawing.hpp"
 #include <iostream>
 #include <fstream>
+#include <string>
 #include <vector>
 #include <cstring>
+#include <streambuf>
+
+#if defined(__unix__) || defined(__APPLE__)
+#include <fcntl.h>
+#include <sys/mman.h>
+#include <sys/stat.h>
+#include <unistd.h>
+#define DRAWING_HAS_MMAP 1
+#endif
 
 namespace drawing {
 
@@ -422,24 +432,158 @@ public:
     }
 };
 
+// Stream buffer size for binary file I/O - large enough that small chunks
+// (headers, layer records) are coalesced into few write/read syscalls
+constexpr size_t BINARY_IO_BUFFER_SIZE = 1 << 20;
+
+// Per-thread buffer reused by every save/load, so repeated calls don't
+// allocate and zero a fresh 1 MiB each time. Only one stream may use it at once.
+inline std::vector<char>& binary_io_buffer() {
+    thread_local std::vector<char> buffer(BINARY_IO_BUFFER_SIZE);
+    return buffer;
+}
+
 // Convenience functions
-inline bool save_binary(const Drawing& drawing, const std::string& filename) {
-    std::ofstream file(filename, std::ios::binary);
-    if (!file) return false;
+// Returns the number of bytes written, 0 on failure
+inline size_t save_binary(const Drawing& drawing, const std::string& filename) {
+    auto& buffer = binary_io_buffer();
+    std::ofstream file;
+    file.rdbuf()->pubsetbuf(buffer.data(), buffer.size());  // must precede open()
+    file.open(filename, std::ios::binary);
+    if (!file) return 0;
     
     BinarySerializer serializer(file);
     serializer.serialize(drawing);
-    return file.good();
+    file.flush();
+    return file.good() ? static_cast<size_t>(file.tellp()) : 0;
 }
 
 inline std::unique_ptr<Drawing> load_binary(const std::string& filename) {
-    std::ifstream file(filename, std::ios::binary);
+    auto& buffer = binary_io_buffer();
+    std::ifstream file;
+    file.rdbuf()->pubsetbuf(buffer.data(), buffer.size());  // must precede open()
+    file.open(filename, std::ios::binary);
     if (!file) return nullptr;
     
     BinaryDeserializer deserializer(file);
     return deserializer.deserialize();
 }
 
+// Read-only streambuf over a memory region, lets BinaryDeserializer parse
+// a mapped file in place - read_vector copies straight into the SoA arrays
+class MemoryStreamBuf : public std::streambuf {
+public:
+    MemoryStreamBuf(const char* data, size_t size) {
+        char* begin = const_cast<char*>(data);
+        setg(begin, begin, begin + size);
+    }
+
+protected:
+    pos_type seekoff(off_type off, std::ios_base::seekdir dir,
+                     std::ios_base::openmode = std::ios_base::in) override {
+        char* base = dir == std::ios_base::beg ? eback()
+                   : dir == std::ios_base::cur ? gptr() : egptr();
+        if (off < eback() - base || off > egptr() - base) {
+            return pos_type(off_type(-1));
+        }
+        setg(eback(), base + off, egptr());
+        return pos_type(gptr() - eback());
+    }
+
+    pos_type seekpos(pos_type pos, std::ios_base::openmode which = std::ios_base::in) override {
+        return seekoff(off_type(pos), std::ios_base::beg, which);
+    }
+};
+
+// Write-only streambuf that just counts bytes, for sizing an output buffer
+class CountingStreamBuf : public std::streambuf {
+public:
+    size_t count = 0;
+
+protected:
+    int_type overflow(int_type ch) override {
+        ++count;
+        return traits_type::not_eof(ch);
+    }
+
+    std::streamsize xsputn(const char*, std::streamsize n) override {
+        count += static_cast<size_t>(n);
+        return n;
+    }
+};
+
+// Write-only streambuf over a fixed memory region - overflow fails the stream
+class FixedStreamBuf : public std::streambuf {
+public:
+    FixedStreamBuf(char* data, size_t size) { setp(data, data + size); }
+};
+
+// Exact size of the binary encoding, without producing it
+inline size_t binary_size(const Drawing& drawing) {
+    CountingStreamBuf counter;
+    std::ostream stream(&counter);
+    BinarySerializer(stream).serialize(drawing);
+    return counter.count;
+}
+
+// Encode into a caller-provided buffer of binary_size(drawing) bytes
+inline bool save_binary_to(const Drawing& drawing, char* data, size_t size) {
+    FixedStreamBuf buf(data, size);
+    std::ostream stream(&buf);
+    BinarySerializer(stream).serialize(drawing);
+    return stream.good();
+}
+
+// In-memory round trip, without touching the filesystem
+inline std::string save_binary_bytes(const Drawing& drawing) {
+    std::string data(binary_size(drawing), '\0');
+    save_binary_to(drawing, data.data(), data.size());
+    return data;
+}
+
+inline std::unique_ptr<Drawing> load_binary_bytes(const char* data, size_t size) {
+    MemoryStreamBuf buf(data, size);
+    std::istream stream(&buf);
+    return BinaryDeserializer(stream).deserialize();
+}
+
+// Load via mmap + madvise: the kernel reads ahead sequentially and the file
+// is copied once, from the page cache into storage. Falls back to
+// load_binary where mmap isn't available.
+inline std::unique_ptr<Drawing> load_binary_mmap(const std::string& filename) {
+#ifdef DRAWING_HAS_MMAP
+    int fd = ::open(filename.c_str(), O_RDONLY);
+    if (fd < 0) return nullptr;
+
+    struct stat st;
+    if (::fstat(fd, &st) != 0 || st.st_size <= 0) {
+        ::close(fd);
+        return nullptr;
+    }
+    size_t size = static_cast<size_t>(st.st_size);
+    void* data = ::mmap(nullptr, size, PROT_READ, MAP_PRIVATE, fd, 0);
+    ::close(fd);  // the mapping keeps the file referenced
+    if (data == MAP_FAILED) return nullptr;
+
+    // Unmaps on every way out, including a throwing deserialize
+    struct Mapping {
+        void* data;
+        size_t size;
+        ~Mapping() { ::munmap(data, size); }
+    } mapping{data, size};
+
+    // Advice values aren't flags - apply them one at a time
+    ::madvise(mapping.data, size, MADV_SEQUENTIAL);
+    ::madvise(mapping.data, size, MADV_WILLNEED);
+
+    MemoryStreamBuf buf(static_cast<const char*>(mapping.data), size);
+    std::istream stream(&buf);
+    return BinaryDeserializer(stream).deserialize();
+#else
+    return load_binary(filename);
+#endif
+}
+
 // JSON serialization (for compatibility)
 void save_json(const Drawing& drawing, const std::string& filename);
 std::unique_ptr<Drawing> load_json(const std::string& filename);
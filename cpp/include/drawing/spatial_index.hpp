@@ -0,0 +1,97 @@
+#pragma once
+
+#include "objects.hpp"
+#include <vector>
+#include <utility>
+#include <algorithm>
+
+#ifdef __SSE__
+#include <xmmintrin.h>
+#endif
+
+namespace drawing {
+
+namespace simd {
+
+// Bit i set if boxes[i] intersects query, count <= 32. A BoundingBox is
+// exactly four floats, so each box is one SSE register: with the max lanes
+// negated, "intersects" is a single all-lanes <= against the query.
+inline uint32_t overlap_mask(const BoundingBox* boxes, size_t count, const BoundingBox& query) {
+    static_assert(sizeof(BoundingBox) == 4 * sizeof(float), "BoundingBox must be four packed floats");
+    uint32_t mask = 0;
+#ifdef __SSE__
+    const __m128 flip = _mm_setr_ps(0.0f, 0.0f, -0.0f, -0.0f);
+    const __m128 limit = _mm_setr_ps(query.max_x, query.max_y, -query.min_x, -query.min_y);
+    for (size_t i = 0; i < count; ++i) {
+        __m128 box = _mm_xor_ps(_mm_loadu_ps(&boxes[i].min_x), flip);
+        uint32_t hit = _mm_movemask_ps(_mm_cmple_ps(box, limit)) == 0xF;
+        mask |= hit << i;
+    }
+#else
+    for (size_t i = 0; i < count; ++i) {
+        mask |= uint32_t(query.intersects(boxes[i])) << i;
+    }
+#endif
+    return mask;
+}
+
+} // namespace simd
+
+// Static packed R-tree, bulk-loaded by sorting items along a Hilbert curve
+// and packing NODE_SIZE entries per node bottom-up. Nodes live in one flat
+// array (items first, root last) and address their children by offset, so
+// there are no per-node allocations or pointers to chase.
+class HilbertRTree {
+public:
+    static constexpr size_t NODE_SIZE = 16;
+
+    HilbertRTree() = default;
+    HilbertRTree(const std::vector<BoundingBox>& boxes, const std::vector<ObjectID>& ids);
+
+    // Index every object in storage
+    static HilbertRTree from_storage(const ObjectStorage& storage);
+
+    size_t size() const { return num_items; }
+    bool empty() const { return num_items == 0; }
+
+    // Indexed items, i < size(), in Hilbert order
+    const BoundingBox& item_box(size_t i) const { return boxes[i]; }
+    ObjectID item_id(size_t i) const { return entries[i]; }
+
+    // Calls visit(id) for every item whose box intersects query
+    template<typename Visitor>
+    void search(const BoundingBox& query, Visitor&& visit) const {
+        if (empty() || !query.intersects(boxes.back())) return;
+        // Entries on the stack are already known to intersect query
+        std::vector<std::pair<size_t, size_t>> stack;  // (position, level)
+        stack.emplace_back(boxes.size() - 1, level_bounds.size() - 1);
+        while (!stack.empty()) {
+            auto [pos, level] = stack.back();
+            stack.pop_back();
+            if (level == 0) {
+                visit(entries[pos]);
+                continue;
+            }
+            size_t first = entries[pos];
+            size_t end = std::min(first + NODE_SIZE, level_bounds[level - 1]);
+            uint32_t hits = simd::overlap_mask(&boxes[first], end - first, query);
+            for (size_t i = 0; hits; ++i, hits >>= 1) {
+                if (hits & 1) stack.emplace_back(first + i, level - 1);
+            }
+        }
+    }
+
+    std::vector<ObjectID> search(const BoundingBox& query) const {
+        std::vector<ObjectID> result;
+        search(query, [&result](ObjectID id) { result.push_back(id); });
+        return result;
+    }
+
+private:
+    std::vector<BoundingBox> boxes;     // items, then each level of nodes, root last
+    std::vector<uint32_t> entries;      // item: its ObjectID, node: position of first child
+    std::vector<size_t> level_bounds;   // end position of each level in boxes
+    size_t num_items = 0;
+};
+
+} // namespace drawing
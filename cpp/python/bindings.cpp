@@ -8,6 +8,128 @@
 namespace py = pybind11;
 using namespace drawing;
 
+// NumPy uint32 id arrays - a single memcpy instead of converting every
+// element of a Python list
+using IdArray = py::array_t<ObjectID, py::array::c_style>;
+
+static std::vector<ObjectID> ids_from_array(const IdArray& ids) {
+    if (ids.ndim() != 1) {
+        throw std::invalid_argument("ids must be a 1-D array");
+    }
+    return std::vector<ObjectID>(ids.data(), ids.data() + ids.size());
+}
+
+// Metadata key/value pairs in dict order
+static std::vector<std::pair<std::string, std::string>> metadata_items(const py::dict& items) {
+    std::vector<std::pair<std::string, std::string>> result;
+    result.reserve(items.size());
+    for (auto item : items) {
+        result.emplace_back(item.first.cast<std::string>(), item.second.cast<std::string>());
+    }
+    return result;
+}
+
+// Coordinate arrays for the bulk add_* methods, float64 input is cast once
+using FloatArray = py::array_t<float, py::array::c_style | py::array::forcecast>;
+
+static void check_same_length(std::initializer_list<const FloatArray*> arrays, const char* message) {
+    auto first = *arrays.begin();
+    for (auto* array : arrays) {
+        if (array->ndim() != 1 || array->size() != first->size()) {
+            throw std::invalid_argument(message);
+        }
+    }
+}
+
+// Vertex lists as (n, 2) arrays of x, y - one copy instead of a Point per vertex
+static std::vector<Point> points_from_array(const FloatArray& xy) {
+    if (xy.size() == 0) return {};
+    if (xy.ndim() != 2 || xy.shape(1) != 2) {
+        throw std::invalid_argument("points must be an (n, 2) array of x, y pairs");
+    }
+    static_assert(sizeof(Point) == 2 * sizeof(float), "Point must be two packed floats");
+    const auto* first = reinterpret_cast<const Point*>(xy.data());
+    return std::vector<Point>(first, first + xy.shape(0));
+}
+
+// Path command sequences for add_path_ops, one PathCommand code per entry
+using CommandArray = py::array_t<uint8_t, py::array::c_style | py::array::forcecast>;
+
+// Per-object colors for the bulk add_* methods, an (n, 4) RGBA array
+using RgbaArray = py::array_t<uint8_t, py::array::c_style | py::array::forcecast>;
+
+static void check_fill_colors(const std::optional<RgbaArray>& rgba, size_t count) {
+    if (rgba && (rgba->ndim() != 2 || rgba->shape(1) != 4 || size_t(rgba->shape(0)) != count)) {
+        throw std::invalid_argument("fill_colors must be an (n, 4) RGBA array with one row per object");
+    }
+}
+
+static void set_fill_colors(ObjectStorage& storage, const std::vector<ObjectID>& ids,
+                            const RgbaArray& rgba) {
+    static_assert(sizeof(Color) == 4, "Color must be four packed bytes");
+    const auto* colors = reinterpret_cast<const Color*>(rgba.data());
+    for (size_t i = 0; i < ids.size(); ++i) {
+        if (auto* base = storage.get_object_base(ids[i])) base->fill_color = colors[i];
+    }
+}
+
+// Hand a std::vector to NumPy without copying - the array owns the moved vector
+template <typename T>
+static py::array_t<T> as_array(std::vector<T>&& vec) {
+    auto* owned = new std::vector<T>(std::move(vec));
+    py::capsule owner(owned, [](void* p) { delete static_cast<std::vector<T>*>(p); });
+    return py::array_t<T>(owned->size(), owned->data(), owner);
+}
+
+// Writable views of the circle fields in place, strided over the CompactCircle
+// array. owner keeps the storage alive; adding circles reallocates the array,
+// so views must be re-fetched afterwards.
+static py::dict circle_columns(py::object owner) {
+    auto& circles = owner.cast<ObjectStorage&>().circles;
+    const auto n = static_cast<py::ssize_t>(circles.size());
+    py::dict columns;
+    if (circles.empty()) {
+        columns["x"] = py::array_t<float>(0);
+        columns["y"] = py::array_t<float>(0);
+        columns["radius"] = py::array_t<float>(0);
+        columns["fill_rgba"] = py::array_t<uint8_t>(std::vector<py::ssize_t>{0, 4});
+        return columns;
+    }
+    const py::ssize_t stride = sizeof(CompactCircle);
+    auto& first = circles.front();
+    columns["x"] = py::array_t<float>({n}, {stride}, &first.x, owner);
+    columns["y"] = py::array_t<float>({n}, {stride}, &first.y, owner);
+    columns["radius"] = py::array_t<float>({n}, {stride}, &first.radius, owner);
+    columns["fill_rgba"] = py::array_t<uint8_t>({n, py::ssize_t(4)}, {stride, py::ssize_t(1)},
+                                                &first.base.fill_color.r, owner);
+    return columns;
+}
+
+// Collision pairs as an (n, 2) array of object IDs
+static py::array pairs_array(const std::vector<BatchOperations::CollisionPair>& pairs) {
+    std::vector<ObjectID> flat;
+    flat.reserve(2 * pairs.size());
+    for (const auto& pair : pairs) {
+        flat.push_back(pair.id1);
+        flat.push_back(pair.id2);
+    }
+    return as_array(std::move(flat)).attr("reshape")(-1, 2);
+}
+
+// Run one query per row and pack the results CSR-style: the ids found by
+// query i are ids[offsets[i]:offsets[i + 1]]
+template <typename Query>
+static py::tuple csr_query(size_t count, Query&& query) {
+    std::vector<ObjectID> ids;
+    std::vector<int64_t> offsets(count + 1, 0);
+    for (size_t i = 0; i < count; ++i) {
+        auto found = query(i);
+        ids.insert(ids.end(), found.begin(), found.end());
+        offsets[i + 1] = ids.size();
+    }
+    return py::make_tuple(as_array(std::move(ids)), as_array(std::move(offsets)));
+}
+
 PYBIND11_MODULE(drawing_cpp, m) {
     m.doc() = "High-performance C++ drawing library with Python bindings";
     
@@ -93,6 +215,14 @@ PYBIND11_MODULE(drawing_cpp, m) {
         .value("Center", TextAlign::Center)
         .value("Right", TextAlign::Right);
     
+    py::enum_<PathCommand>(m, "PathCommand")
+        .value("MoveTo", PathCommand::MoveTo)
+        .value("LineTo", PathCommand::LineTo)
+        .value("CurveTo", PathCommand::CurveTo)
+        .value("QuadTo", PathCommand::QuadTo)
+        .value("ArcTo", PathCommand::ArcTo)
+        .value("Close", PathCommand::Close);
+    
     py::enum_<TextBaseline>(m, "TextBaseline")
         .value("Top", TextBaseline::Top)
         .value("Middle", TextBaseline::Middle)
@@ -130,6 +260,16 @@ PYBIND11_MODULE(drawing_cpp, m) {
     drawing_class
         .def(py::init<>())
         .def(py::init<float, float>(), py::arg("width")=800, py::arg("height")=600)
+        .def(py::init([](float width, float height, size_t reserve) {
+                 auto drawing = std::make_unique<Drawing>(width, height);
+                 drawing->reserve(reserve);
+                 return drawing;
+             }),
+             "Drawing with room for reserve circles on the default layer",
+             py::arg("width"), py::arg("height"), py::arg("reserve"))
+        .def("reserve", &Drawing::reserve,
+             "Make room for count more objects of one type on a layer",
+             py::arg("count"), py::arg("type")=ObjectType::Circle, py::arg("layer_id")=0)
         .def("get_width", &Drawing::get_width)
         .def("get_height", &Drawing::get_height)
         .def("get_background", &Drawing::get_background)
@@ -140,19 +280,77 @@ PYBIND11_MODULE(drawing_cpp, m) {
         .def("get_layer", &Drawing::get_layer, py::return_value_policy::reference_internal)
         .def("add_circle", &Drawing::add_circle, 
              py::arg("x"), py::arg("y"), py::arg("radius"), py::arg("layer_id")=0)
+        .def("add_circles", [](Drawing& d, FloatArray xs, FloatArray ys, FloatArray radii,
+                               uint8_t layer_id,
+                               std::optional<Color> fill_color,
+                               std::optional<RgbaArray> fill_colors) {
+                 check_same_length({&xs, &ys, &radii},
+                                   "xs, ys and radii must be 1-D arrays of equal length");
+                 check_fill_colors(fill_colors, xs.size());
+                 auto ids = d.add_circles(xs.data(), ys.data(), radii.data(), xs.size(), layer_id);
+                 if (fill_color) {
+                     d.get_storage().set_fill_color(ids, *fill_color);
+                 }
+                 if (fill_colors) {
+                     set_fill_colors(d.get_storage(), ids, *fill_colors);
+                 }
+                 return as_array(std::move(ids));
+             },
+             "Add many circles in one call, returns an array of object IDs",
+             py::arg("xs"), py::arg("ys"), py::arg("radii"), py::arg("layer_id")=0,
+             py::arg("fill_color")=py::none(), py::arg("fill_colors")=py::none())
         .def("add_rectangle", &Drawing::add_rectangle,
              py::arg("x"), py::arg("y"), py::arg("width"), py::arg("height"), 
              py::arg("corner_radius")=0, py::arg("layer_id")=0)
+        .def("add_rectangles", [](Drawing& d, FloatArray xs, FloatArray ys,
+                                  FloatArray widths, FloatArray heights, uint8_t layer_id,
+                                  std::optional<RgbaArray> fill_colors, float corner_radius) {
+                 check_same_length({&xs, &ys, &widths, &heights},
+                                   "xs, ys, widths and heights must be 1-D arrays of equal length");
+                 check_fill_colors(fill_colors, xs.size());
+                 auto ids = d.add_rectangles(xs.data(), ys.data(), widths.data(),
+                                             heights.data(), xs.size(), layer_id, corner_radius);
+                 if (fill_colors) {
+                     set_fill_colors(d.get_storage(), ids, *fill_colors);
+                 }
+                 return as_array(std::move(ids));
+             },
+             "Add many rectangles in one call, returns an array of object IDs",
+             py::arg("xs"), py::arg("ys"), py::arg("widths"), py::arg("heights"),
+             py::arg("layer_id")=0, py::arg("fill_colors")=py::none(),
+             py::arg("corner_radius")=0)
         .def("add_line", &Drawing::add_line,
              py::arg("x1"), py::arg("y1"), py::arg("x2"), py::arg("y2"), 
              py::arg("line_style")=LineStyle::Solid, py::arg("layer_id")=0)
+        .def("add_lines", [](Drawing& d, FloatArray x1s, FloatArray y1s,
+                             FloatArray x2s, FloatArray y2s, uint8_t layer_id,
+                             LineStyle line_style) {
+                 check_same_length({&x1s, &y1s, &x2s, &y2s},
+                                   "x1s, y1s, x2s and y2s must be 1-D arrays of equal length");
+                 return as_array(d.add_lines(x1s.data(), y1s.data(), x2s.data(),
+                                             y2s.data(), x1s.size(), layer_id, line_style));
+             },
+             "Add many lines in one call, returns an array of object IDs",
+             py::arg("x1s"), py::arg("y1s"), py::arg("x2s"), py::arg("y2s"),
+             py::arg("layer_id")=0, py::arg("line_style")=LineStyle::Solid)
         .def("add_polygon", &Drawing::add_polygon,
              py::arg("points"), py::arg("closed")=true, py::arg("layer_id")=0)
+        .def("add_polygon", [](Drawing& d, const FloatArray& xy, bool closed, uint8_t layer_id) {
+                 return d.add_polygon(points_from_array(xy), closed, layer_id);
+             },
+             "Add a polygon from an (n, 2) array or sequence of x, y pairs",
+             py::arg("points"), py::arg("closed")=true, py::arg("layer_id")=0)
         .def("add_ellipse", &Drawing::add_ellipse,
              py::arg("x"), py::arg("y"), py::arg("rx"), py::arg("ry"), 
              py::arg("rotation")=0, py::arg("layer_id")=0)
         .def("add_polyline", &Drawing::add_polyline,
              py::arg("points"), py::arg("line_style")=LineStyle::Solid, py::arg("layer_id")=0)
+        .def("add_polyline", [](Drawing& d, const FloatArray& xy, LineStyle line_style,
+                                uint8_t layer_id) {
+                 return d.add_polyline(points_from_array(xy), line_style, layer_id);
+             },
+             "Add a polyline from an (n, 2) array or sequence of x, y pairs",
+             py::arg("points"), py::arg("line_style")=LineStyle::Solid, py::arg("layer_id")=0)
         .def("add_arc", &Drawing::add_arc,
              py::arg("x"), py::arg("y"), py::arg("radius"), 
              py::arg("start_angle"), py::arg("end_angle"), py::arg("layer_id")=0)
@@ -161,12 +359,80 @@ PYBIND11_MODULE(drawing_cpp, m) {
              py::arg("font_size")=16.0f, py::arg("font_name")="Arial",
              py::arg("align")=TextAlign::Left, py::arg("baseline")=TextBaseline::Alphabetic,
              py::arg("layer_id")=0)
+        .def("add_texts", [](Drawing& d, FloatArray xs, FloatArray ys,
+                             const std::vector<std::string>& texts, float font_size,
+                             const std::string& font_name, TextAlign align,
+                             TextBaseline baseline, uint8_t layer_id) {
+                 check_same_length({&xs, &ys}, "xs and ys must be 1-D arrays of equal length");
+                 if (texts.size() != size_t(xs.size())) {
+                     throw std::invalid_argument("texts must have one string per position");
+                 }
+                 std::vector<ObjectID> ids;
+                 ids.reserve(texts.size());
+                 for (size_t i = 0; i < texts.size(); ++i) {
+                     ids.push_back(d.add_text(xs.data()[i], ys.data()[i], texts[i], font_size,
+                                              font_name, align, baseline, layer_id));
+                 }
+                 return as_array(std::move(ids));
+             },
+             "Add many texts sharing one font in one call, returns an array of object IDs",
+             py::arg("xs"), py::arg("ys"), py::arg("texts"),
+             py::arg("font_size")=16.0f, py::arg("font_name")="Arial",
+             py::arg("align")=TextAlign::Left, py::arg("baseline")=TextBaseline::Alphabetic,
+             py::arg("layer_id")=0)
         .def("add_path", &Drawing::add_path,
              py::arg("path_data"), py::arg("layer_id")=0)
+        .def("add_paths", [](Drawing& d, const std::vector<std::string>& path_data,
+                             uint8_t layer_id, std::optional<Color> fill_color) {
+                 auto ids = d.add_paths(path_data, layer_id);
+                 if (fill_color) {
+                     d.get_storage().set_fill_color(ids, *fill_color);
+                 }
+                 return as_array(std::move(ids));
+             },
+             "Add many SVG paths in one call, returns an array of object IDs",
+             py::arg("path_data"), py::arg("layer_id")=0, py::arg("fill_color")=py::none())
+        .def("add_path_ops", [](Drawing& d, const CommandArray& commands, const FloatArray& params,
+                                uint8_t layer_id, std::optional<Color> fill_color) {
+                 if (commands.ndim() != 1) {
+                     throw std::invalid_argument("commands must be a 1-D array of PathCommand codes");
+                 }
+                 const auto* codes = reinterpret_cast<const PathCommand*>(commands.data());
+                 size_t row_size = 0;
+                 for (py::ssize_t k = 0; k < commands.size(); ++k) {
+                     if (codes[k] > PathCommand::Close) {
+                         throw std::invalid_argument("unknown path command code");
+                     }
+                     row_size += path_param_count(codes[k]);
+                 }
+                 if (params.ndim() != 2 || static_cast<size_t>(params.shape(1)) != row_size) {
+                     throw std::invalid_argument(
+                         "params must be an (n, m) array, one row of the commands' parameters per path");
+                 }
+                 auto ids = d.add_paths(codes, commands.size(), params.data(), params.shape(0),
+                                        layer_id);
+                 if (fill_color) {
+                     d.get_storage().set_fill_color(ids, *fill_color);
+                 }
+                 return as_array(std::move(ids));
+             },
+             "Add one path per row of params, all following the same command sequence, "
+             "returns an array of object IDs",
+             py::arg("commands"), py::arg("params"), py::arg("layer_id")=0,
+             py::arg("fill_color")=py::none())
         .def("add_group", py::overload_cast<uint8_t>(&Drawing::add_group),
              py::arg("layer_id")=0)
         .def("add_group", py::overload_cast<const std::vector<ObjectID>&, uint8_t>(&Drawing::add_group),
              py::arg("children"), py::arg("layer_id")=0)
+        .def("add_groups", [](Drawing& d, const IdArray& children, uint8_t layer_id) {
+                 if (children.ndim() != 2) {
+                     throw std::invalid_argument("children must be an (n, k) array, one row per group");
+                 }
+                 return as_array(d.add_groups(children.data(), children.shape(0),
+                                              children.shape(1), layer_id));
+             },
+             "Add one group per row of children in one call, returns an array of object IDs",
+             py::arg("children"), py::arg("layer_id")=0)
         .def("add_to_group", &Drawing::add_to_group,
              py::arg("group_id"), py::arg("child_id"))
         .def("add_linear_gradient", &Drawing::add_linear_gradient,
@@ -183,7 +449,19 @@ PYBIND11_MODULE(drawing_cpp, m) {
              py::arg("object_id"), py::arg("name"))
         .def("get_object_name", &Drawing::get_object_name,
              py::arg("object_id"))
-        .def("set_object_metadata", &Drawing::set_object_metadata,
+        .def("set_object_metadata", [](Drawing& d, const IdArray& ids, const py::dict& items) {
+                 d.set_object_metadata(ids_from_array(ids), metadata_items(items));
+             },
+             "Set every key/value pair of a dict on each object in one call",
+             py::arg("object_ids"), py::arg("items"))
+        .def("set_object_metadata", [](Drawing& d, ObjectID id, const py::dict& items) {
+                 d.set_object_metadata(std::vector<ObjectID>{id}, metadata_items(items));
+             },
+             "Set every key/value pair of a dict on the object in one call",
+             py::arg("object_id"), py::arg("items"))
+        .def("set_object_metadata",
+             py::overload_cast<ObjectID, const std::string&, const std::string&>(
+                 &Drawing::set_object_metadata),
              py::arg("object_id"), py::arg("key"), py::arg("value"))
         .def("get_object_metadata", &Drawing::get_object_metadata,
              py::arg("object_id"), py::arg("key"))
@@ -191,6 +469,12 @@ PYBIND11_MODULE(drawing_cpp, m) {
              py::arg("object_id"))
         .def("get_bounding_box", &Drawing::get_bounding_box)
         .def("find_objects_in_rect", &Drawing::find_objects_in_rect)
+        .def("find_objects_in_rect", [](const Drawing& d, float min_x, float min_y,
+                                        float max_x, float max_y) {
+                 return d.find_objects_in_rect(BoundingBox(min_x, min_y, max_x, max_y));
+             },
+             "Rectangle query from plain coordinates, without a BoundingBox object",
+             py::arg("min_x"), py::arg("min_y"), py::arg("max_x"), py::arg("max_y"))
         .def("total_objects", &Drawing::total_objects)
         .def("memory_usage", &Drawing::memory_usage)
         .def("get_storage", py::overload_cast<>(&Drawing::get_storage), 
@@ -204,13 +488,69 @@ PYBIND11_MODULE(drawing_cpp, m) {
     // ObjectStorage access (for advanced usage)
     py::class_<ObjectStorage>(m, "ObjectStorage")
         .def("total_objects", &ObjectStorage::total_objects)
+        .def("reserve", &ObjectStorage::reserve, py::arg("type"), py::arg("count"))
         .def("memory_usage", &ObjectStorage::memory_usage)
+        .def("set_fill_color", [](ObjectStorage& storage, ObjectID id, Color color) {
+                 if (auto* base = storage.get_object_base(id)) base->fill_color = color;
+             },
+             "Set the fill color of a single object, without building an id list",
+             py::arg("id"), py::arg("color"))
+        // NumPy uint32 id arrays are registered before the list overloads so
+        // they are matched as one buffer rather than unboxed element by element
+        .def("set_fill_color", [](ObjectStorage& storage, const IdArray& ids, Color color) {
+                 storage.set_fill_color(ids_from_array(ids), color);
+             },
+             py::arg("ids"), py::arg("color"))
         .def("set_fill_color", &ObjectStorage::set_fill_color)
+        .def("set_stroke_color", [](ObjectStorage& storage, ObjectID id, Color color) {
+                 if (auto* base = storage.get_object_base(id)) base->stroke_color = color;
+             },
+             "Set the stroke color of a single object, without building an id list",
+             py::arg("id"), py::arg("color"))
+        .def("set_stroke_color", [](ObjectStorage& storage, const IdArray& ids, Color color) {
+                 storage.set_stroke_color(ids_from_array(ids), color);
+             },
+             py::arg("ids"), py::arg("color"))
         .def("set_stroke_color", &ObjectStorage::set_stroke_color)
+        .def("set_opacity", [](ObjectStorage& storage, const IdArray& ids, float opacity) {
+                 storage.set_opacity(ids_from_array(ids), opacity);
+             },
+             py::arg("ids"), py::arg("opacity"))
         .def("set_opacity", &ObjectStorage::set_opacity)
         .def("find_in_rect", &ObjectStorage::find_in_rect)
+        .def("find_in_rect", [](const ObjectStorage& storage, float min_x, float min_y,
+                                float max_x, float max_y) {
+                 return storage.find_in_rect(BoundingBox(min_x, min_y, max_x, max_y));
+             },
+             "Rectangle query from plain coordinates, without a BoundingBox object",
+             py::arg("min_x"), py::arg("min_y"), py::arg("max_x"), py::arg("max_y"))
         .def("find_at_point", &ObjectStorage::find_at_point, 
              py::arg("point"), py::arg("tolerance")=1.0f)
+        .def("find_at_points", [](const ObjectStorage& storage, FloatArray xs, FloatArray ys,
+                                  float tolerance) {
+                 check_same_length({&xs, &ys}, "xs and ys must be 1-D arrays of equal length");
+                 const float* x = xs.data();
+                 const float* y = ys.data();
+                 return csr_query(xs.size(), [&](size_t i) {
+                     return storage.find_at_point(Point(x[i], y[i]), tolerance);
+                 });
+             },
+             "Point queries in one call, returns (ids, offsets) in CSR layout",
+             py::arg("xs"), py::arg("ys"), py::arg("tolerance")=1.0f)
+        .def("circle_columns", &circle_columns,
+             "Zero-copy x, y, radius and (n, 4) fill_rgba arrays over the stored circles")
+        .def("find_in_rects", [](const ObjectStorage& storage, FloatArray rects) {
+                 if (rects.ndim() != 2 || rects.shape(1) != 4) {
+                     throw std::invalid_argument("rects must be an (n, 4) array of min_x, min_y, max_x, max_y");
+                 }
+                 const float* r = rects.data();
+                 return csr_query(rects.shape(0), [&](size_t i) {
+                     const float* row = r + 4 * i;
+                     return storage.find_in_rect(BoundingBox(row[0], row[1], row[2], row[3]));
+                 });
+             },
+             "Rectangle queries in one call, returns (ids, offsets) in CSR layout",
+             py::arg("rects"))
         .def("add_linear_gradient", &ObjectStorage::add_linear_gradient,
              py::arg("stops"), py::arg("angle")=0.0f)
         .def("add_radial_gradient", &ObjectStorage::add_radial_gradient,
@@ -225,7 +565,9 @@ PYBIND11_MODULE(drawing_cpp, m) {
              py::arg("object_id"), py::arg("name"))
         .def("get_object_name", &ObjectStorage::get_object_name,
              py::arg("object_id"))
-        .def("set_object_metadata", &ObjectStorage::set_object_metadata,
+        .def("set_object_metadata",
+             py::overload_cast<ObjectID, const std::string&, const std::string&>(
+                 &ObjectStorage::set_object_metadata),
              py::arg("object_id"), py::arg("key"), py::arg("value"))
         .def("get_object_metadata", &ObjectStorage::get_object_metadata,
              py::arg("object_id"), py::arg("key"))
@@ -233,10 +575,31 @@ PYBIND11_MODULE(drawing_cpp, m) {
              py::arg("object_id"));
     
     // Serialization functions
-    m.def("save_binary", &save_binary, "Save drawing to binary format",
+    m.def("save_binary", &save_binary, "Save drawing to binary format, returns bytes written (0 on failure)",
           py::arg("drawing"), py::arg("filename"));
+    // The loaders only build a new drawing, so they run without the GIL and
+    // several files can be loaded from a thread pool at once
     m.def("load_binary", &load_binary, "Load drawing from binary format",
-          py::arg("filename"));
+          py::arg("filename"), py::call_guard<py::gil_scoped_release>());
+    m.def("load_binary_mmap", &load_binary_mmap, "Load drawing from binary format via mmap",
+          py::arg("filename"), py::call_guard<py::gil_scoped_release>());
+    m.def("save_binary_bytes", [](const Drawing& drawing) {
+              // Size first, then encode straight into the bytes object
+              size_t size = binary_size(drawing);
+              py::bytes result(nullptr, size);
+              save_binary_to(drawing, PyBytes_AS_STRING(result.ptr()), size);
+              return result;
+          },
+          "Serialize drawing to binary format in memory", py::arg("drawing"));
+    m.def("load_binary_bytes", [](const py::bytes& data) {
+              char* buffer;
+              py::ssize_t size;
+              PyBytes_AsStringAndSize(data.ptr(), &buffer, &size);
+              // data holds the (immutable) buffer alive for the whole call
+              py::gil_scoped_release release;
+              return load_binary_bytes(buffer, static_cast<size_t>(size));
+          },
+          "Load drawing from in-memory binary data", py::arg("data"));
     m.def("save_json", &save_json, "Save drawing to JSON format",
           py::arg("drawing"), py::arg("filename"));
     
@@ -277,6 +640,50 @@ PYBIND11_MODULE(drawing_cpp, m) {
         .def_static("align_objects_left", &BatchOperations::align_objects_left,
                     "Align objects to leftmost edge",
                     py::arg("storage"), py::arg("ids"))
+        .def_static("find_collisions",
+                    [](const ObjectStorage& storage, const std::vector<ObjectID>& ids) {
+                        return pairs_array(BatchOperations::find_collisions(storage, ids));
+                    },
+                    "Pairs of the given objects whose bounding boxes overlap, as an (n, 2) array",
+                    py::arg("storage"), py::arg("ids"))
+        .def_static("all_pair_collisions",
+                    [](const ObjectStorage& storage, float expand) {
+                        return pairs_array(BatchOperations::all_pair_collisions(storage, expand));
+                    },
+                    "Pairs of objects whose bounding boxes come within expand of each other, "
+                    "as an (n, 2) array",
+                    py::arg("storage"), py::arg("expand")=0.0f)
+        .def_static("count_pair_collisions", &BatchOperations::count_pair_collisions,
+                    "Number of pairs all_pair_collisions would return, without building them",
+                    py::arg("storage"), py::arg("expand")=0.0f)
+        // NumPy id array overloads - list overloads above take precedence for lists
+        .def_static("translate_objects",
+                    [](ObjectStorage& storage, const IdArray& ids, float dx, float dy) {
+                        BatchOperations::translate_objects(storage, ids_from_array(ids), dx, dy);
+                    },
+                    py::arg("storage"), py::arg("ids"), py::arg("dx"), py::arg("dy"))
+        .def_static("scale_objects",
+                    [](ObjectStorage& storage, const IdArray& ids, float sx, float sy, const Point& center) {
+                        BatchOperations::scale_objects(storage, ids_from_array(ids), sx, sy, center);
+                    },
+                    py::arg("storage"), py::arg("ids"), py::arg("sx"), py::arg("sy"),
+                    py::arg("center")=Point(0, 0))
+        .def_static("rotate_objects",
+                    [](ObjectStorage& storage, const IdArray& ids, float angle_radians, const Point& center) {
+                        BatchOperations::rotate_objects(storage, ids_from_array(ids), angle_radians, center);
+                    },
+                    py::arg("storage"), py::arg("ids"), py::arg("angle_radians"),
+                    py::arg("center")=Point(0, 0))
+        .def_static("calculate_bounding_box",
+                    [](const ObjectStorage& storage, const IdArray& ids) {
+                        return BatchOperations::calculate_bounding_box(storage, ids_from_array(ids));
+                    },
+                    py::arg("storage"), py::arg("ids"))
+        .def_static("align_objects_left",
+                    [](ObjectStorage& storage, const IdArray& ids) {
+                        BatchOperations::align_objects_left(storage, ids_from_array(ids));
+                    },
+                    py::arg("storage"), py::arg("ids"))
         .def_static("create_grid", &BatchOperations::create_grid,
                     "Create a grid pattern of objects",
                     py::arg("storage"), py::arg("type"), py::arg("rows"), py::arg("cols"),
@@ -1,13 +1,118 @@
 #include "drawing/batch_operations.hpp"
+#include "drawing/spatial_index.hpp"
 #include <chrono>
 #include <cmath>
 #include <algorithm>
-#include <immintrin.h>  // For SIMD intrinsics
 
 namespace drawing {
 
 BatchOperations::PerformanceStats BatchOperations::last_operation_stats = {0, 0.0, 0.0};
 
+namespace {
+
+// True if indices are consecutive (first, first+1, ...) and all below size,
+// i.e. the objects form one contiguous run that SIMD kernels can sweep
+bool is_contiguous_run(const std::vector<size_t>& indices, size_t size) {
+    if (indices.empty() || indices.front() + indices.size() > size) return false;
+    for (size_t i = 1; i < indices.size(); ++i) {
+        if (indices[i] != indices[0] + i) return false;
+    }
+    return true;
+}
+
+// True if ids are all circles with consecutive indices inside storage - the
+// shape the batch benchmarks use - checked on the ids directly, no copies
+bool is_circle_run(const std::vector<ObjectID>& ids, const ObjectStorage& storage) {
+    if (ids.empty() || ObjectStorage::get_type(ids.front()) != ObjectType::Circle) return false;
+    if (ObjectStorage::get_index(ids.front()) + ids.size() > storage.circles.size()) return false;
+    for (size_t i = 1; i < ids.size(); ++i) {
+        if (ids[i] != ids[0] + i) return false;
+    }
+    return true;
+}
+
+// Generic translate for mixed or scattered ids
+void translate_mixed(ObjectStorage& storage, const std::vector<ObjectID>& ids,
+                     float dx, float dy) {
+    // Group objects by type for better cache performance
+    std::vector<size_t> circle_indices, rect_indices, line_indices;
+    circle_indices.reserve(ids.size());
+    
+    for (auto id : ids) {
+        switch (ObjectStorage::get_type(id)) {
+            case ObjectType::Circle:
+                circle_indices.push_back(ObjectStorage::get_index(id));
+                break;
+            case ObjectType::Rectangle:
+                rect_indices.push_back(ObjectStorage::get_index(id));
+                break;
+            case ObjectType::Line:
+                line_indices.push_back(ObjectStorage::get_index(id));
+                break;
+            default:
+                break;
+        }
+    }
+    
+    // Contiguous runs go through the SIMD kernels, scattered ids one by one
+    if (is_contiguous_run(circle_indices, storage.circles.size())) {
+        simd::translate_circles_simd(storage.circles.data() + circle_indices.front(),
+                                     circle_indices.size(), dx, dy);
+    } else {
+        for (size_t idx : circle_indices) {
+            if (idx < storage.circles.size()) {
+                storage.circles[idx].x += dx;
+                storage.circles[idx].y += dy;
+            }
+        }
+    }
+    
+    // Process rectangles
+    if (is_contiguous_run(rect_indices, storage.rectangles.size())) {
+        simd::translate_rectangles_simd(storage.rectangles.data() + rect_indices.front(),
+                                        rect_indices.size(), dx, dy);
+    } else {
+        for (size_t idx : rect_indices) {
+            if (idx < storage.rectangles.size()) {
+                storage.rectangles[idx].x += dx;
+                storage.rectangles[idx].y += dy;
+            }
+        }
+    }
+    
+    // Process lines
+    for (size_t idx : line_indices) {
+        if (idx < storage.lines.size()) {
+            storage.lines[idx].x1 += dx;
+            storage.lines[idx].y1 += dy;
+            storage.lines[idx].x2 += dx;
+            storage.lines[idx].y2 += dy;
+        }
+    }
+}
+
+// Query the tree once per indexed item and call emit once per overlapping pair
+template<typename Emit>
+void for_each_pair(const HilbertRTree& tree, float expand, Emit&& emit) {
+    for (size_t i = 0; i < tree.size(); ++i) {
+        const BoundingBox& box = tree.item_box(i);
+        ObjectID id = tree.item_id(i);
+        BoundingBox query(box.min_x - expand, box.min_y - expand,
+                          box.max_x + expand, box.max_y + expand);
+        tree.search(query, [&](ObjectID other) {
+            if (id < other) emit(id, other);
+        });
+    }
+}
+
+std::vector<BatchOperations::CollisionPair> collide_all(const HilbertRTree& tree, float expand) {
+    std::vector<BatchOperations::CollisionPair> pairs;
+    for_each_pair(tree, expand, [&pairs](ObjectID a, ObjectID b) { pairs.push_back({a, b}); });
+    return pairs;
+}
+
+} // namespace
+
 // Helper implementations
 Point BatchOperations::get_object_center(const ObjectStorage& storage, ObjectID id) {
     switch (ObjectStorage::get_type(id)) {
@@ -89,61 +194,12 @@ void BatchOperations::translate_objects(ObjectStorage& storage,
                                        float dx, float dy) {
     auto start = std::chrono::high_resolution_clock::now();
     
-    // Group objects by type for better cache performance
-    std::vector<size_t> circle_indices, rect_indices, line_indices;
-    
-    for (auto id : ids) {
-        switch (ObjectStorage::get_type(id)) {
-            case ObjectType::Circle:
-                circle_indices.push_back(ObjectStorage::get_index(id));
-                break;
-            case ObjectType::Rectangle:
-                rect_indices.push_back(ObjectStorage::get_index(id));
-                break;
-            case ObjectType::Line:
-                line_indices.push_back(ObjectStorage::get_index(id));
-                break;
-            default:
-                break;
-        }
-    }
-    
-    // Process circles with SIMD if available
-    #ifdef __SSE2__
-    if (!circle_indices.empty()) {
-        simd::translate_circles_simd(storage.circles.data(), circle_indices.size(), dx, dy);
-    }
-    #else
-    for (size_t idx : circle_indices) {
-        if (idx < storage.circles.size()) {
-            storage.circles[idx].x += dx;
-            storage.circles[idx].y += dy;
-        }
-    }
-    #endif
-    
-    // Process rectangles
-    #ifdef __SSE2__
-    if (!rect_indices.empty()) {
-        simd::translate_rectangles_simd(storage.rectangles.data(), rect_indices.size(), dx, dy);
-    }
-    #else
-    for (size_t idx : rect_indices) {
-        if (idx < storage.rectangles.size()) {
-            storage.rectangles[idx].x += dx;
-            storage.rectangles[idx].y += dy;
-        }
-    }
-    #endif
-    
-    // Process lines
-    for (size_t idx : line_indices) {
-        if (idx < storage.lines.size()) {
-            storage.lines[idx].x1 += dx;
-            storage.lines[idx].y1 += dy;
-            storage.lines[idx].x2 += dx;
-            storage.lines[idx].y2 += dy;
-        }
+    if (is_circle_run(ids, storage)) {
+        // Specialized shape: no per-id type dispatch or index grouping
+        simd::translate_circles_simd(storage.circles.data() + ObjectStorage::get_index(ids.front()),
+                                     ids.size(), dx, dy);
+    } else {
+        translate_mixed(storage, ids, dx, dy);
     }
     
     auto end = std::chrono::high_resolution_clock::now();
@@ -158,6 +214,13 @@ void BatchOperations::scale_objects(ObjectStorage& storage,
                                    const std::vector<ObjectID>& ids,
                                    float sx, float sy,
                                    const Point& center) {
+    // Fast path: one contiguous run of circles
+    if (is_circle_run(ids, storage)) {
+        simd::scale_circles_simd(storage.circles.data() + ObjectStorage::get_index(ids.front()),
+                                 ids.size(), sx, sy, center.x, center.y);
+        return;
+    }
+    
     for (auto id : ids) {
         Point obj_center = get_object_center(storage, id);
         
@@ -293,6 +356,29 @@ void BatchOperations::align_objects_left(ObjectStorage& storage,
     }
 }
 
+// Batch collision detection
+std::vector<BatchOperations::CollisionPair> BatchOperations::find_collisions(
+    const ObjectStorage& storage,
+    const std::vector<ObjectID>& ids) {
+    std::vector<BoundingBox> boxes;
+    boxes.reserve(ids.size());
+    for (auto id : ids) {
+        boxes.push_back(get_object_bbox(storage, id));
+    }
+    return collide_all(HilbertRTree(boxes, ids), 0.0f);
+}
+
+std::vector<BatchOperations::CollisionPair> BatchOperations::all_pair_collisions(
+    const ObjectStorage& storage, float expand) {
+    return collide_all(HilbertRTree::from_storage(storage), expand);
+}
+
+size_t BatchOperations::count_pair_collisions(const ObjectStorage& storage, float expand) {
+    size_t count = 0;
+    for_each_pair(HilbertRTree::from_storage(storage), expand, [&count](ObjectID, ObjectID) { ++count; });
+    return count;
+}
+
 // Pattern generation
 std::vector<ObjectID> BatchOperations::create_grid(
     ObjectStorage& storage,
@@ -336,77 +422,26 @@ std::vector<ObjectID> BatchOperations::create_grid(
     return result;
 }
 
-// SIMD implementations
+// Contiguous-run kernels
 namespace simd {
 
-#ifdef __SSE2__
+// Plain loops over the run, left for the compiler to vectorize (-O3). The
+// structs are AoS with a 40/48-byte stride, so packing x and y of several
+// objects into one register needs gathers and scalar stores; the loops are
+// bound by memory bandwidth rather than arithmetic either way.
 void translate_circles_simd(CompactCircle* circles, size_t count, float dx, float dy) {
-    __m128 delta_x = _mm_set1_ps(dx);
-    __m128 delta_y = _mm_set1_ps(dy);
-    
-    // Process 4 circles at a time
-    size_t simd_count = count & ~3;
-    for (size_t i = 0; i < simd_count; i += 4) {
-        // Load x coordinates
-        __m128 x = _mm_set_ps(circles[i+3].x, circles[i+2].x, circles[i+1].x, circles[i].x);
-        __m128 y = _mm_set_ps(circles[i+3].y, circles[i+2].y, circles[i+1].y, circles[i].y);
-        
-        // Add deltas
-        x = _mm_add_ps(x, delta_x);
-        y = _mm_add_ps(y, delta_y);
-        
-        // Store back
-        float x_arr[4], y_arr[4];
-        _mm_store_ps(x_arr, x);
-        _mm_store_ps(y_arr, y);
-        
-        for (int j = 0; j < 4; ++j) {
-            circles[i+j].x = x_arr[j];
-            circles[i+j].y = y_arr[j];
-        }
-    }
-    
-    // Handle remaining circles
-    for (size_t i = simd_count; i < count; ++i) {
+    for (size_t i = 0; i < count; ++i) {
         circles[i].x += dx;
         circles[i].y += dy;
     }
 }
 
-void translate_rectangles_simd(CompactRectangle* rects, size_t count, float dx, float dy) {
-    // Similar implementation for rectangles
-    __m128 delta_x = _mm_set1_ps(dx);
-    __m128 delta_y = _mm_set1_ps(dy);
-    
-    size_t simd_count = count & ~3;
-    for (size_t i = 0; i < simd_count; i += 4) {
-        __m128 x = _mm_set_ps(rects[i+3].x, rects[i+2].x, rects[i+1].x, rects[i].x);
-        __m128 y = _mm_set_ps(rects[i+3].y, rects[i+2].y, rects[i+1].y, rects[i].y);
-        
-        x = _mm_add_ps(x, delta_x);
-        y = _mm_add_ps(y, delta_y);
-        
-        float x_arr[4], y_arr[4];
-        _mm_store_ps(x_arr, x);
-        _mm_store_ps(y_arr, y);
-        
-        for (int j = 0; j < 4; ++j) {
-            rects[i+j].x = x_arr[j];
-            rects[i+j].y = y_arr[j];
-        }
-    }
-    
-    for (size_t i = simd_count; i < count; ++i) {
-        rects[i].x += dx;
-        rects[i].y += dy;
-    }
-}
-#else
-// Fallback implementations without SIMD
-void translate_circles_simd(CompactCircle* circles, size_t count, float dx, float dy) {
+void scale_circles_simd(CompactCircle* circles, size_t count, float sx, float sy,
+                        float center_x, float center_y) {
     for (size_t i = 0; i < count; ++i) {
-        circles[i].x += dx;
-        circles[i].y += dy;
+        circles[i].x = center_x + (circles[i].x - center_x) * sx;
+        circles[i].y = center_y + (circles[i].y - center_y) * sy;
+        circles[i].radius *= sx;
     }
 }
 
@@ -416,7 +451,6 @@ void translate_rectangles_simd(CompactRectangle* rects, size_t count, float dx,
         rects[i].y += dy;
     }
 }
-#endif
 
 } // namespace simd
 
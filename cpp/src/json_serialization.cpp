@@ -4,6 +4,9 @@
 #include <fstream>
 #include <chrono>
 #include <ctime>
+#include <cstdio>
+#include <cmath>
+#include <charconv>
 
 namespace drawing {
 
@@ -91,12 +94,22 @@ public:
         stream << "\"";
     }
     
+    // Same output as `stream << value` (%g, 6 significant digits) without
+    // going through the locale-aware ostream number formatting
     void write_number(float value) {
-        stream << value;
+        char buf[32];
+        if (value == static_cast<int>(value) && std::fabs(value) < 1e6f && !std::signbit(value)) {
+            write_number(static_cast<int>(value));
+            return;
+        }
+        int len = std::snprintf(buf, sizeof(buf), "%g", value);
+        stream.write(buf, len);
     }
     
     void write_number(int value) {
-        stream << value;
+        char buf[16];
+        auto result = std::to_chars(buf, buf + sizeof(buf), value);
+        stream.write(buf, result.ptr - buf);
     }
     
     void write_bool(bool value) {
@@ -126,15 +139,24 @@ public:
 
 // Generate UUID-like string for compatibility
 std::string generate_id_string(ObjectID id) {
-    std::stringstream ss;
-    ss << std::hex << std::setfill('0');
-    ss << std::setw(8) << id << "-0000-0000-0000-";
-    ss << std::setw(12) << id;
-    return ss.str();
+    // snprintf into a stack buffer - a stringstream per object dominated save time
+    char buf[40];
+    int len = std::snprintf(buf, sizeof(buf), "%08x-0000-0000-0000-%012x", id, id);
+    return std::string(buf, len);
+}
+
+// Current UTC time, formatted once per save and shared by all objects
+std::string current_timestamp() {
+    auto now = std::chrono::system_clock::now();
+    auto time_t = std::chrono::system_clock::to_time_t(now);
+    char buffer[32];
+    strftime(buffer, sizeof(buffer), "%Y-%m-%dT%H:%M:%S", gmtime(&time_t));
+    return std::string(buffer) + "Z";
 }
 
 // Write object base properties
-void write_object_base(JsonWriter& writer, const CompactObject& obj, ObjectID id) {
+void write_object_base(JsonWriter& writer, const CompactObject& obj, ObjectID id,
+                       const std::string& timestamp) {
     writer.write_key("id"); writer.write_string(generate_id_string(id));
     writer.write_key("type"); writer.write_string("object");
     
@@ -178,22 +200,20 @@ void write_object_base(JsonWriter& writer, const CompactObject& obj, ObjectID id
     writer.begin_object();
     writer.end_object();
     
-    // Timestamps (current time)
-    auto now = std::chrono::system_clock::now();
-    auto time_t = std::chrono::system_clock::to_time_t(now);
-    char buffer[32];
-    strftime(buffer, sizeof(buffer), "%Y-%m-%dT%H:%M:%S", gmtime(&time_t));
-    std::string timestamp = std::string(buffer) + "Z";
-    
+    // Timestamps (time of save)
     writer.write_key("created_at"); writer.write_string(timestamp);
     writer.write_key("updated_at"); writer.write_string(timestamp);
 }
 
 void save_json(const Drawing& drawing, const std::string& filename) {
-    std::ofstream file(filename);
+    auto& buffer = binary_io_buffer();
+    std::ofstream file;
+    file.rdbuf()->pubsetbuf(buffer.data(), buffer.size());  // must precede open()
+    file.open(filename);
     if (!file) return;
     
     JsonWriter writer(file);
+    const std::string timestamp = current_timestamp();
     
     writer.begin_object();
     
@@ -237,7 +257,7 @@ void save_json(const Drawing& drawing, const std::string& filename) {
                 case ObjectType::Circle: {
                     auto* circle = storage.get_circle(obj_id);
                     if (circle) {
-                        write_object_base(writer, circle->base, obj_id);
+                        write_object_base(writer, circle->base, obj_id, timestamp);
                         writer.write_key("center"); 
                         writer.write_point(Point(circle->x, circle->y));
                         writer.write_key("radius"); writer.write_number(circle->radius);
@@ -248,7 +268,7 @@ void save_json(const Drawing& drawing, const std::string& filename) {
                 case ObjectType::Rectangle: {
                     auto* rect = storage.get_rectangle(obj_id);
                     if (rect) {
-                        write_object_base(writer, rect->base, obj_id);
+                        write_object_base(writer, rect->base, obj_id, timestamp);
                         writer.write_key("x"); writer.write_number(rect->x);
                         writer.write_key("y"); writer.write_number(rect->y);
                         writer.write_key("width"); writer.write_number(rect->width);
@@ -260,7 +280,7 @@ void save_json(const Drawing& drawing, const std::string& filename) {
                 case ObjectType::Line: {
                     auto* line = storage.get_line(obj_id);
                     if (line) {
-                        write_object_base(writer, line->base, obj_id);
+                        write_object_base(writer, line->base, obj_id, timestamp);
                         writer.write_key("start"); 
                         writer.write_point(Point(line->x1, line->y1));
                         writer.write_key("end"); 
@@ -272,7 +292,7 @@ void save_json(const Drawing& drawing, const std::string& filename) {
                 case ObjectType::Ellipse: {
                     auto* ellipse = storage.get_ellipse(obj_id);
                     if (ellipse) {
-                        write_object_base(writer, ellipse->base, obj_id);
+                        write_object_base(writer, ellipse->base, obj_id, timestamp);
                         writer.write_key("center"); 
                         writer.write_point(Point(ellipse->x, ellipse->y));
                         writer.write_key("rx"); writer.write_number(ellipse->rx);
@@ -285,7 +305,7 @@ void save_json(const Drawing& drawing, const std::string& filename) {
                 case ObjectType::Polygon: {
                     auto* poly = storage.get_polygon(obj_id);
                     if (poly) {
-                        write_object_base(writer, poly->base, obj_id);
+                        write_object_base(writer, poly->base, obj_id, timestamp);
                         writer.write_key("points");
                         writer.begin_array();
                         
@@ -304,7 +324,7 @@ void save_json(const Drawing& drawing, const std::string& filename) {
                 case ObjectType::Polyline: {
                     auto* polyline = storage.get_polyline(obj_id);
                     if (polyline) {
-                        write_object_base(writer, polyline->base, obj_id);
+                        write_object_base(writer, polyline->base, obj_id, timestamp);
                         writer.write_key("points");
                         writer.begin_array();
                         
@@ -323,7 +343,7 @@ void save_json(const Drawing& drawing, const std::string& filename) {
                 case ObjectType::Arc: {
                     auto* arc = storage.get_arc(obj_id);
                     if (arc) {
-                        write_object_base(writer, arc->base, obj_id);
+                        write_object_base(writer, arc->base, obj_id, timestamp);
                         writer.write_key("center"); 
                         writer.write_point(Point(arc->x, arc->y));
                         writer.write_key("radius"); writer.write_number(arc->radius);
@@ -336,7 +356,7 @@ void save_json(const Drawing& drawing, const std::string& filename) {
                 case ObjectType::Text: {
                     auto* text = storage.get_text(obj_id);
                     if (text) {
-                        write_object_base(writer, text->base, obj_id);
+                        write_object_base(writer, text->base, obj_id, timestamp);
                         writer.write_key("position"); 
                         writer.write_point(Point(text->x, text->y));
                         writer.write_key("text"); writer.write_string(storage.get_text_string(*text));
@@ -366,7 +386,7 @@ void save_json(const Drawing& drawing, const std::string& filename) {
                 case ObjectType::Path: {
                     auto* path = storage.get_path(obj_id);
                     if (path) {
-                        write_object_base(writer, path->base, obj_id);
+                        write_object_base(writer, path->base, obj_id, timestamp);
                         
                         // Reconstruct SVG path string
                         writer.write_key("d");
@@ -423,7 +443,7 @@ void save_json(const Drawing& drawing, const std::string& filename) {
                 case ObjectType::Group: {
                     auto* group = storage.get_group(obj_id);
                     if (group) {
-                        write_object_base(writer, group->base, obj_id);
+                        write_object_base(writer, group->base, obj_id, timestamp);
                         
                         // Write group children
                         writer.write_key("children");
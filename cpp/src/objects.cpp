@@ -1,4 +1,5 @@
 #include "drawing/objects.hpp"
+#include "drawing/spatial_index.hpp"
 #include <algorithm>
 #include <cmath>
 
@@ -141,36 +142,50 @@ void ObjectStorage::set_opacity(const std::vector<ObjectID>& ids, float opacity)
     }
 }
 
+namespace {
+
+// Calls visit(i) for every record whose bounding box intersects query. Boxes
+// are tested 32 at a time with simd::overlap_mask, so the loop branches once
+// per hit rather than once per record.
+template <typename Records, typename Visitor>
+void for_each_overlapping(const Records& records, const BoundingBox& query, Visitor&& visit) {
+    BoundingBox boxes[32];
+    for (size_t first = 0; first < records.size(); first += 32) {
+        size_t count = std::min<size_t>(32, records.size() - first);
+        for (size_t i = 0; i < count; ++i) {
+            boxes[i] = records[first + i].get_bounding_box();
+        }
+        uint32_t hits = simd::overlap_mask(boxes, count, query);
+        for (size_t i = first; hits; ++i, hits >>= 1) {
+            if (hits & 1) visit(i);
+        }
+    }
+}
+
+template <typename Records>
+void collect_in_rect(const Records& records, ObjectType type, const BoundingBox& rect,
+                     std::vector<ObjectID>& result) {
+    for_each_overlapping(records, rect, [&](size_t i) {
+        result.push_back(ObjectStorage::make_id(type, i));
+    });
+}
+
+} // namespace
+
 std::vector<ObjectID> ObjectStorage::find_in_rect(const BoundingBox& rect) const {
     std::vector<ObjectID> result;
     
     // Check circles
-    for (size_t i = 0; i < circles.size(); ++i) {
-        if (rect.intersects(circles[i].get_bounding_box())) {
-            result.push_back(make_id(ObjectType::Circle, i));
-        }
-    }
+    collect_in_rect(circles, ObjectType::Circle, rect, result);
     
     // Check rectangles
-    for (size_t i = 0; i < rectangles.size(); ++i) {
-        if (rect.intersects(rectangles[i].get_bounding_box())) {
-            result.push_back(make_id(ObjectType::Rectangle, i));
-        }
-    }
+    collect_in_rect(rectangles, ObjectType::Rectangle, rect, result);
     
     // Check lines
-    for (size_t i = 0; i < lines.size(); ++i) {
-        if (rect.intersects(lines[i].get_bounding_box())) {
-            result.push_back(make_id(ObjectType::Line, i));
-        }
-    }
+    collect_in_rect(lines, ObjectType::Line, rect, result);
     
     // Check ellipses
-    for (size_t i = 0; i < ellipses.size(); ++i) {
-        if (rect.intersects(ellipses[i].get_bounding_box())) {
-            result.push_back(make_id(ObjectType::Ellipse, i));
-        }
-    }
+    collect_in_rect(ellipses, ObjectType::Ellipse, rect, result);
     
     // Check polygons
     for (size_t i = 0; i < polygons.size(); ++i) {
@@ -201,18 +216,10 @@ std::vector<ObjectID> ObjectStorage::find_in_rect(const BoundingBox& rect) const
     }
     
     // Check arcs
-    for (size_t i = 0; i < arcs.size(); ++i) {
-        if (rect.intersects(arcs[i].get_bounding_box())) {
-            result.push_back(make_id(ObjectType::Arc, i));
-        }
-    }
+    collect_in_rect(arcs, ObjectType::Arc, rect, result);
     
     // Check texts
-    for (size_t i = 0; i < texts.size(); ++i) {
-        if (rect.intersects(texts[i].get_bounding_box())) {
-            result.push_back(make_id(ObjectType::Text, i));
-        }
-    }
+    collect_in_rect(texts, ObjectType::Text, rect, result);
     
     // Check paths
     for (size_t i = 0; i < paths.size(); ++i) {
@@ -237,8 +244,13 @@ std::vector<ObjectID> ObjectStorage::find_at_point(const Point& point, float tol
     std::vector<ObjectID> result;
     float tol_sq = tolerance * tolerance;
     
+    // Anything within tolerance of the point has a bounding box overlapping
+    // this one, so cull by box first and run the exact test on the rest
+    const BoundingBox near(point.x - tolerance, point.y - tolerance,
+                           point.x + tolerance, point.y + tolerance);
+    
     // Check circles
-    for (size_t i = 0; i < circles.size(); ++i) {
+    for_each_overlapping(circles, near, [&](size_t i) {
         const auto& circle = circles[i];
         float dx = point.x - circle.x;
         float dy = point.y - circle.y;
@@ -250,33 +262,14 @@ std::vector<ObjectID> ObjectStorage::find_at_point(const Point& point, float tol
             dist_sq >= radius_inner * radius_inner) {
             result.push_back(make_id(ObjectType::Circle, i));
         }
-    }
+    });
     
-    // Check rectangles
-    for (size_t i = 0; i < rectangles.size(); ++i) {
-        const auto& rect = rectangles[i];
-        BoundingBox expanded(
-            rect.x - tolerance, rect.y - tolerance,
-            rect.x + rect.width + tolerance, rect.y + rect.height + tolerance
-        );
-        
-        if (expanded.contains(point)) {
-            // Check if point is near edge
-            bool near_edge = 
-                point.x <= rect.x + tolerance || 
-                point.x >= rect.x + rect.width - tolerance ||
-                point.y <= rect.y + tolerance || 
-                point.y >= rect.y + rect.height - tolerance;
-                
-            if (near_edge || (point.x >= rect.x && point.x <= rect.x + rect.width &&
-                              point.y >= rect.y && point.y <= rect.y + rect.height)) {
-                result.push_back(make_id(ObjectType::Rectangle, i));
-            }
-        }
-    }
+    // Check rectangles - a point in the box grown by tolerance is either
+    // near an edge or inside, so the box test is the whole test
+    collect_in_rect(rectangles, ObjectType::Rectangle, near, result);
     
     // Check lines
-    for (size_t i = 0; i < lines.size(); ++i) {
+    for_each_overlapping(lines, near, [&](size_t i) {
         const auto& line = lines[i];
         
         // Point-to-line distance calculation
@@ -297,10 +290,10 @@ std::vector<ObjectID> ObjectStorage::find_at_point(const Point& point, float tol
                 result.push_back(make_id(ObjectType::Line, i));
             }
         }
-    }
+    });
     
     // Check ellipses
-    for (size_t i = 0; i < ellipses.size(); ++i) {
+    for_each_overlapping(ellipses, near, [&](size_t i) {
         const auto& ellipse = ellipses[i];
         
         // Transform point to ellipse coordinate system (account for rotation)
@@ -325,7 +318,7 @@ std::vector<ObjectID> ObjectStorage::find_at_point(const Point& point, float tol
         if (outer_check <= 1.0f && (rx_inner == 0 || ry_inner == 0 || inner_check >= 1.0f)) {
             result.push_back(make_id(ObjectType::Ellipse, i));
         }
-    }
+    });
     
     // Check polylines (point near any segment)
     for (size_t i = 0; i < polylines.size(); ++i) {
@@ -0,0 +1,148 @@
+#include "drawing/spatial_index.hpp"
+#include <algorithm>
+#include <numeric>
+
+namespace drawing {
+
+namespace {
+
+// Position of (x, y) along a Hilbert curve over a 2^16 x 2^16 grid
+uint32_t hilbert_index(uint32_t x, uint32_t y) {
+    constexpr uint32_t n = 1u << 16;
+    uint32_t d = 0;
+    for (uint32_t s = n / 2; s > 0; s /= 2) {
+        uint32_t rx = (x & s) > 0;
+        uint32_t ry = (y & s) > 0;
+        d += s * s * ((3 * rx) ^ ry);
+        if (ry == 0) {
+            if (rx == 1) {
+                x = n - 1 - x;
+                y = n - 1 - y;
+            }
+            std::swap(x, y);
+        }
+    }
+    return d;
+}
+
+BoundingBox points_bbox(const Point* points, size_t count) {
+    BoundingBox bbox(points[0].x, points[0].y, points[0].x, points[0].y);
+    for (size_t i = 1; i < count; ++i) {
+        bbox.expand(points[i]);
+    }
+    return bbox;
+}
+
+} // namespace
+
+HilbertRTree::HilbertRTree(const std::vector<BoundingBox>& item_boxes,
+                           const std::vector<ObjectID>& ids)
+    : num_items(item_boxes.size()) {
+    if (num_items == 0) return;
+
+    // Hilbert codes of the item centers, scaled to the extent of all items
+    BoundingBox extent = item_boxes[0];
+    for (const auto& box : item_boxes) {
+        extent.min_x = std::min(extent.min_x, box.min_x);
+        extent.min_y = std::min(extent.min_y, box.min_y);
+        extent.max_x = std::max(extent.max_x, box.max_x);
+        extent.max_y = std::max(extent.max_y, box.max_y);
+    }
+    const float grid = float((1u << 16) - 1);
+    const float sx = extent.width() > 0 ? grid / extent.width() : 0.0f;
+    const float sy = extent.height() > 0 ? grid / extent.height() : 0.0f;
+
+    std::vector<uint32_t> codes(num_items);
+    for (size_t i = 0; i < num_items; ++i) {
+        Point c = item_boxes[i].center();
+        codes[i] = hilbert_index(uint32_t((c.x - extent.min_x) * sx),
+                                 uint32_t((c.y - extent.min_y) * sy));
+    }
+    std::vector<size_t> order(num_items);
+    std::iota(order.begin(), order.end(), 0);
+    std::sort(order.begin(), order.end(),
+              [&codes](size_t a, size_t b) { return codes[a] < codes[b]; });
+
+    // Level 0: the items in curve order
+    size_t total = num_items;
+    for (size_t level = num_items; level > 1; level = (level + NODE_SIZE - 1) / NODE_SIZE) {
+        total += (level + NODE_SIZE - 1) / NODE_SIZE;
+    }
+    boxes.reserve(total);
+    entries.reserve(total);
+    for (size_t i : order) {
+        boxes.push_back(item_boxes[i]);
+        entries.push_back(ids[i]);
+    }
+    level_bounds.push_back(num_items);
+
+    // Pack each level into parents until a single root is left
+    size_t level_start = 0;
+    while (boxes.size() - level_start > 1) {
+        size_t level_end = boxes.size();
+        for (size_t first = level_start; first < level_end; first += NODE_SIZE) {
+            size_t end = std::min(first + NODE_SIZE, level_end);
+            BoundingBox node = boxes[first];
+            for (size_t child = first + 1; child < end; ++child) {
+                node.min_x = std::min(node.min_x, boxes[child].min_x);
+                node.min_y = std::min(node.min_y, boxes[child].min_y);
+                node.max_x = std::max(node.max_x, boxes[child].max_x);
+                node.max_y = std::max(node.max_y, boxes[child].max_y);
+            }
+            boxes.push_back(node);
+            entries.push_back(static_cast<uint32_t>(first));
+        }
+        level_start = level_end;
+        level_bounds.push_back(boxes.size());
+    }
+}
+
+HilbertRTree HilbertRTree::from_storage(const ObjectStorage& storage) {
+    std::vector<BoundingBox> boxes;
+    std::vector<ObjectID> ids;
+    boxes.reserve(storage.total_objects());
+    ids.reserve(storage.total_objects());
+
+    auto add = [&](ObjectType type, size_t index, const BoundingBox& bbox) {
+        boxes.push_back(bbox);
+        ids.push_back(ObjectStorage::make_id(type, index));
+    };
+
+    for (size_t i = 0; i < storage.circles.size(); ++i) {
+        add(ObjectType::Circle, i, storage.circles[i].get_bounding_box());
+    }
+    for (size_t i = 0; i < storage.rectangles.size(); ++i) {
+        add(ObjectType::Rectangle, i, storage.rectangles[i].get_bounding_box());
+    }
+    for (size_t i = 0; i < storage.lines.size(); ++i) {
+        add(ObjectType::Line, i, storage.lines[i].get_bounding_box());
+    }
+    for (size_t i = 0; i < storage.ellipses.size(); ++i) {
+        add(ObjectType::Ellipse, i, storage.ellipses[i].get_bounding_box());
+    }
+    for (size_t i = 0; i < storage.polygons.size(); ++i) {
+        auto [points, count] = storage.get_polygon_points(storage.polygons[i]);
+        if (points && count > 0) add(ObjectType::Polygon, i, points_bbox(points, count));
+    }
+    for (size_t i = 0; i < storage.polylines.size(); ++i) {
+        auto [points, count] = storage.get_polyline_points(storage.polylines[i]);
+        if (points && count > 0) add(ObjectType::Polyline, i, points_bbox(points, count));
+    }
+    for (size_t i = 0; i < storage.arcs.size(); ++i) {
+        add(ObjectType::Arc, i, storage.arcs[i].get_bounding_box());
+    }
+    for (size_t i = 0; i < storage.texts.size(); ++i) {
+        add(ObjectType::Text, i, storage.texts[i].get_bounding_box());
+    }
+    for (size_t i = 0; i < storage.paths.size(); ++i) {
+        add(ObjectType::Path, i,
+            storage.paths[i].calculate_bbox(storage.path_segments, storage.path_parameters));
+    }
+    for (size_t i = 0; i < storage.groups.size(); ++i) {
+        add(ObjectType::Group, i, storage.groups[i].calculate_bbox(storage.group_children, storage));
+    }
+
+    return HilbertRTree(boxes, ids);
+}
+
+} // namespace drawing
@@ -1,6 +1,8 @@
 #include <gtest/gtest.h>
 #include "drawing/batch_operations.hpp"
+#include "drawing/spatial_index.hpp"
 #include <chrono>
+#include <set>
 
 using namespace drawing;
 
@@ -193,4 +195,46 @@ TEST_F(BatchOperationsTest, PerformanceVsIndividual) {
         EXPECT_FLOAT_EQ(c1->x, c2->x);
         EXPECT_FLOAT_EQ(c1->y, c2->y);
     }
-}
\ No newline at end of file
+}
+TEST_F(BatchOperationsTest, AllPairCollisionsMatchBruteForce) {
+    // Scattered overlapping circles, enough for a multi-level tree
+    for (int i = 0; i < 500; ++i) {
+        storage.add_circle((i * 37) % 1000, (i * 91) % 1000, 15);
+    }
+    const float expand = 5.0f;
+    
+    auto tree = HilbertRTree::from_storage(storage);
+    ASSERT_EQ(tree.size(), storage.total_objects());
+    
+    std::set<std::pair<ObjectID, ObjectID>> expected;
+    for (size_t i = 0; i < tree.size(); ++i) {
+        for (size_t j = 0; j < tree.size(); ++j) {
+            const auto& a = tree.item_box(i);
+            BoundingBox grown(a.min_x - expand, a.min_y - expand, a.max_x + expand, a.max_y + expand);
+            if (tree.item_id(i) < tree.item_id(j) && grown.intersects(tree.item_box(j))) {
+                expected.insert({tree.item_id(i), tree.item_id(j)});
+            }
+        }
+    }
+    
+    auto pairs = BatchOperations::all_pair_collisions(storage, expand);
+    std::set<std::pair<ObjectID, ObjectID>> found;
+    for (const auto& pair : pairs) {
+        found.insert({pair.id1, pair.id2});
+    }
+    EXPECT_EQ(found.size(), pairs.size());  // no duplicates
+    EXPECT_EQ(found, expected);
+    EXPECT_FALSE(expected.empty());
+    EXPECT_EQ(BatchOperations::count_pair_collisions(storage, expand), pairs.size());
+}
+
+TEST_F(BatchOperationsTest, RTreeSearchMatchesFindInRect) {
+    auto tree = HilbertRTree::from_storage(storage);
+    BoundingBox query(40, 40, 260, 300);
+    
+    auto found = tree.search(query);
+    auto expected = storage.find_in_rect(query);
+    std::sort(found.begin(), found.end());
+    std::sort(expected.begin(), expected.end());
+    EXPECT_EQ(found, expected);
+}
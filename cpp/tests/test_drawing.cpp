@@ -105,4 +105,71 @@ TEST(DrawingTest, MemoryUsage) {
     // Average memory per object
     size_t avg_mem = mem / drawing.total_objects();
     EXPECT_LT(avg_mem, 100); // Should be well under 100 bytes per object
-}
\ No newline at end of file
+}
+TEST(DrawingTest, ReserveKeepsCirclesInPlace) {
+    Drawing drawing;
+    drawing.reserve(1000);
+    
+    drawing.add_circle(0, 0, 5);
+    const CompactCircle* first = &drawing.get_storage().circles.front();
+    for (int i = 1; i < 1000; ++i) {
+        drawing.add_circle(i, i, 5);
+    }
+    
+    // No reallocation while filling the reserved capacity
+    EXPECT_EQ(&drawing.get_storage().circles.front(), first);
+    EXPECT_EQ(drawing.get_layer(0)->object_count(), 1000);
+}
+
+TEST(DrawingTest, BulkAddsApplySharedStyle) {
+    Drawing drawing;
+    const float xs[] = {0, 10};
+    const float sizes[] = {5, 5};
+    
+    auto rects = drawing.add_rectangles(xs, xs, sizes, sizes, 2, 0, 3.0f);
+    auto lines = drawing.add_lines(xs, xs, sizes, sizes, 2, 0, LineStyle::Dashed);
+    auto paths = drawing.add_paths({"M 0 0 L 5 5", "M 1 1 L 2 2 Z"});
+    
+    auto& storage = drawing.get_storage();
+    EXPECT_FLOAT_EQ(storage.get_rectangle(rects[1])->corner_radius, 3.0f);
+    EXPECT_EQ(storage.get_line(lines[1])->line_style, LineStyle::Dashed);
+    ASSERT_EQ(paths.size(), 2);
+    EXPECT_NE(storage.get_path(paths[1]), nullptr);
+    EXPECT_EQ(drawing.get_layer(0)->object_count(), 6);
+    
+    const ObjectID children[] = {rects[0], lines[0], rects[1], lines[1]};
+    auto groups = drawing.add_groups(children, 2, 2);
+    ASSERT_EQ(groups.size(), 2);
+    const auto* group = storage.get_group(groups[1]);
+    ASSERT_NE(group, nullptr);
+    EXPECT_EQ(group->child_count, 2);
+    EXPECT_EQ(storage.group_children[group->child_offset], rects[1]);
+    EXPECT_EQ(drawing.get_layer(0)->object_count(), 8);
+}
+
+TEST(DrawingTest, BulkPathsRejectParameterOverflow) {
+    Drawing drawing;
+    // Four parameters per path, 80000 in all
+    std::vector<std::string> too_many(20000, "M 0 0 L 1 1");
+    EXPECT_THROW(drawing.add_paths(too_many), std::length_error);
+    EXPECT_EQ(drawing.get_storage().paths.size(), 0);
+    EXPECT_TRUE(drawing.get_storage().path_parameters.empty());
+    EXPECT_EQ(drawing.get_layer(0)->object_count(), 0);
+
+    std::vector<std::string> fits(16383, "M 0 0 L 1 1");
+    EXPECT_EQ(drawing.add_paths(fits).size(), 16383);
+    EXPECT_THROW(drawing.add_path("M 0 0 L 1 1"), std::length_error);
+    EXPECT_EQ(drawing.get_storage().paths.size(), 16383);
+    EXPECT_EQ(drawing.get_storage().path_parameters.size(), 16383 * 4);
+}
+
+TEST(DrawingTest, BulkGroupsRejectChildCountOverflow) {
+    Drawing drawing;
+    std::vector<ObjectID> children(UINT16_MAX + 1, drawing.add_circle(0, 0, 1));
+    EXPECT_THROW(drawing.add_groups(children.data(), 1, children.size()), std::length_error);
+    EXPECT_TRUE(drawing.get_storage().groups.empty());
+    EXPECT_EQ(drawing.get_layer(0)->object_count(), 1);
+    
+    auto groups = drawing.add_groups(children.data(), 1, UINT16_MAX);
+    EXPECT_EQ(drawing.get_storage().get_group(groups[0])->child_count, UINT16_MAX);
+}
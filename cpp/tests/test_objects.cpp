@@ -170,4 +170,102 @@ TEST(ObjectsTest, PolygonStorage) {
     size_t mem = storage.memory_usage();
     EXPECT_GT(mem, 0);
     EXPECT_LT(mem, 1000); // Should be well under 1KB for this simple case
-}
\ No newline at end of file
+}
+TEST(ObjectsTest, PathParsing) {
+    ObjectStorage storage;
+    
+    auto path_id = storage.add_path("M 10,20 L30 40.5 C 1 2 3 4 5 6 Z");
+    const auto* path = storage.get_path(path_id);
+    ASSERT_NE(path, nullptr);
+    EXPECT_EQ(path->segment_count, 4);
+    EXPECT_EQ(path->param_count, 10);
+    EXPECT_FLOAT_EQ(storage.path_parameters[path->param_offset + 3], 40.5f);
+    
+    EXPECT_THROW(storage.add_path("M 10 x"), std::invalid_argument);
+}
+
+TEST(ObjectsTest, PathOps) {
+    ObjectStorage storage;
+    const PathCommand commands[] = {PathCommand::MoveTo, PathCommand::LineTo, PathCommand::Close};
+    const float params[] = {0, 0, 5, 5,
+                            10, 10, 15, 15};
+    uint32_t first = storage.add_paths(commands, 3, params, 2);
+    ASSERT_EQ(storage.paths.size(), 2);
+    
+    auto parsed_id = storage.add_path("M 10 10 L 15 15 Z");
+    const auto& built = storage.paths[first + 1];
+    const auto* parsed = storage.get_path(parsed_id);
+    EXPECT_EQ(built.segment_count, parsed->segment_count);
+    EXPECT_EQ(built.param_count, parsed->param_count);
+    for (uint16_t k = 0; k < built.param_count; ++k) {
+        EXPECT_FLOAT_EQ(storage.path_parameters[built.param_offset + k],
+                        storage.path_parameters[parsed->param_offset + k]);
+    }
+}
+
+TEST(ObjectsTest, PathOpsRejectParameterOverflow) {
+    ObjectStorage storage;
+    const PathCommand commands[] = {PathCommand::MoveTo, PathCommand::LineTo, PathCommand::LineTo};
+    // Six parameters per path, 120000 in all
+    std::vector<float> params(20000 * 6, 1.0f);
+    EXPECT_THROW(storage.add_paths(commands, 3, params.data(), 20000), std::length_error);
+    EXPECT_TRUE(storage.paths.empty());
+    EXPECT_TRUE(storage.path_parameters.empty());
+    
+    storage.add_paths(commands, 3, params.data(), 10922);
+    EXPECT_EQ(storage.path_parameters.size(), 10922 * 6);
+    EXPECT_THROW(storage.add_paths(commands, 3, params.data(), 1), std::length_error);
+    EXPECT_EQ(storage.paths.size(), 10922);
+}
+
+TEST(ObjectsTest, MetadataItems) {
+    ObjectStorage storage;
+    auto a = storage.add_circle(0, 0, 1);
+    auto b = storage.add_circle(5, 5, 1);
+    
+    storage.set_object_metadata(a, "type", "logo");
+    storage.set_object_metadata({a, b}, {{"type", "button"}, {"state", "normal"}});
+    
+    EXPECT_EQ(storage.get_object_metadata(a, "type"), "button");
+    EXPECT_EQ(storage.get_object_metadata(b, "state"), "normal");
+    EXPECT_EQ(storage.get_all_object_metadata(a).size(), 2);
+    EXPECT_EQ(storage.metadata_entries.size(), 4);
+}
+
+TEST(ObjectsTest, InternedNames) {
+    ObjectStorage storage;
+    std::vector<ObjectID> ids;
+    for (int i = 0; i < 100; ++i) {
+        ids.push_back(storage.add_circle(i, i, 1));
+        storage.set_object_name(ids.back(), "circle_" + std::to_string(i % 40));
+    }
+    EXPECT_EQ(storage.object_names.size(), 40);
+    EXPECT_EQ(storage.get_object_name(ids[95]), "circle_15");
+    
+    // A copy's index refers to the copy's own table
+    ObjectStorage copy = storage;
+    copy.set_object_name(ids[0], "circle_39");
+    copy.set_object_metadata(ids[0], "role", "logo");
+    EXPECT_EQ(copy.object_names.size(), 40);
+    EXPECT_EQ(copy.get_object_name(ids[0]), "circle_39");
+    EXPECT_EQ(copy.get_object_metadata(ids[0], "role"), "logo");
+    EXPECT_EQ(copy.get_object_metadata(ids[0], "missing"), "");
+}
+
+TEST(ObjectsTest, QueriesAcrossChunks) {
+    ObjectStorage storage;
+    for (int i = 0; i < 100; ++i) {
+        storage.add_circle(i * 10.0f, 0, 2);
+    }
+    
+    // Hits straddle the 32-record blocks the boxes are culled in
+    auto found = storage.find_in_rect(BoundingBox(300, -1, 400, 1));
+    ASSERT_EQ(found.size(), 11);
+    for (size_t i = 0; i < found.size(); ++i) {
+        EXPECT_EQ(ObjectStorage::get_index(found[i]), 30 + i);
+    }
+    
+    found = storage.find_at_point(Point(640, 2), 0.5f);
+    ASSERT_EQ(found.size(), 1);
+    EXPECT_EQ(ObjectStorage::get_index(found[0]), 64);
+}
@@ -80,6 +80,49 @@ TEST_F(SerializationTest, BinaryRoundTrip) {
     EXPECT_FLOAT_EQ(circle.base.opacity, 0.8f);
 }
 
+TEST_F(SerializationTest, BinaryBytesRoundTrip) {
+    std::stringstream ss;
+    BinarySerializer(ss).serialize(*test_drawing);
+    
+    std::string data = save_binary_bytes(*test_drawing);
+    EXPECT_EQ(data.size(), binary_size(*test_drawing));
+    EXPECT_EQ(data, ss.str());
+    
+    auto loaded = load_binary_bytes(data.data(), data.size());
+    ASSERT_NE(loaded, nullptr);
+    EXPECT_EQ(loaded->total_objects(), 3);
+    EXPECT_EQ(loaded->get_storage().circles[0].base.fill_color.r, 255);
+    
+    // A buffer that is too small fails instead of overrunning
+    EXPECT_FALSE(save_binary_to(*test_drawing, data.data(), data.size() - 1));
+}
+
+#ifdef __linux__
+TEST_F(SerializationTest, BinaryMmapLoadUnmaps) {
+    auto mapped_count = [] {
+        std::ifstream maps("/proc/self/maps");
+        std::string line;
+        int count = 0;
+        while (std::getline(maps, line)) {
+            count += line.find("test_drawing.bin") != std::string::npos;
+        }
+        return count;
+    };
+    
+    size_t size = save_binary(*test_drawing, "test_drawing.bin");
+    ASSERT_GT(size, 0);
+    auto loaded = load_binary_mmap("test_drawing.bin");
+    ASSERT_NE(loaded, nullptr);
+    EXPECT_EQ(loaded->total_objects(), 3);
+    EXPECT_EQ(mapped_count(), 0);
+    
+    // A truncated file fails to parse and is still unmapped
+    std::filesystem::resize_file("test_drawing.bin", size / 2);
+    EXPECT_EQ(load_binary_mmap("test_drawing.bin"), nullptr);
+    EXPECT_EQ(mapped_count(), 0);
+}
+#endif
+
 TEST_F(SerializationTest, BinaryFileSize) {
     // Create drawing with many objects
     Drawing big_drawing;
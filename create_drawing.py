@@ -3,6 +3,7 @@ Create a sample drawing and save it to disk in various formats
 """
 
 import json
+import math
 from pathlib import Path
 from python.data import (
     Drawing,
@@ -24,6 +25,7 @@ from python.data import (
     Gradient,
     GradientStop,
     TextAlignment,
+    drawing_to_svg,
 )
 
 
@@ -64,8 +66,6 @@ def create_sample_drawing():
     shapes_layer = Layer(name="Shapes", z_index=1)
 
     # Create a sun-like shape using circles and lines
-    sun_group = Group(name="Sun")
-
     # Sun center
     sun_circle = Circle(
         name="Sun Body",
@@ -75,31 +75,22 @@ def create_sample_drawing():
         stroke_color=Color(r=255, g=150, b=0),
         stroke_width=2,
     )
-    sun_group.add_object(sun_circle)
 
     # Sun rays
-    import math
-
-    for i in range(8):
-        angle = i * math.pi / 4
-        start_x = 650 + 50 * math.cos(angle)
-        start_y = 100 + 50 * math.sin(angle)
-        end_x = 650 + 70 * math.cos(angle)
-        end_y = 100 + 70 * math.sin(angle)
-
-        ray = Line(
-            start_point=Point(x=start_x, y=start_y),
-            end_point=Point(x=end_x, y=end_y),
+    directions = [(math.cos(i * math.pi / 4), math.sin(i * math.pi / 4)) for i in range(8)]
+    rays = [
+        Line(
+            start_point=Point(x=650 + 50 * dx, y=100 + 50 * dy),
+            end_point=Point(x=650 + 70 * dx, y=100 + 70 * dy),
             stroke_color=Color(r=255, g=200, b=0),
             stroke_width=3,
         )
-        sun_group.add_object(ray)
+        for dx, dy in directions
+    ]
 
-    shapes_layer.add_object(sun_group)
+    sun_group = Group(name="Sun", objects=[sun_circle, *rays])
 
     # House shape
-    house_group = Group(name="House")
-
     # House body
     house_body = Rectangle(
         name="House Body",
@@ -110,7 +101,6 @@ def create_sample_drawing():
         stroke_color=Color(r=150, g=100, b=60),
         stroke_width=2,
     )
-    house_group.add_object(house_body)
 
     # Roof
     roof = Polygon(
@@ -120,7 +110,6 @@ def create_sample_drawing():
         stroke_color=Color(r=120, g=40, b=40),
         stroke_width=2,
     )
-    house_group.add_object(roof)
 
     # Door
     door = Rectangle(
@@ -132,7 +121,6 @@ def create_sample_drawing():
         stroke_color=Color(r=60, g=40, b=20),
         stroke_width=2,
     )
-    house_group.add_object(door)
 
     # Windows
     window1 = Rectangle(
@@ -153,14 +141,10 @@ def create_sample_drawing():
         stroke_color=Color(r=100, g=100, b=100),
         stroke_width=2,
     )
-    house_group.add_object(window1)
-    house_group.add_object(window2)
 
-    shapes_layer.add_object(house_group)
+    house_group = Group(name="House", objects=[house_body, roof, door, window1, window2])
 
     # Tree
-    tree_group = Group(name="Tree")
-
     # Tree trunk
     trunk = Rectangle(
         name="Tree Trunk",
@@ -171,7 +155,6 @@ def create_sample_drawing():
         stroke_color=Color(r=60, g=40, b=20),
         stroke_width=2,
     )
-    tree_group.add_object(trunk)
 
     # Tree crown (multiple circles)
     crown_positions = [
@@ -183,17 +166,18 @@ def create_sample_drawing():
         (515, 330, 25),
     ]
 
-    for x, y, r in crown_positions:
-        crown = Circle(
+    crowns = [
+        Circle(
             center=Point(x=x, y=y),
             radius=r,
             fill=FillStyle(color=Color(r=34, g=139, b=34)),
             stroke_color=Color(r=20, g=90, b=20),
             stroke_width=1,
         )
-        tree_group.add_object(crown)
+        for x, y, r in crown_positions
+    ]
 
-    shapes_layer.add_object(tree_group)
+    tree_group = Group(name="Tree", objects=[trunk, *crowns])
 
     # Abstract shapes
     # Ellipse
@@ -207,7 +191,6 @@ def create_sample_drawing():
         stroke_color=Color(r=200, g=50, b=50),
         stroke_width=2,
     )
-    shapes_layer.add_object(ellipse)
 
     # Arc (rainbow)
     rainbow = Arc(
@@ -220,7 +203,6 @@ def create_sample_drawing():
         stroke_width=20,
         fill=None,
     )
-    shapes_layer.add_object(rainbow)
 
     # Polyline (mountain outline)
     mountain = Polyline(
@@ -237,7 +219,7 @@ def create_sample_drawing():
         stroke_width=3,
         line_style=LineStyle.SOLID,
     )
-    shapes_layer.add_object(mountain)
+    shapes_layer.add_objects([sun_group, house_group, tree_group, ellipse, rainbow, mountain])
 
     # Layer 3: Text and labels
     text_layer = Layer(name="Text", z_index=2)
@@ -253,7 +235,6 @@ def create_sample_drawing():
         stroke_color=Color(r=50, g=50, b=150),
         text_alignment=TextAlignment.CENTER,
     )
-    text_layer.add_object(title)
 
     # Labels
     house_label = Text(
@@ -270,8 +251,6 @@ def create_sample_drawing():
         stroke_color=Color(r=100, g=100, b=100),
         text_alignment=TextAlignment.CENTER,
     )
-    text_layer.add_object(house_label)
-    text_layer.add_object(tree_label)
 
     # Add signature
     signature = Text(
@@ -282,7 +261,7 @@ def create_sample_drawing():
         stroke_color=Color(r=150, g=150, b=150),
         text_alignment=TextAlignment.RIGHT,
     )
-    text_layer.add_object(signature)
+    text_layer.add_objects([title, house_label, tree_label, signature])
 
     # Add all layers to drawing
     drawing.add_layer(background_layer)
@@ -292,37 +271,51 @@ def create_sample_drawing():
     return drawing
 
 
-def save_drawing_to_disk(drawing: Drawing, output_dir: str = "output"):
-    """Save the drawing in various formats"""
+def save_drawing_to_disk(drawing: Drawing, output_dir: str = "output", all_objects=None):
+    """Save the drawing in various formats
+
+    all_objects may pass in an already computed drawing.get_all_objects()
+    to avoid walking the drawing again.
+    """
+    if all_objects is None:
+        all_objects = drawing.get_all_objects()
+
     # Create output directory
     output_path = Path(output_dir)
     output_path.mkdir(exist_ok=True)
+    stem = drawing.name.replace(" ", "_")
+
+    # Walk the model tree once, both JSON files are written from this dict
+    payload = drawing.model_dump(mode="json")
 
     # Save as JSON
-    json_path = output_path / f"{drawing.name.replace(' ', '_')}.json"
-    with open(json_path, "w") as f:
-        json.dump(drawing.model_dump(), f, indent=2, default=str)
+    json_path = output_path / f"{stem}.json"
+    try:
+        import orjson
+
+        json_path.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+    except ImportError:
+        json_path.write_text(json.dumps(payload, indent=2))
     print(f"Saved JSON to: {json_path}")
 
     # Save as pretty-printed JSON
-    pretty_json_path = output_path / f"{drawing.name.replace(' ', '_')}_pretty.json"
-    with open(pretty_json_path, "w") as f:
-        json.dump(drawing.model_dump(), f, indent=4, default=str)
+    pretty_json_path = output_path / f"{stem}_pretty.json"
+    pretty_json_path.write_text(json.dumps(payload, indent=4))
     print(f"Saved pretty JSON to: {pretty_json_path}")
 
     # Save basic SVG
-    svg_path = output_path / f"{drawing.name.replace(' ', '_')}.svg"
+    svg_path = output_path / f"{stem}.svg"
     with open(svg_path, "w") as f:
-        f.write(drawing.to_svg())
+        drawing_to_svg(drawing, out=f)
     print(f"Saved SVG to: {svg_path}")
 
     # Save drawing statistics
-    stats_path = output_path / f"{drawing.name.replace(' ', '_')}_stats.txt"
+    stats_path = output_path / f"{stem}_stats.txt"
     with open(stats_path, "w") as f:
         f.write(f"Drawing: {drawing.name}\n")
         f.write(f"Size: {drawing.width}x{drawing.height}\n")
         f.write(f"Layers: {len(drawing.layers)}\n")
-        f.write(f"Total objects: {len(drawing.get_all_objects())}\n\n")
+        f.write(f"Total objects: {len(all_objects)}\n\n")
 
         for layer in drawing.layers:
             f.write(f"\nLayer: {layer.name}\n")
@@ -330,16 +323,8 @@ def save_drawing_to_disk(drawing: Drawing, output_dir: str = "output"):
             f.write(f"  Z-index: {layer.z_index}\n")
             f.write(f"  Objects: {len(layer.objects)}\n")
 
-            for obj in layer.objects:
-                obj_type = obj.__class__.__name__
-                obj_name = obj.name if obj.name else "Unnamed"
-                f.write(f"    - {obj_type}: {obj_name}\n")
-
-                if isinstance(obj, Group):
-                    for sub_obj in obj.objects:
-                        sub_type = sub_obj.__class__.__name__
-                        sub_name = sub_obj.name if sub_obj.name else "Unnamed"
-                        f.write(f"      - {sub_type}: {sub_name}\n")
+            for depth, obj in layer.walk_objects():
+                f.write(f"    {'  ' * depth}- {type(obj).__name__}: {obj.name or 'Unnamed'}\n")
 
     print(f"Saved statistics to: {stats_path}")
 
@@ -358,10 +343,11 @@ def main():
     print(f"\nDrawing created: {drawing.name}")
     print(f"Size: {drawing.width}x{drawing.height}")
     print(f"Layers: {len(drawing.layers)}")
-    print(f"Total objects: {len(drawing.get_all_objects())}")
+    all_objects = drawing.get_all_objects()
+    print(f"Total objects: {len(all_objects)}")
 
     print("\nSaving to disk...")
-    saved_files = save_drawing_to_disk(drawing)
+    saved_files = save_drawing_to_disk(drawing, all_objects=all_objects)
 
     print("\nAll files saved successfully!")
     print("\nYou can now:")
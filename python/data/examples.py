@@ -3,6 +3,7 @@ Example usage of the drawing data structures
 """
 
 from python.data import (
+    BoundingBox,
     Circle,
     Color,
     Drawing,
@@ -111,6 +112,9 @@ def create_sample_drawing() -> Drawing:
 
 
 def demonstrate_usage() -> None:
+    # The spatial helpers need numpy, an optional extra
+    from python.data.spatial import bbox_array, find_in_rect
+
     # Create drawing
     drawing = create_sample_drawing()
 
@@ -121,17 +125,21 @@ def demonstrate_usage() -> None:
     # List all objects
     for layer in drawing.layers:
         print(f"\nLayer: {layer.name} (visible: {layer.visible})")
-        for obj in layer.objects:
+        bboxes = bbox_array(layer.objects)
+        for obj, (min_x, min_y, max_x, max_y) in zip(layer.objects, bboxes.tolist()):
             if hasattr(obj, "name") and obj.name:
                 print(f"  - {obj.__class__.__name__}: {obj.name}")
-                bbox = obj.get_bounding_box()
-                print(
-                    f"    Bounding box: ({bbox.min_x}, {bbox.min_y}) to ({bbox.max_x}, {bbox.max_y})"
-                )
-
-    # Export to dict (JSON-serializable)
-    drawing_dict = drawing.model_dump()
-    print(f"\nSerialized drawing has {len(str(drawing_dict))} characters")
+                print(f"    Bounding box: ({min_x}, {min_y}) to ({max_x}, {max_y})")
+
+    # Query objects in a region
+    region = BoundingBox(min_x=0, min_y=0, max_x=400, max_y=300)
+    for layer in drawing.layers:
+        hits = find_in_rect(bbox_array(layer.objects), region)
+        print(f"\n{len(hits)} objects of layer {layer.name} intersect the top-left quadrant")
+
+    # Export to JSON
+    drawing_json = drawing.model_dump_json()
+    print(f"\nSerialized drawing has {len(drawing_json)} characters")
 
     # Find specific object
     shapes_layer = drawing.get_layer_by_id(drawing.layers[1].id)
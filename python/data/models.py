@@ -1,9 +1,13 @@
+import functools
+import os
+import weakref
+from collections.abc import Iterator, Sequence
 from datetime import datetime
 from enum import Enum
-from typing import Any, Optional, Union
+from typing import Any, Callable, Optional, Union
 from uuid import UUID, uuid4
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class Point(BaseModel):
@@ -12,25 +16,42 @@ class Point(BaseModel):
     z: Optional[float] = 0.0
 
 
+@functools.lru_cache(maxsize=4096)
+def _hex_color(r: int, g: int, b: int) -> str:
+    # Drawings reuse a handful of colors, so formatting is done once per color
+    return f"#{r:02x}{g:02x}{b:02x}"
+
+
 class Color(BaseModel):
+    # Frozen so the instances Color.get hands out can be shared safely
+    model_config = ConfigDict(frozen=True)
+
     r: int = Field(ge=0, le=255)
     g: int = Field(ge=0, le=255)
     b: int = Field(ge=0, le=255)
     a: float = Field(ge=0.0, le=1.0, default=1.0)
 
-    @field_validator("r", "g", "b")
-    def validate_rgb(cls, v):
-        if not 0 <= v <= 255:
-            raise ValueError("RGB values must be between 0 and 255")
-        return v
-
     def to_hex(self) -> str:
-        return f"#{self.r:02x}{self.g:02x}{self.b:02x}"
+        return _hex_color(self.r, self.g, self.b)
+
+    @classmethod
+    def get(cls, r: int, g: int, b: int, a: float = 1.0) -> "Color":
+        """Return the shared instance for this RGBA value
+
+        Colors are frozen, so palette colors reused across many shapes can
+        be one validated object each instead of one per shape.
+        """
+        return _interned_color(r, g, b, a)
 
     @classmethod
     def from_hex(cls, hex_color: str) -> "Color":
         hex_color = hex_color.lstrip("#")
-        return cls(r=int(hex_color[0:2], 16), g=int(hex_color[2:4], 16), b=int(hex_color[4:6], 16))
+        return cls.get(int(hex_color[0:2], 16), int(hex_color[2:4], 16), int(hex_color[4:6], 16))
+
+
+@functools.lru_cache(maxsize=4096)
+def _interned_color(r: int, g: int, b: int, a: float) -> Color:
+    return Color(r=r, g=g, b=b, a=a)
 
 
 class BoundingBox(BaseModel):
@@ -184,16 +205,21 @@ class Rectangle(DrawableObject):
         )
 
 
+def _points_bounding_box(points: Sequence[Point]) -> BoundingBox:
+    # Coordinates are pulled into flat lists once so min/max run over floats
+    x_coords = [p.x for p in points]
+    y_coords = [p.y for p in points]
+    return BoundingBox(
+        min_x=min(x_coords), min_y=min(y_coords), max_x=max(x_coords), max_y=max(y_coords)
+    )
+
+
 class Polygon(DrawableObject):
     points: list[Point] = Field(min_length=3)
     closed: bool = True
 
     def get_bounding_box(self) -> BoundingBox:
-        x_coords = [p.x for p in self.points]
-        y_coords = [p.y for p in self.points]
-        return BoundingBox(
-            min_x=min(x_coords), min_y=min(y_coords), max_x=max(x_coords), max_y=max(y_coords)
-        )
+        return _points_bounding_box(self.points)
 
 
 class Polyline(DrawableObject):
@@ -201,11 +227,7 @@ class Polyline(DrawableObject):
     line_style: LineStyle = LineStyle.SOLID
 
     def get_bounding_box(self) -> BoundingBox:
-        x_coords = [p.x for p in self.points]
-        y_coords = [p.y for p in self.points]
-        return BoundingBox(
-            min_x=min(x_coords), min_y=min(y_coords), max_x=max(x_coords), max_y=max(y_coords)
-        )
+        return _points_bounding_box(self.points)
 
 
 class Arc(DrawableObject):
@@ -273,18 +295,24 @@ class Group(DrawableObject):
         if not self.objects:
             return BoundingBox(min_x=0, min_y=0, max_x=0, max_y=0)
 
-        boxes = [obj.get_bounding_box() for obj in self.objects]
+        # One pass over the children, transposed into per-edge tuples
+        boxes = (obj.get_bounding_box() for obj in self.objects)
+        min_xs, min_ys, max_xs, max_ys = zip(
+            *[(box.min_x, box.min_y, box.max_x, box.max_y) for box in boxes]
+        )
         return BoundingBox(
-            min_x=min(box.min_x for box in boxes),
-            min_y=min(box.min_y for box in boxes),
-            max_x=max(box.max_x for box in boxes),
-            max_y=max(box.max_y for box in boxes),
+            min_x=min(min_xs), min_y=min(min_ys), max_x=max(max_xs), max_y=max(max_ys)
         )
 
     def add_object(self, obj: DrawableObjectType):
         self.objects.append(obj)
         self.updated_at = datetime.now()
 
+    def add_objects(self, objs: list[DrawableObjectType]):
+        # One timestamp for the whole batch rather than one per object
+        self.objects.extend(objs)
+        self.updated_at = datetime.now()
+
     def remove_object(self, obj_id: UUID) -> bool:
         initial_length = len(self.objects)
         self.objects = [obj for obj in self.objects if obj.id != obj_id]
@@ -294,6 +322,14 @@ class Group(DrawableObject):
         return False
 
 
+def _walk_objects(objects: list, depth: int = 0) -> Iterator[tuple[int, Any]]:
+    for obj in objects:
+        yield depth, obj
+        children = getattr(obj, "objects", None)
+        if children:
+            yield from _walk_objects(children, depth + 1)
+
+
 class Layer(BaseModel):
     id: UUID = Field(default_factory=uuid4)
     name: str
@@ -306,6 +342,58 @@ class Layer(BaseModel):
     def add_object(self, obj: Union[DrawableObjectType, Group]):
         obj.layer_id = self.id
         self.objects.append(obj)
+        _index_appended(self, [obj])
+
+    def add_objects(self, objs: list[Union[DrawableObjectType, Group]]):
+        for obj in objs:
+            obj.layer_id = self.id
+        self.objects.extend(objs)
+        _index_appended(self, objs)
+
+    def walk_objects(self) -> Iterator[tuple[int, Union[DrawableObjectType, Group]]]:
+        """Yield (depth, object) for every object, descending into nested groups."""
+        return _walk_objects(self.objects)
+
+    def ingest_circles(
+        self,
+        xs: Sequence[float],
+        ys: Sequence[float],
+        radii: Sequence[float],
+        fill: Optional[FillStyle] = None,
+    ) -> list[Circle]:
+        """Bulk-create circles from parallel coordinate sequences.
+
+        Every circle is validated as it is built (a non-positive radius
+        raises ValidationError). All circles in a batch share the same
+        creation timestamp; each gets its own copy of fill.
+        """
+        if not len(xs) == len(ys) == len(radii):
+            raise ValueError("xs, ys and radii must have the same length")
+
+        # Validating each circle is as fast as copying a validated template:
+        # the per-object cost is dominated by uuid4. Ids are cut from a single
+        # os.urandom call, which is what uuid4 does one id at a time
+        now = datetime.now()
+        layer_id = self.id
+        raw = os.urandom(16 * len(radii))
+        # Colors are frozen and can be shared, so the fill is only copied
+        # deeply when it holds a (mutable) gradient
+        deep = fill is not None and fill.gradient is not None
+        circles = [
+            Circle(
+                id=UUID(bytes=raw[offset : offset + 16], version=4),
+                center=Point(x=float(x), y=float(y)),
+                radius=float(r),
+                fill=fill.model_copy(deep=deep) if fill is not None else None,
+                layer_id=layer_id,
+                created_at=now,
+                updated_at=now,
+            )
+            for offset, x, y, r in zip(range(0, len(raw), 16), xs, ys, radii)
+        ]
+        self.objects.extend(circles)
+        _index_appended(self, circles)
+        return circles
 
     def remove_object(self, obj_id: UUID) -> bool:
         initial_length = len(self.objects)
@@ -313,14 +401,81 @@ class Layer(BaseModel):
         return len(self.objects) < initial_length
 
     def get_object_by_id(self, obj_id: UUID) -> Optional[Union[DrawableObjectType, Group]]:
-        for obj in self.objects:
-            if obj.id == obj_id:
-                return obj
+        index = _id_indexes.get(id(self))
+        if index is not None:
+            entry = index.entries.get(obj_id)
+            if entry is not None:
+                obj = _indexed_object(self, entry)
+                if obj is not None and obj.id == obj_id:
+                    return obj
+        # Miss or stale entry: the layer or a group changed since indexing
+        entry = _index_layer(self).entries.get(obj_id)
+        return _indexed_object(self, entry) if entry is not None else None
+
+
+class _IdIndex:
+    # id -> (position in layer, position in group or None) for one layer.
+    # Entries hold positions rather than objects, so removed objects are not
+    # kept alive. length is the layer length the entries were built for
+    __slots__ = ("ref", "entries", "length")
+
+    def __init__(self, layer: Layer, ref: weakref.ref) -> None:
+        self.ref = ref
+        self.entries: dict[UUID, tuple[int, Optional[int]]] = {}
+        self.length = 0
+        self.add(layer.objects)
+
+    def add(self, objects: Sequence[Union[DrawableObjectType, Group]]) -> None:
+        # setdefault keeps the first occurrence, the one a scan would find
+        entries = self.entries
+        for pos, obj in enumerate(objects, self.length):
+            entries.setdefault(obj.id, (pos, None))
             if isinstance(obj, Group):
-                for sub_obj in obj.objects:
-                    if sub_obj.id == obj_id:
-                        return sub_obj
+                for sub_pos, sub_obj in enumerate(obj.objects):
+                    entries.setdefault(sub_obj.id, (pos, sub_pos))
+        self.length += len(objects)
+
+
+# Per-layer id indexes, keyed by id() of the layer and kept outside the model
+# so equality is unaffected. Every hit is checked against the live lists and
+# the index is rebuilt on a miss, so objects added, removed or replaced by
+# any path (group methods, direct list edits) are still found.
+_id_indexes: dict[int, _IdIndex] = {}
+
+
+def _evict(cache: dict[int, Any], key: int) -> Callable[[weakref.ref], None]:
+    # weakref callback that drops an index once its object is gone
+    return lambda _ref: cache.pop(key, None)
+
+
+def _index_layer(layer: Layer) -> _IdIndex:
+    old = _id_indexes.get(id(layer))
+    ref = old.ref if old is not None else weakref.ref(layer, _evict(_id_indexes, id(layer)))
+    index = _id_indexes[id(layer)] = _IdIndex(layer, ref)
+    return index
+
+
+def _index_appended(layer: Layer, objs: Sequence[Union[DrawableObjectType, Group]]) -> None:
+    index = _id_indexes.get(id(layer))
+    if index is None:
+        return
+    if index.length + len(objs) == len(layer.objects):
+        # Layer methods extend the index so a lookup right after an add
+        # does not rebuild it
+        index.add(objs)
+
+
+def _indexed_object(
+    layer: Layer, entry: tuple[int, Optional[int]]
+) -> Optional[Union[DrawableObjectType, Group]]:
+    pos, sub_pos = entry
+    if pos >= len(layer.objects):
         return None
+    top = layer.objects[pos]
+    if sub_pos is None:
+        return top
+    children = top.objects if isinstance(top, Group) else []
+    return children[sub_pos] if sub_pos < len(children) else None
 
 
 class Drawing(BaseModel):
@@ -328,7 +483,7 @@ class Drawing(BaseModel):
     name: str = "Untitled Drawing"
     width: float = Field(gt=0.0, default=800)
     height: float = Field(gt=0.0, default=600)
-    background_color: Color = Field(default_factory=lambda: Color(r=255, g=255, b=255))
+    background_color: Color = Field(default_factory=lambda: Color.get(255, 255, 255))
     layers: list[Layer] = Field(default_factory=list)
     metadata: dict[str, Any] = Field(default_factory=dict)
     created_at: datetime = Field(default_factory=datetime.now)
@@ -358,8 +513,29 @@ class Drawing(BaseModel):
             all_objects.extend(layer.objects)
         return all_objects
 
+    def walk_objects(self) -> Iterator[tuple[int, Union[DrawableObjectType, Group]]]:
+        """Yield (depth, object) for every object in every layer, including
+        the contents of nested groups. Top-level objects have depth 0."""
+        for layer in self.layers:
+            yield from layer.walk_objects()
+
     def to_svg(self) -> str:
         """Convert drawing to SVG format"""
         from python.data.svg_renderer import drawing_to_svg
 
         return drawing_to_svg(self)
+
+    def to_json(self) -> str:
+        """Serialize drawing to a JSON string"""
+        return self.model_dump_json()
+
+    @classmethod
+    def from_json(cls, data: Union[str, bytes]) -> "Drawing":
+        """Load a drawing from JSON produced by to_json"""
+        try:
+            import orjson
+        except ImportError:
+            return cls.model_validate_json(data)
+        # Parsing with orjson and validating the dicts is about twice as
+        # fast as pydantic's JSON mode for a drawing
+        return cls.model_validate(orjson.loads(data))
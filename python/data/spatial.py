@@ -0,0 +1,99 @@
+"""
+Bounding box arrays and rectangle queries for drawing objects
+
+Requires NumPy. When Numba is installed the rectangle scan and the point
+bounds reduction are JIT-compiled (and cached on disk, so only the first
+run in a fresh environment pays the compile cost); otherwise they run as
+vectorized NumPy expressions.
+"""
+
+from collections.abc import Sequence
+
+import numpy as np
+
+from python.data.models import BoundingBox, DrawableObject
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+
+def bbox_array(objects: Sequence[DrawableObject]) -> np.ndarray:
+    """Return an (N, 4) float64 array of [min_x, min_y, max_x, max_y] rows"""
+    boxes = [obj.get_bounding_box() for obj in objects]
+    return np.array(
+        [(b.min_x, b.min_y, b.max_x, b.max_y) for b in boxes], dtype=np.float64
+    ).reshape(len(boxes), 4)
+
+
+if njit is not None:
+
+    @njit(cache=True, parallel=True)
+    def _find_in_rect_jit(bboxes, qx1, qy1, qx2, qy2):
+        n = bboxes.shape[0]
+        hits = np.empty(n, dtype=np.bool_)
+        for i in prange(n):
+            hits[i] = (
+                bboxes[i, 2] >= qx1
+                and bboxes[i, 0] <= qx2
+                and bboxes[i, 3] >= qy1
+                and bboxes[i, 1] <= qy2
+            )
+        # Compact serially into a preallocated output
+        out = np.empty(n, dtype=np.int64)
+        count = 0
+        for i in range(n):
+            if hits[i]:
+                out[count] = i
+                count += 1
+        return out[:count]
+
+
+def find_in_rect(bboxes: np.ndarray, rect: BoundingBox) -> np.ndarray:
+    """Return indices of the rows in bboxes that intersect rect"""
+    bboxes = np.ascontiguousarray(bboxes, dtype=np.float64)
+    if njit is not None:
+        return _find_in_rect_jit(bboxes, rect.min_x, rect.min_y, rect.max_x, rect.max_y)
+    hits = (
+        (bboxes[:, 2] >= rect.min_x)
+        & (bboxes[:, 0] <= rect.max_x)
+        & (bboxes[:, 3] >= rect.min_y)
+        & (bboxes[:, 1] <= rect.max_y)
+    )
+    return np.flatnonzero(hits)
+
+
+if njit is not None:
+
+    @njit(cache=True, fastmath=True)
+    def _points_bounds_jit(xs, ys):
+        min_x = max_x = xs[0]
+        min_y = max_y = ys[0]
+        for i in range(1, xs.shape[0]):
+            x = xs[i]
+            y = ys[i]
+            if x < min_x:
+                min_x = x
+            elif x > max_x:
+                max_x = x
+            if y < min_y:
+                min_y = y
+            elif y > max_y:
+                max_y = y
+        return min_x, min_y, max_x, max_y
+
+
+def points_bounding_box(xs: np.ndarray, ys: np.ndarray) -> BoundingBox:
+    """Return the bounding box of points given as x and y coordinate arrays"""
+    xs = np.ascontiguousarray(xs, dtype=np.float64)
+    ys = np.ascontiguousarray(ys, dtype=np.float64)
+    if xs.shape != ys.shape or xs.ndim != 1 or xs.size == 0:
+        raise ValueError("xs and ys must be non-empty 1-D arrays of equal length")
+    if njit is not None:
+        min_x, min_y, max_x, max_y = _points_bounds_jit(xs, ys)
+    else:
+        min_x, min_y, max_x, max_y = xs.min(), ys.min(), xs.max(), ys.max()
+    return BoundingBox(
+        min_x=float(min_x), min_y=float(min_y), max_x=float(max_x), max_y=float(max_y)
+    )
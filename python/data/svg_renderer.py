@@ -2,8 +2,10 @@
 SVG rendering functionality for drawable objects
 """
 
+import functools
 import math
-from typing import Union
+import operator
+from typing import Any, Callable, Optional, TextIO, Union, overload
 
 from python.data.models import (
     Arc,
@@ -30,19 +32,43 @@ from python.data.models import (
 def color_to_svg(color: Color) -> str:
     """Convert Color to SVG color string"""
     if color.a < 1.0:
-        return f"rgba({color.r},{color.g},{color.b},{color.a})"
+        return _rgba_color(color.r, color.g, color.b, color.a)
     return color.to_hex()
 
 
+@functools.lru_cache(maxsize=4096)
+def _rgba_color(r: int, g: int, b: int, a: float) -> str:
+    return f"rgba({r},{g},{b},{a})"
+
+
+_DASH_PATTERNS = {
+    LineStyle.SOLID: "",
+    LineStyle.DASHED: "10,5",
+    LineStyle.DOTTED: "2,3",
+    LineStyle.DASH_DOT: "10,5,2,5",
+}
+
+# Complete stroke-dasharray attribute per style, "" for solid lines
+_DASH_ATTRS = {
+    style: f' stroke-dasharray="{dash}"' if dash else "" for style, dash in _DASH_PATTERNS.items()
+}
+
+_TEXT_ANCHORS = {
+    TextAlignment.LEFT: "start",
+    TextAlignment.CENTER: "middle",
+    TextAlignment.RIGHT: "end",
+}
+
+_TEXT_BASELINES = {
+    VerticalAlignment.TOP: "text-before-edge",
+    VerticalAlignment.MIDDLE: "middle",
+    VerticalAlignment.BOTTOM: "text-after-edge",
+}
+
+
 def line_style_to_svg(style: LineStyle) -> str:
     """Convert LineStyle to SVG stroke-dasharray"""
-    patterns = {
-        LineStyle.SOLID: "",
-        LineStyle.DASHED: "10,5",
-        LineStyle.DOTTED: "2,3",
-        LineStyle.DASH_DOT: "10,5,2,5",
-    }
-    return patterns.get(style, "")
+    return _DASH_PATTERNS.get(style, "")
 
 
 def fill_to_svg(fill: FillStyle, defs: list[str], obj_id: str) -> str:
@@ -64,172 +90,119 @@ def fill_to_svg(fill: FillStyle, defs: list[str], obj_id: str) -> str:
             x2 = 50 + 50 * math.cos(math.radians(angle))
             y2 = 50 + 50 * math.sin(math.radians(angle))
 
-            grad_def = (
+            grad_parts = [
                 f'<linearGradient id="{grad_id}" x1="{x1}%" y1="{y1}%" x2="{x2}%" y2="{y2}%">'
-            )
+            ]
         else:  # radial
             cx = gradient.center.x if gradient.center else 50
             cy = gradient.center.y if gradient.center else 50
             r = gradient.radius if gradient.radius else 50
-            grad_def = f'<radialGradient id="{grad_id}" cx="{cx}%" cy="{cy}%" r="{r}%">'
+            grad_parts = [f'<radialGradient id="{grad_id}" cx="{cx}%" cy="{cy}%" r="{r}%">']
 
         for stop in gradient.stops:
             stop_color = color_to_svg(stop.color)
-            grad_def += f'<stop offset="{stop.offset * 100}%" stop-color="{stop_color}"/>'
+            grad_parts.append(f'<stop offset="{stop.offset * 100}%" stop-color="{stop_color}"/>')
 
-        grad_def += f"</{gradient.type.value}Gradient>"
-        defs.append(grad_def)
+        grad_parts.append(f"</{gradient.type.value}Gradient>")
+        defs.append("".join(grad_parts))
 
         return f"url(#{grad_id})"
 
     return "none"
 
 
-def render_line(line: Line, defs: list[str]) -> str:
-    """Render Line to SVG"""
-    attrs = []
-    attrs.append(f'x1="{line.start_point.x}"')
-    attrs.append(f'y1="{line.start_point.y}"')
-    attrs.append(f'x2="{line.end_point.x}"')
-    attrs.append(f'y2="{line.end_point.y}"')
-
-    if line.stroke_color:
-        attrs.append(f'stroke="{color_to_svg(line.stroke_color)}"')
-    attrs.append(f'stroke-width="{line.stroke_width}"')
+# Attribute helpers shared by the render_* functions. Optional attributes
+# come back with their leading space, or as "" when absent, so each shape
+# is assembled by a single f-string.
 
-    dash = line_style_to_svg(line.line_style)
-    if dash:
-        attrs.append(f'stroke-dasharray="{dash}"')
 
-    if line.opacity < 1.0:
-        attrs.append(f'opacity="{line.opacity}"')
+def _fill_attr(obj: DrawableObject, defs: list[str]) -> str:
+    fill = obj.fill
+    if not fill:
+        return 'fill="none"'
+    if fill.color:
+        return f'fill="{color_to_svg(fill.color)}"'
+    # Only gradients need the object id, and str(UUID) is not free
+    return f'fill="{fill_to_svg(fill, defs, str(obj.id))}"'
 
-    return f'<line {" ".join(attrs)}/>'
 
+def _stroke_attrs(obj: DrawableObject) -> str:
+    if obj.stroke_color:
+        return f'stroke="{color_to_svg(obj.stroke_color)}" stroke-width="{obj.stroke_width}"'
+    return f'stroke-width="{obj.stroke_width}"'
 
-def render_circle(circle: Circle, defs: list[str]) -> str:
-    """Render Circle to SVG"""
-    attrs = []
-    attrs.append(f'cx="{circle.center.x}"')
-    attrs.append(f'cy="{circle.center.y}"')
-    attrs.append(f'r="{circle.radius}"')
-
-    if circle.fill:
-        fill = fill_to_svg(circle.fill, defs, str(circle.id))
-        attrs.append(f'fill="{fill}"')
-    else:
-        attrs.append('fill="none"')
 
-    if circle.stroke_color:
-        attrs.append(f'stroke="{color_to_svg(circle.stroke_color)}"')
-    attrs.append(f'stroke-width="{circle.stroke_width}"')
+def _opacity_attr(obj: DrawableObject) -> str:
+    return f' opacity="{obj.opacity}"' if obj.opacity < 1.0 else ""
 
-    if circle.opacity < 1.0:
-        attrs.append(f'opacity="{circle.opacity}"')
 
-    return f'<circle {" ".join(attrs)}/>'
+def _escape_text(content: str) -> str:
+    # Chained replace is faster than str.translate here: each replace is a
+    # C-level scan that returns the string untouched when there is no match,
+    # while translate with a dict table does a lookup per character
+    return content.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
 
 
-def render_ellipse(ellipse: Ellipse, defs: list[str]) -> str:
-    """Render Ellipse to SVG"""
-    attrs = []
-    attrs.append(f'cx="{ellipse.center.x}"')
-    attrs.append(f'cy="{ellipse.center.y}"')
-    attrs.append(f'rx="{ellipse.rx}"')
-    attrs.append(f'ry="{ellipse.ry}"')
-
-    if ellipse.rotation != 0:
-        attrs.append(
-            f'transform="rotate({ellipse.rotation} {ellipse.center.x} {ellipse.center.y})"'
-        )
+def render_line(line: Line, defs: list[str]) -> str:
+    """Render Line to SVG"""
+    start, end = line.start_point, line.end_point
+    return (
+        f'<line x1="{start.x}" y1="{start.y}" x2="{end.x}" y2="{end.y}" '
+        f"{_stroke_attrs(line)}{_DASH_ATTRS[line.line_style]}{_opacity_attr(line)}/>"
+    )
 
-    if ellipse.fill:
-        fill = fill_to_svg(ellipse.fill, defs, str(ellipse.id))
-        attrs.append(f'fill="{fill}"')
-    else:
-        attrs.append('fill="none"')
 
-    if ellipse.stroke_color:
-        attrs.append(f'stroke="{color_to_svg(ellipse.stroke_color)}"')
-    attrs.append(f'stroke-width="{ellipse.stroke_width}"')
+def render_circle(circle: Circle, defs: list[str]) -> str:
+    """Render Circle to SVG"""
+    center = circle.center
+    return (
+        f'<circle cx="{center.x}" cy="{center.y}" r="{circle.radius}" '
+        f"{_fill_attr(circle, defs)} {_stroke_attrs(circle)}{_opacity_attr(circle)}/>"
+    )
 
-    if ellipse.opacity < 1.0:
-        attrs.append(f'opacity="{ellipse.opacity}"')
 
-    return f'<ellipse {" ".join(attrs)}/>'
+def render_ellipse(ellipse: Ellipse, defs: list[str]) -> str:
+    """Render Ellipse to SVG"""
+    center = ellipse.center
+    rotate = (
+        f' transform="rotate({ellipse.rotation} {center.x} {center.y})"'
+        if ellipse.rotation != 0
+        else ""
+    )
+    return (
+        f'<ellipse cx="{center.x}" cy="{center.y}" rx="{ellipse.rx}" ry="{ellipse.ry}"{rotate} '
+        f"{_fill_attr(ellipse, defs)} {_stroke_attrs(ellipse)}{_opacity_attr(ellipse)}/>"
+    )
 
 
 def render_rectangle(rect: Rectangle, defs: list[str]) -> str:
     """Render Rectangle to SVG"""
-    attrs = []
-    attrs.append(f'x="{rect.top_left.x}"')
-    attrs.append(f'y="{rect.top_left.y}"')
-    attrs.append(f'width="{rect.width}"')
-    attrs.append(f'height="{rect.height}"')
-
-    if rect.corner_radius > 0:
-        attrs.append(f'rx="{rect.corner_radius}"')
-        attrs.append(f'ry="{rect.corner_radius}"')
-
-    if rect.fill:
-        fill = fill_to_svg(rect.fill, defs, str(rect.id))
-        attrs.append(f'fill="{fill}"')
-    else:
-        attrs.append('fill="none"')
-
-    if rect.stroke_color:
-        attrs.append(f'stroke="{color_to_svg(rect.stroke_color)}"')
-    attrs.append(f'stroke-width="{rect.stroke_width}"')
-
-    if rect.opacity < 1.0:
-        attrs.append(f'opacity="{rect.opacity}"')
-
-    return f'<rect {" ".join(attrs)}/>'
+    top_left = rect.top_left
+    corners = (
+        f' rx="{rect.corner_radius}" ry="{rect.corner_radius}"' if rect.corner_radius > 0 else ""
+    )
+    return (
+        f'<rect x="{top_left.x}" y="{top_left.y}" width="{rect.width}" height="{rect.height}"'
+        f"{corners} {_fill_attr(rect, defs)} {_stroke_attrs(rect)}{_opacity_attr(rect)}/>"
+    )
 
 
 def render_polygon(polygon: Polygon, defs: list[str]) -> str:
     """Render Polygon to SVG"""
     points = " ".join([f"{p.x},{p.y}" for p in polygon.points])
-
-    attrs = []
-    attrs.append(f'points="{points}"')
-
-    if polygon.fill:
-        fill = fill_to_svg(polygon.fill, defs, str(polygon.id))
-        attrs.append(f'fill="{fill}"')
-    else:
-        attrs.append('fill="none"')
-
-    if polygon.stroke_color:
-        attrs.append(f'stroke="{color_to_svg(polygon.stroke_color)}"')
-    attrs.append(f'stroke-width="{polygon.stroke_width}"')
-
-    if polygon.opacity < 1.0:
-        attrs.append(f'opacity="{polygon.opacity}"')
-
-    return f'<polygon {" ".join(attrs)}/>'
+    return (
+        f'<polygon points="{points}" '
+        f"{_fill_attr(polygon, defs)} {_stroke_attrs(polygon)}{_opacity_attr(polygon)}/>"
+    )
 
 
 def render_polyline(polyline: Polyline, defs: list[str]) -> str:
     """Render Polyline to SVG"""
     points = " ".join([f"{p.x},{p.y}" for p in polyline.points])
-
-    attrs = []
-    attrs.append(f'points="{points}"')
-    attrs.append('fill="none"')
-
-    if polyline.stroke_color:
-        attrs.append(f'stroke="{color_to_svg(polyline.stroke_color)}"')
-    attrs.append(f'stroke-width="{polyline.stroke_width}"')
-
-    dash = line_style_to_svg(polyline.line_style)
-    if dash:
-        attrs.append(f'stroke-dasharray="{dash}"')
-
-    if polyline.opacity < 1.0:
-        attrs.append(f'opacity="{polyline.opacity}"')
-
-    return f'<polyline {" ".join(attrs)}/>'
+    return (
+        f'<polyline points="{points}" fill="none" {_stroke_attrs(polyline)}'
+        f"{_DASH_ATTRS[polyline.line_style]}{_opacity_attr(polyline)}/>"
+    )
 
 
 def render_arc(arc: Arc, defs: list[str]) -> str:
@@ -253,60 +226,24 @@ def render_arc(arc: Arc, defs: list[str]) -> str:
     # Create path data
     path_data = f"M {start_x} {start_y} A {arc.radius} {arc.radius} 0 {large_arc} 1 {end_x} {end_y}"
 
-    attrs = []
-    attrs.append(f'd="{path_data}"')
-    attrs.append('fill="none"')
-
-    if arc.stroke_color:
-        attrs.append(f'stroke="{color_to_svg(arc.stroke_color)}"')
-    attrs.append(f'stroke-width="{arc.stroke_width}"')
-
-    if arc.opacity < 1.0:
-        attrs.append(f'opacity="{arc.opacity}"')
-
-    return f'<path {" ".join(attrs)}/>'
+    return f'<path d="{path_data}" fill="none" {_stroke_attrs(arc)}{_opacity_attr(arc)}/>'
 
 
 def render_text(text: Text, defs: list[str]) -> str:
     """Render Text to SVG"""
-    attrs = []
-    attrs.append(f'x="{text.position.x}"')
-    attrs.append(f'y="{text.position.y}"')
-
-    # Text alignment
-    anchor = {
-        TextAlignment.LEFT: "start",
-        TextAlignment.CENTER: "middle",
-        TextAlignment.RIGHT: "end",
-    }
-    attrs.append(f'text-anchor="{anchor.get(text.text_alignment, "start")}"')
-
-    # Vertical alignment
-    baseline = {
-        VerticalAlignment.TOP: "text-before-edge",
-        VerticalAlignment.MIDDLE: "middle",
-        VerticalAlignment.BOTTOM: "text-after-edge",
-    }
-    attrs.append(f'dominant-baseline="{baseline.get(text.vertical_alignment, "auto")}"')
-
-    # Font properties
-    attrs.append(f'font-family="{text.font_family}"')
-    attrs.append(f'font-size="{text.font_size}"')
-    if text.font_weight != "normal":
-        attrs.append(f'font-weight="{text.font_weight}"')
-    if text.font_style != "normal":
-        attrs.append(f'font-style="{text.font_style}"')
-
-    if text.stroke_color:
-        attrs.append(f'fill="{color_to_svg(text.stroke_color)}"')
-
-    if text.opacity < 1.0:
-        attrs.append(f'opacity="{text.opacity}"')
-
-    # Escape special characters
-    content = text.content.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
-
-    return f'<text {" ".join(attrs)}>{content}</text>'
+    anchor = _TEXT_ANCHORS[text.text_alignment]
+    baseline = _TEXT_BASELINES[text.vertical_alignment]
+    weight = f' font-weight="{text.font_weight}"' if text.font_weight != "normal" else ""
+    style = f' font-style="{text.font_style}"' if text.font_style != "normal" else ""
+    fill = f' fill="{color_to_svg(text.stroke_color)}"' if text.stroke_color else ""
+
+    content = _escape_text(text.content)
+
+    return (
+        f'<text x="{text.position.x}" y="{text.position.y}" text-anchor="{anchor}" '
+        f'dominant-baseline="{baseline}" font-family="{text.font_family}" '
+        f'font-size="{text.font_size}"{weight}{style}{fill}{_opacity_attr(text)}>{content}</text>'
+    )
 
 
 def render_path(path: Path, defs: list[str]) -> str:
@@ -317,103 +254,149 @@ def render_path(path: Path, defs: list[str]) -> str:
         path_data.append(cmd.command)
         path_data.extend([str(p) for p in cmd.params])
 
-    attrs = []
-    attrs.append(f'd="{" ".join(path_data)}"')
-
-    if path.fill:
-        fill = fill_to_svg(path.fill, defs, str(path.id))
-        attrs.append(f'fill="{fill}"')
-    else:
-        attrs.append('fill="none"')
-
-    if path.stroke_color:
-        attrs.append(f'stroke="{color_to_svg(path.stroke_color)}"')
-    attrs.append(f'stroke-width="{path.stroke_width}"')
-
-    if path.opacity < 1.0:
-        attrs.append(f'opacity="{path.opacity}"')
-
-    return f'<path {" ".join(attrs)}/>'
+    return (
+        f'<path d="{" ".join(path_data)}" '
+        f"{_fill_attr(path, defs)} {_stroke_attrs(path)}{_opacity_attr(path)}/>"
+    )
 
 
 def render_object(obj: Union[DrawableObject, Group], defs: list[str]) -> str:
     """Render any drawable object to SVG"""
-    if isinstance(obj, Line):
-        return render_line(obj, defs)
-    elif isinstance(obj, Circle):
-        return render_circle(obj, defs)
-    elif isinstance(obj, Ellipse):
-        return render_ellipse(obj, defs)
-    elif isinstance(obj, Rectangle):
-        return render_rectangle(obj, defs)
-    elif isinstance(obj, Polygon):
-        return render_polygon(obj, defs)
-    elif isinstance(obj, Polyline):
-        return render_polyline(obj, defs)
-    elif isinstance(obj, Arc):
-        return render_arc(obj, defs)
-    elif isinstance(obj, Text):
-        return render_text(obj, defs)
-    elif isinstance(obj, Path):
-        return render_path(obj, defs)
-    elif isinstance(obj, Group):
-        return render_group(obj, defs)
-    else:
-        return f"<!-- Unsupported object type: {type(obj).__name__} -->"
+    renderer = _RENDERERS.get(type(obj))
+    if renderer is None:
+        # Subclasses of the model types render like their base
+        renderer = next((_RENDERERS[t] for t in type(obj).__mro__ if t in _RENDERERS), None)
+        if renderer is None:
+            return f"<!-- Unsupported object type: {type(obj).__name__} -->"
+    return renderer(obj, defs)
 
 
 def render_group(group: Group, defs: list[str]) -> str:
     """Render Group to SVG"""
-    group_parts = [f'<g id="{group.id}">']
+    lines: list[str] = []
+    _group_lines(group, defs, lines, "")
+    return "\n".join(lines)
+
+
+# The *_lines helpers append output lines to one flat list, so groups and
+# layers are joined once per document instead of once per container. A
+# group's children are indented by two spaces; its own opening tag takes
+# the indent of its parent.
 
-    for obj in group.objects:
-        svg = render_object(obj, defs)
-        if svg:
-            group_parts.append(f"  {svg}")
 
-    group_parts.append("</g>")
-    return "\n".join(group_parts)
+def _group_lines(group: Group, defs: list[str], lines: list[str], indent: str) -> None:
+    lines.append(f'{indent}<g id="{group.id}">')
+    for obj in group.objects:
+        _object_lines(obj, defs, lines)
+    lines.append("</g>")
+
+
+def _object_lines(obj: Union[DrawableObject, Group], defs: list[str], lines: list[str]) -> None:
+    renderer = _RENDERERS.get(type(obj), render_object)
+    if renderer is render_group:
+        _group_lines(obj, defs, lines, "  ")  # type: ignore[arg-type]
+        return
+    svg = renderer(obj, defs)
+    if svg:
+        lines.append(f"  {svg}")
+
+
+# Exact-type dispatch; render_object is the fallback for subclasses and
+# unsupported types
+_RENDERERS: dict[type, Callable[[Any, list[str]], str]] = {
+    Line: render_line,
+    Circle: render_circle,
+    Ellipse: render_ellipse,
+    Rectangle: render_rectangle,
+    Polygon: render_polygon,
+    Polyline: render_polyline,
+    Arc: render_arc,
+    Text: render_text,
+    Path: render_path,
+    Group: render_group,
+}
 
 
 def render_layer(layer: Layer, defs: list[str]) -> str:
     """Render Layer to SVG"""
-    if not layer.visible:
-        return ""
+    lines: list[str] = []
+    _layer_lines(layer, defs, lines)
+    return "\n".join(lines)
 
-    layer_parts = [f'<g id="{layer.id}" opacity="{layer.opacity}">']
 
+def _layer_lines(layer: Layer, defs: list[str], lines: list[str]) -> None:
+    if not layer.visible:
+        return
+    lines.append(f'<g id="{layer.id}" opacity="{layer.opacity}">')
+    # Consecutive lines or circles usually share one style (CAD exports are
+    # often all lines, bulk-ingested circles share a fill), so their style
+    # attributes are formatted once per run. Objects keep their order, which
+    # is their paint order
+    run_style: Optional[tuple[Any, ...]] = None
+    style: tuple[Any, ...]
+    suffix = ""
     for obj in layer.objects:
-        svg = render_object(obj, defs)
-        if svg:
-            layer_parts.append(f"  {svg}")
+        if isinstance(obj, Line):
+            style = (Line, obj.stroke_color, obj.stroke_width, obj.line_style, obj.opacity)
+            if style != run_style:
+                run_style = style
+                suffix = f"{_stroke_attrs(obj)}{_DASH_ATTRS[obj.line_style]}{_opacity_attr(obj)}"
+            start, end = obj.start_point, obj.end_point
+            lines.append(
+                f'  <line x1="{start.x}" y1="{start.y}" x2="{end.x}" y2="{end.y}" {suffix}/>'
+            )
+        elif isinstance(obj, Circle) and (not obj.fill or obj.fill.color):
+            # Gradient fills are excluded, their url() names the object
+            style = (Circle, obj.fill, obj.stroke_color, obj.stroke_width, obj.opacity)
+            if style != run_style:
+                run_style = style
+                suffix = f"{_fill_attr(obj, defs)} {_stroke_attrs(obj)}{_opacity_attr(obj)}"
+            center = obj.center
+            lines.append(f'  <circle cx="{center.x}" cy="{center.y}" r="{obj.radius}" {suffix}/>')
+        else:
+            _object_lines(obj, defs, lines)
+    lines.append("</g>")
+
+
+_Z_INDEX = operator.attrgetter("z_index")
+
+
+@overload
+def drawing_to_svg(drawing: Drawing, out: None = None) -> str: ...
+
 
-    layer_parts.append("</g>")
-    return "\n".join(layer_parts)
+@overload
+def drawing_to_svg(drawing: Drawing, out: TextIO) -> None: ...
 
 
-def drawing_to_svg(drawing: Drawing) -> str:
-    """Convert Drawing to complete SVG string"""
+def drawing_to_svg(drawing: Drawing, out: Optional[TextIO] = None) -> Optional[str]:
+    """Convert Drawing to complete SVG string
+
+    If out is given, the SVG is written to it line by line instead and
+    None is returned.
+    """
     defs: list[str] = []
+
+    # Render layers in z-order; this populates defs with any gradients
+    body: list[str] = []
+    for layer in sorted(drawing.layers, key=_Z_INDEX):
+        _layer_lines(layer, defs, body)
+
     svg_parts = [
         f'<svg width="{drawing.width}" height="{drawing.height}" xmlns="http://www.w3.org/2000/svg">',
         f'<rect width="{drawing.width}" height="{drawing.height}" fill="{drawing.background_color.to_hex()}"/>',
     ]
-
-    # Add defs section if needed (will be populated by gradients)
-    defs_placeholder = len(svg_parts)
-
-    # Render layers in z-order
-    for layer in sorted(drawing.layers, key=lambda layer: layer.z_index):
-        layer_svg = render_layer(layer, defs)
-        if layer_svg:
-            svg_parts.append(layer_svg)
-
-    # Insert defs if any were created
     if defs:
-        svg_parts.insert(defs_placeholder, "<defs>")
-        for i, def_item in enumerate(defs):
-            svg_parts.insert(defs_placeholder + 1 + i, f"  {def_item}")
-        svg_parts.insert(defs_placeholder + 1 + len(defs), "</defs>")
-
+        svg_parts.append("<defs>")
+        svg_parts.extend(f"  {def_item}" for def_item in defs)
+        svg_parts.append("</defs>")
+    svg_parts.extend(body)
     svg_parts.append("</svg>")
-    return "\n".join(svg_parts)
+
+    if out is None:
+        return "\n".join(svg_parts)
+    out.write(svg_parts[0])
+    for part in svg_parts[1:]:
+        out.write("\n")
+        out.write(part)
+    return None
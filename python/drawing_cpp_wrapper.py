@@ -3,18 +3,63 @@ Python wrapper for the C++ drawing library.
 Provides compatibility layer with the existing Pydantic models.
 """
 
+import os
+from functools import lru_cache
 from typing import Optional
 
 import drawing_cpp
 
+# Files at least this large load faster memory-mapped than through a stream
+_MMAP_LOAD_THRESHOLD = 256 * 1024
+
+_TEXT_ALIGNS = {
+    "left": drawing_cpp.TextAlign.Left,
+    "center": drawing_cpp.TextAlign.Center,
+    "right": drawing_cpp.TextAlign.Right,
+}
+
+_TEXT_BASELINES = {
+    "top": drawing_cpp.TextBaseline.Top,
+    "middle": drawing_cpp.TextBaseline.Middle,
+    "bottom": drawing_cpp.TextBaseline.Bottom,
+    "alphabetic": drawing_cpp.TextBaseline.Alphabetic,
+}
+
+
+def _text_enums(text_align: str, text_baseline: str):
+    """Map alignment names to enums; only non-canonical spellings get lowered"""
+    align = _TEXT_ALIGNS.get(text_align)
+    if align is None:
+        align = _TEXT_ALIGNS.get(text_align.lower(), drawing_cpp.TextAlign.Left)
+    baseline = _TEXT_BASELINES.get(text_baseline)
+    if baseline is None:
+        baseline = _TEXT_BASELINES.get(text_baseline.lower(), drawing_cpp.TextBaseline.Alphabetic)
+    return align, baseline
+
+
+@lru_cache(maxsize=256)
+def _color(r: int, g: int, b: int, a: int = 255) -> "drawing_cpp.Color":
+    """Shared drawing_cpp.Color per RGBA value - scenes reuse a small palette"""
+    return drawing_cpp.Color(r, g, b, a)
+
 
 class DrawingCpp:
     """High-performance drawing using C++ backend."""
 
-    def __init__(self, width: float = 800, height: float = 600):
-        self._drawing = drawing_cpp.Drawing(width, height)
+    def __init__(self, width: float = 800, height: float = 600, reserve: int = 0):
+        self._drawing = drawing_cpp.Drawing(width, height, reserve)
+        self._storage = self._drawing.get_storage()
         self._default_layer_id = 0
 
+    @classmethod
+    def _wrap(cls, cpp_drawing: "drawing_cpp.Drawing") -> "DrawingCpp":
+        """Wrap an existing C++ drawing without building a throwaway one."""
+        wrapper = cls.__new__(cls)
+        wrapper._drawing = cpp_drawing
+        wrapper._storage = cpp_drawing.get_storage()
+        wrapper._default_layer_id = 0
+        return wrapper
+
     @property
     def width(self) -> float:
         return self._drawing.get_width()
@@ -39,14 +84,33 @@ class DrawingCpp:
     @background_color.setter
     def background_color(self, color: tuple[int, int, int, int]):
         if len(color) == 3:
-            self._drawing.set_background(drawing_cpp.Color(*color))
+            self._drawing.set_background(_color(*color))
         else:
-            self._drawing.set_background(drawing_cpp.Color(*color))
+            self._drawing.set_background(_color(*color))
+
+    def reserve(self, count: int, object_type=None, layer_id: Optional[int] = None):
+        """Make room for count more objects of one type (circles by default).
+
+        Call before a long run of single add_* calls so the C++ storage
+        grows once instead of reallocating as it fills.
+        """
+        if object_type is None:
+            object_type = drawing_cpp.ObjectType.Circle
+        if layer_id is None:
+            layer_id = self._default_layer_id
+        self._drawing.reserve(count, object_type, layer_id)
 
     def add_layer(self, name: str = "") -> int:
         """Add a new layer and return its ID."""
         return self._drawing.add_layer(name)
 
+    def _apply_colors(self, obj_id: int, fill_color, stroke_color):
+        """Set whichever of the fill and stroke colors were given on one object."""
+        if fill_color:
+            self._storage.set_fill_color(obj_id, _color(*fill_color))
+        if stroke_color:
+            self._storage.set_stroke_color(obj_id, _color(*stroke_color))
+
     def add_circle(
         self,
         x: float,
@@ -63,18 +127,75 @@ class DrawingCpp:
 
         obj_id = self._drawing.add_circle(x, y, radius, layer_id)
 
-        # Set colors if provided
         if fill_color or stroke_color:
-            storage = self._drawing.get_storage()
-            if fill_color:
-                color = drawing_cpp.Color(*fill_color)
-                storage.set_fill_color([obj_id], color)
-            if stroke_color:
-                color = drawing_cpp.Color(*stroke_color)
-                storage.set_stroke_color([obj_id], color)
+            self._apply_colors(obj_id, fill_color, stroke_color)
 
         return obj_id
 
+    def add_circles_batch(
+        self,
+        xs,
+        ys,
+        radius,
+        fill_color: Optional[tuple[int, int, int]] = None,
+        layer_id: Optional[int] = None,
+        fill_colors=None,
+    ):
+        """Add many circles with a single call into C++.
+
+        Args:
+            xs, ys: 1-D arrays (or sequences) of center coordinates
+            radius: A single radius for all circles, or an array of radii
+            fill_color: Optional fill color as (r, g, b) applied to every circle
+            layer_id: Optional layer ID
+            fill_colors: Optional (N, 4) uint8 array of per-circle RGBA fills
+
+        Returns:
+            NumPy array of object IDs, in the same order as the inputs
+        """
+        import numpy as np
+
+        if layer_id is None:
+            layer_id = self._default_layer_id
+
+        xs = np.ascontiguousarray(xs, dtype=np.float32)
+        ys = np.ascontiguousarray(ys, dtype=np.float32)
+        if np.isscalar(radius):
+            radii = np.full(xs.shape, radius, dtype=np.float32)
+        else:
+            radii = np.ascontiguousarray(radius, dtype=np.float32)
+        color = _color(*fill_color) if fill_color else None
+
+        return self._drawing.add_circles(xs, ys, radii, layer_id, color, fill_colors)
+
+    def add_rectangles_batch(
+        self,
+        xs,
+        ys,
+        widths,
+        heights,
+        layer_id: Optional[int] = None,
+        fill_colors=None,
+        corner_radius: float = 0,
+    ):
+        """Add many rectangles with a single call into C++.
+
+        Args:
+            xs, ys: 1-D arrays of top-left corners
+            widths, heights: 1-D arrays of sizes
+            layer_id: Optional layer ID
+            fill_colors: Optional (N, 4) uint8 array of per-rectangle RGBA fills
+            corner_radius: Corner radius shared by every rectangle
+
+        Returns:
+            NumPy array of object IDs, in the same order as the inputs
+        """
+        if layer_id is None:
+            layer_id = self._default_layer_id
+        return self._drawing.add_rectangles(
+            xs, ys, widths, heights, layer_id, fill_colors, corner_radius
+        )
+
     def add_rectangle(
         self,
         x: float,
@@ -92,15 +213,8 @@ class DrawingCpp:
 
         obj_id = self._drawing.add_rectangle(x, y, width, height, layer_id)
 
-        # Set colors if provided
         if fill_color or stroke_color:
-            storage = self._drawing.get_storage()
-            if fill_color:
-                color = drawing_cpp.Color(*fill_color)
-                storage.set_fill_color([obj_id], color)
-            if stroke_color:
-                color = drawing_cpp.Color(*stroke_color)
-                storage.set_stroke_color([obj_id], color)
+            self._apply_colors(obj_id, fill_color, stroke_color)
 
         return obj_id
 
@@ -122,15 +236,32 @@ class DrawingCpp:
 
         # Set stroke color if provided
         if stroke_color:
-            storage = self._drawing.get_storage()
-            color = drawing_cpp.Color(*stroke_color)
-            storage.set_stroke_color([obj_id], color)
+            storage = self._storage
+            color = _color(*stroke_color)
+            storage.set_stroke_color(obj_id, color)
 
         return obj_id
 
+    def add_lines_batch(self, x1s, y1s, x2s, y2s, layer_id: Optional[int] = None, line_style=None):
+        """Add many lines with a single call into C++.
+
+        Args:
+            x1s, y1s, x2s, y2s: 1-D arrays of start and end points
+            layer_id: Optional layer ID
+            line_style: Optional drawing_cpp.LineStyle shared by every line
+
+        Returns:
+            NumPy array of object IDs, in the same order as the inputs
+        """
+        if layer_id is None:
+            layer_id = self._default_layer_id
+        if line_style is None:
+            line_style = drawing_cpp.LineStyle.Solid
+        return self._drawing.add_lines(x1s, y1s, x2s, y2s, layer_id, line_style)
+
     def add_polygon(
         self,
-        points: list[tuple[float, float]],
+        points,
         fill_color: Optional[tuple[int, int, int]] = None,
         stroke_color: Optional[tuple[int, int, int]] = None,
         stroke_width: float = 1.0,
@@ -140,19 +271,11 @@ class DrawingCpp:
         if layer_id is None:
             layer_id = self._default_layer_id
 
-        # Convert points to drawing_cpp.Point objects
-        cpp_points = [drawing_cpp.Point(x, y) for x, y in points]
-        obj_id = self._drawing.add_polygon(cpp_points, layer_id)
+        # Points go straight to C++, which reads them as one (n, 2) float array
+        obj_id = self._drawing.add_polygon(points, layer_id=layer_id)
 
-        # Set colors if provided
         if fill_color or stroke_color:
-            storage = self._drawing.get_storage()
-            if fill_color:
-                color = drawing_cpp.Color(*fill_color)
-                storage.set_fill_color([obj_id], color)
-            if stroke_color:
-                color = drawing_cpp.Color(*stroke_color)
-                storage.set_stroke_color([obj_id], color)
+            self._apply_colors(obj_id, fill_color, stroke_color)
 
         return obj_id
 
@@ -184,21 +307,14 @@ class DrawingCpp:
 
         obj_id = self._drawing.add_ellipse(x, y, rx, ry, rotation, layer_id)
 
-        # Set colors if provided
         if fill_color or stroke_color:
-            storage = self._drawing.get_storage()
-            if fill_color:
-                color = drawing_cpp.Color(*fill_color)
-                storage.set_fill_color([obj_id], color)
-            if stroke_color:
-                color = drawing_cpp.Color(*stroke_color)
-                storage.set_stroke_color([obj_id], color)
+            self._apply_colors(obj_id, fill_color, stroke_color)
 
         return obj_id
 
     def add_polyline(
         self,
-        points: list[tuple[float, float]],
+        points,
         stroke_color: Optional[tuple[int, int, int]] = None,
         stroke_width: float = 1.0,
         layer_id: Optional[int] = None,
@@ -206,7 +322,7 @@ class DrawingCpp:
         """Add a polyline (open path) to the drawing.
 
         Args:
-            points: List of (x, y) coordinate tuples
+            points: Sequence of (x, y) pairs or an (N, 2) array
             stroke_color: Optional stroke color as (r, g, b)
             stroke_width: Stroke width (not used yet)
             layer_id: Optional layer ID
@@ -214,15 +330,14 @@ class DrawingCpp:
         if layer_id is None:
             layer_id = self._default_layer_id
 
-        # Convert points to drawing_cpp.Point objects
-        cpp_points = [drawing_cpp.Point(x, y) for x, y in points]
-        obj_id = self._drawing.add_polyline(cpp_points, drawing_cpp.LineStyle.Solid, layer_id)
+        # Points go straight to C++, which reads them as one (n, 2) float array
+        obj_id = self._drawing.add_polyline(points, drawing_cpp.LineStyle.Solid, layer_id)
 
         # Set stroke color if provided (polylines typically don't have fill)
         if stroke_color:
-            storage = self._drawing.get_storage()
-            color = drawing_cpp.Color(*stroke_color)
-            storage.set_stroke_color([obj_id], color)
+            storage = self._storage
+            color = _color(*stroke_color)
+            storage.set_stroke_color(obj_id, color)
 
         return obj_id
 
@@ -255,15 +370,8 @@ class DrawingCpp:
 
         obj_id = self._drawing.add_arc(x, y, radius, start_angle, end_angle, layer_id)
 
-        # Set colors if provided
         if fill_color or stroke_color:
-            storage = self._drawing.get_storage()
-            if fill_color:
-                color = drawing_cpp.Color(*fill_color)
-                storage.set_fill_color([obj_id], color)
-            if stroke_color:
-                color = drawing_cpp.Color(*stroke_color)
-                storage.set_stroke_color([obj_id], color)
+            self._apply_colors(obj_id, fill_color, stroke_color)
 
         return obj_id
 
@@ -298,38 +406,46 @@ class DrawingCpp:
         if layer_id is None:
             layer_id = self._default_layer_id
 
-        # Convert string alignment to enum
-        align_map = {
-            "left": drawing_cpp.TextAlign.Left,
-            "center": drawing_cpp.TextAlign.Center,
-            "right": drawing_cpp.TextAlign.Right,
-        }
-        align = align_map.get(text_align.lower(), drawing_cpp.TextAlign.Left)
-
-        baseline_map = {
-            "top": drawing_cpp.TextBaseline.Top,
-            "middle": drawing_cpp.TextBaseline.Middle,
-            "bottom": drawing_cpp.TextBaseline.Bottom,
-            "alphabetic": drawing_cpp.TextBaseline.Alphabetic,
-        }
-        baseline = baseline_map.get(text_baseline.lower(), drawing_cpp.TextBaseline.Alphabetic)
+        align, baseline = _text_enums(text_align, text_baseline)
 
         obj_id = self._drawing.add_text(
             x, y, text, font_size, font_family, align, baseline, layer_id
         )
 
-        # Set colors if provided
         if fill_color or stroke_color:
-            storage = self._drawing.get_storage()
-            if fill_color:
-                color = drawing_cpp.Color(*fill_color)
-                storage.set_fill_color([obj_id], color)
-            if stroke_color:
-                color = drawing_cpp.Color(*stroke_color)
-                storage.set_stroke_color([obj_id], color)
+            self._apply_colors(obj_id, fill_color, stroke_color)
 
         return obj_id
 
+    def add_texts_batch(
+        self,
+        xs,
+        ys,
+        texts: list[str],
+        font_size: float = 16.0,
+        font_family: str = "Arial",
+        text_align: str = "left",
+        text_baseline: str = "alphabetic",
+        layer_id: Optional[int] = None,
+    ):
+        """Add many texts sharing one font and alignment with a single call into C++.
+
+        Args:
+            xs, ys: 1-D arrays of text positions
+            texts: One string per position
+            font_size, font_family, text_align, text_baseline: As for add_text
+            layer_id: Optional layer ID
+
+        Returns:
+            NumPy array of object IDs, in the same order as the inputs
+        """
+        if layer_id is None:
+            layer_id = self._default_layer_id
+        align, baseline = _text_enums(text_align, text_baseline)
+        return self._drawing.add_texts(
+            xs, ys, texts, font_size, font_family, align, baseline, layer_id
+        )
+
     def add_path(
         self,
         path_data: str,
@@ -360,18 +476,61 @@ class DrawingCpp:
 
         obj_id = self._drawing.add_path(path_data, layer_id)
 
-        # Set colors if provided
         if fill_color or stroke_color:
-            storage = self._drawing.get_storage()
-            if fill_color:
-                color = drawing_cpp.Color(*fill_color)
-                storage.set_fill_color([obj_id], color)
-            if stroke_color:
-                color = drawing_cpp.Color(*stroke_color)
-                storage.set_stroke_color([obj_id], color)
+            self._apply_colors(obj_id, fill_color, stroke_color)
 
         return obj_id
 
+    def add_paths_batch(
+        self,
+        path_data: list[str],
+        fill_color: Optional[tuple[int, int, int]] = None,
+        layer_id: Optional[int] = None,
+    ):
+        """Add many SVG paths with a single call into C++.
+
+        Args:
+            path_data: One SVG path string per path, as for add_path
+            fill_color: Optional fill color as (r, g, b) applied to every path
+            layer_id: Optional layer ID
+
+        Returns:
+            NumPy array of object IDs, in the same order as the inputs
+        """
+        if layer_id is None:
+            layer_id = self._default_layer_id
+        color = _color(*fill_color) if fill_color else None
+        return self._drawing.add_paths(path_data, layer_id, color)
+
+    def add_path_ops_batch(
+        self,
+        commands,
+        params,
+        fill_color: Optional[tuple[int, int, int]] = None,
+        layer_id: Optional[int] = None,
+    ):
+        """Add many paths with the same command sequence without any SVG parsing.
+
+        Args:
+            commands: Sequence of drawing_cpp.PathCommand codes shared by every path,
+                e.g. [MoveTo, LineTo, Close]
+            params: (N, M) array, one row per path holding the parameters of each
+                command in order (M is 2 per MoveTo/LineTo, 4 per QuadTo,
+                6 per CurveTo, 7 per ArcTo and 0 per Close)
+            fill_color: Optional fill color as (r, g, b) applied to every path
+            layer_id: Optional layer ID
+
+        Returns:
+            NumPy array of object IDs, one per row of params
+        """
+        import numpy as np
+
+        if layer_id is None:
+            layer_id = self._default_layer_id
+        commands = np.ascontiguousarray([int(c) for c in commands], dtype=np.uint8)
+        color = _color(*fill_color) if fill_color else None
+        return self._drawing.add_path_ops(commands, params, layer_id, color)
+
     def add_group(
         self, children: Optional[list[int]] = None, layer_id: Optional[int] = None
     ) -> int:
@@ -392,6 +551,24 @@ class DrawingCpp:
         else:
             return self._drawing.add_group(layer_id)
 
+    def add_groups_batch(self, children, layer_id: Optional[int] = None):
+        """Add many groups of equal size with a single call into C++.
+
+        Args:
+            children: (N, K) array of object IDs, one row of K children per group,
+                e.g. np.column_stack of the ID arrays returned by the batch adds
+            layer_id: Optional layer ID
+
+        Returns:
+            NumPy array of group IDs, one per row
+        """
+        import numpy as np
+
+        if layer_id is None:
+            layer_id = self._default_layer_id
+        children = np.ascontiguousarray(children, dtype=np.uint32)
+        return self._drawing.add_groups(children, layer_id)
+
     def add_to_group(self, group_id: int, child_id: int):
         """Add an object to an existing group.
 
@@ -403,30 +580,71 @@ class DrawingCpp:
 
     def find_objects_at_point(self, x: float, y: float, tolerance: float = 1.0) -> list[int]:
         """Find objects at the given point."""
-        storage = self._drawing.get_storage()
+        storage = self._storage
         point = drawing_cpp.Point(x, y)
         return storage.find_at_point(point, tolerance)
 
-    def find_objects_in_rect(self, x1: float, y1: float, x2: float, y2: float) -> list[int]:
-        """Find objects within the given rectangle."""
-        bbox = drawing_cpp.BoundingBox(x1, y1, x2, y2)
-        return self._drawing.find_objects_in_rect(bbox)
+    def find_objects_in_rect(
+        self, x1: float, y1: float, x2: float, y2: float, as_array: bool = False
+    ):
+        """Find objects within the given rectangle.
+
+        With as_array=True the IDs come back as a NumPy uint32 array that
+        takes over the C++ result buffer instead of a list.
+        """
+        if as_array:
+            return self._storage.find_in_rects(((x1, y1, x2, y2),))[0]
+        return self._drawing.find_objects_in_rect(x1, y1, x2, y2)
+
+    def circle_columns(self) -> dict:
+        """Zero-copy NumPy views of every circle's x, y, radius and fill_rgba.
+
+        The arrays alias the C++ storage, so writes go straight through.
+        Adding circles may reallocate that storage - fetch the views again
+        after any add.
+        """
+        return self._storage.circle_columns()
+
+    def find_objects_at_points(self, xs, ys, tolerance: float = 1.0):
+        """Run many point queries in one call.
+
+        Returns:
+            (ids, offsets) NumPy arrays - the objects at point i are
+            ids[offsets[i]:offsets[i + 1]]
+        """
+        return self._storage.find_at_points(xs, ys, tolerance)
+
+    def find_objects_in_rects(self, rects):
+        """Run many rectangle queries in one call.
+
+        Args:
+            rects: (n, 4) array of (x1, y1, x2, y2) rows
+
+        Returns:
+            (ids, offsets) NumPy arrays - the objects in rect i are
+            ids[offsets[i]:offsets[i + 1]]
+        """
+        return self._storage.find_in_rects(rects)
 
     def set_fill_color(self, object_ids: list[int], color: tuple[int, int, int]):
-        """Set fill color for multiple objects."""
-        storage = self._drawing.get_storage()
-        cpp_color = drawing_cpp.Color(*color)
+        """Set fill color for multiple objects.
+
+        object_ids may be a list or a NumPy uint32 array (e.g. from add_*_batch),
+        which is passed to C++ as a single buffer.
+        """
+        storage = self._storage
+        cpp_color = _color(*color)
         storage.set_fill_color(object_ids, cpp_color)
 
     def set_stroke_color(self, object_ids: list[int], color: tuple[int, int, int]):
-        """Set stroke color for multiple objects."""
-        storage = self._drawing.get_storage()
-        cpp_color = drawing_cpp.Color(*color)
+        """Set stroke color for multiple objects (list or NumPy uint32 id array)."""
+        storage = self._storage
+        cpp_color = _color(*color)
         storage.set_stroke_color(object_ids, cpp_color)
 
     def set_opacity(self, object_ids: list[int], opacity: float):
-        """Set opacity for multiple objects."""
-        storage = self._drawing.get_storage()
+        """Set opacity for multiple objects (list or NumPy uint32 id array)."""
+        storage = self._storage
         storage.set_opacity(object_ids, opacity)
 
     @property
@@ -439,22 +657,47 @@ class DrawingCpp:
         """Get memory usage in bytes."""
         return self._drawing.memory_usage()
 
-    def save_binary(self, filename: str) -> bool:
-        """Save drawing in compact binary format."""
+    def save_binary(self, filename: str) -> int:
+        """Save drawing in compact binary format, returns bytes written (0 on failure)."""
         return drawing_cpp.save_binary(self._drawing, filename)
 
+    def to_bytes(self) -> bytes:
+        """Serialize drawing to the binary format in memory."""
+        return drawing_cpp.save_binary_bytes(self._drawing)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> Optional["DrawingCpp"]:
+        """Load drawing from binary data produced by to_bytes or save_binary."""
+        cpp_drawing = drawing_cpp.load_binary_bytes(data)
+        if cpp_drawing:
+            return cls._wrap(cpp_drawing)
+        return None
+
     def save_json(self, filename: str):
         """Save drawing in JSON format (compatible with Python version)."""
         drawing_cpp.save_json(self._drawing, filename)
 
     @classmethod
     def load_binary(cls, filename: str) -> Optional["DrawingCpp"]:
-        """Load drawing from binary format."""
-        cpp_drawing = drawing_cpp.load_binary(filename)
+        """Load drawing from binary format, memory-mapping large files."""
+        try:
+            size = os.path.getsize(filename)
+        except OSError:
+            return None
+        if size >= _MMAP_LOAD_THRESHOLD:
+            cpp_drawing = drawing_cpp.load_binary_mmap(filename)
+        else:
+            cpp_drawing = drawing_cpp.load_binary(filename)
         if cpp_drawing:
-            wrapper = cls()
-            wrapper._drawing = cpp_drawing
-            return wrapper
+            return cls._wrap(cpp_drawing)
+        return None
+
+    @classmethod
+    def load_binary_mmap(cls, filename: str) -> Optional["DrawingCpp"]:
+        """Load drawing from binary format by memory-mapping the file."""
+        cpp_drawing = drawing_cpp.load_binary_mmap(filename)
+        if cpp_drawing:
+            return cls._wrap(cpp_drawing)
         return None
 
     def get_bounding_box(self) -> tuple[float, float, float, float]:
@@ -470,6 +713,8 @@ def compare_performance():
     """Compare performance between Python and C++ implementations."""
     import time
 
+    import numpy as np
+
     print("Performance Comparison: Python vs C++")
     print("=====================================")
     print("Size of Python Circle object: ~800 bytes (estimated)")
@@ -478,46 +723,65 @@ def compare_performance():
 
     # Test object creation
     num_objects = 100000
+    i = np.arange(num_objects)
+    xs = (i % 1000).astype(np.float32)
+    ys = (i // 1000).astype(np.float32)
+    radii = np.full(num_objects, 5, dtype=np.float32)
 
-    # C++ version
-    start = time.time()
+    # C++ version, batched: one call for all circles
+    start = time.perf_counter_ns()
     cpp_drawing = DrawingCpp(1000, 1000)
-    for i in range(num_objects):
-        cpp_drawing.add_circle(i % 1000, i // 1000, 5)
-    cpp_time = time.time() - start
+    cpp_drawing.add_circles_batch(xs, ys, radii)
+    cpp_time = (time.perf_counter_ns() - start) / 1e9
     cpp_memory = cpp_drawing.memory_usage
 
+    # C++ version, one raw binding call per circle (no wrapper overhead)
+    per_call_drawing = drawing_cpp.Drawing(1000, 1000)
+    add_circle = per_call_drawing.add_circle
+    coords = list(zip(xs.tolist(), ys.tolist()))
+    start = time.perf_counter_ns()
+    for x, y in coords:
+        add_circle(x, y, 5.0, 0)
+    per_call_time = (time.perf_counter_ns() - start) / 1e9
+
     print(f"C++ Performance ({num_objects} circles):")
-    print(f"  Creation time: {cpp_time*1000:.1f} ms")
+    print(f"  Creation time (batched): {cpp_time*1000:.1f} ms")
+    print(f"  Creation time (per call): {per_call_time*1000:.1f} ms")
     print(f"  Memory usage: {cpp_memory / 1024 / 1024:.1f} MB")
     print(f"  Per object: {cpp_memory / num_objects:.1f} bytes")
-    print(f"  Objects/second: {num_objects / cpp_time:,.0f}")
+    print(f"  Objects/second (batched): {num_objects / cpp_time:,.0f}")
+    print(f"  Objects/second (per call): {num_objects / per_call_time:,.0f}")
 
-    # Test serialization
-    start = time.time()
-    cpp_drawing.save_binary("test_cpp.bin")
-    save_time = time.time() - start
+    # Test serialization in memory, so only the encoder is timed
+    start = time.perf_counter_ns()
+    data = cpp_drawing.to_bytes()
+    save_time = (time.perf_counter_ns() - start) / 1e9
 
-    import os
+    start = time.perf_counter_ns()
+    DrawingCpp.from_bytes(data)
+    load_time = (time.perf_counter_ns() - start) / 1e9
 
-    file_size = os.path.getsize("test_cpp.bin")
-
-    print("\nSerialization:")
+    print("\nSerialization (in memory):")
     print(f"  Save time: {save_time*1000:.1f} ms")
-    print(f"  File size: {file_size / 1024 / 1024:.1f} MB")
-    print(f"  Bytes/object: {file_size / num_objects:.1f}")
-
-    # Test loading
-    start = time.time()
-    DrawingCpp.load_binary("test_cpp.bin")
-    load_time = time.time() - start
-
+    print(f"  Size: {len(data) / 1024 / 1024:.1f} MB")
+    print(f"  Bytes/object: {len(data) / num_objects:.1f}")
     print(f"  Load time: {load_time*1000:.1f} ms")
     print(f"  Throughput: {num_objects / (save_time + load_time):,.0f} objects/second")
 
-    # Cleanup
+    # Same round trip through a file, which adds the filesystem and page cache
+    start = time.perf_counter_ns()
+    cpp_drawing.save_binary("test_cpp.bin")
+    disk_save_time = (time.perf_counter_ns() - start) / 1e9
+
+    start = time.perf_counter_ns()
+    DrawingCpp.load_binary("test_cpp.bin")
+    disk_load_time = (time.perf_counter_ns() - start) / 1e9
     os.remove("test_cpp.bin")
 
+    print("\nSerialization (disk):")
+    print(f"  Save time: {disk_save_time*1000:.1f} ms")
+    print(f"  Load time: {disk_load_time*1000:.1f} ms")
+
 
 if __name__ == "__main__":
     compare_performance()
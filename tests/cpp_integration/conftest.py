@@ -0,0 +1,12 @@
+"""
+Pytest configuration for the C++ integration tests
+"""
+
+import sys
+from pathlib import Path
+
+# build_ext --inplace puts the drawing_cpp extension in cpp/; add it once
+# so every module here imports it regardless of the working directory
+CPP_DIR = str(Path(__file__).resolve().parents[2] / "cpp")
+if CPP_DIR not in sys.path:
+    sys.path.insert(0, CPP_DIR)
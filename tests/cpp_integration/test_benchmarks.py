@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""Per-operation timings for the C++ drawing bindings (needs pytest-benchmark).
+
+Run with:
+    pytest tests/cpp_integration/test_benchmarks.py --benchmark-columns=min,median,ops,iqr
+"""
+
+import numpy as np
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+import drawing_cpp as dc  # noqa: E402
+
+# Objects created up front, matching the scale of test_new_features.test_performance
+NUM_OBJECTS = 1000
+
+
+@pytest.fixture
+def scene():
+    """Drawing pre-filled with circles, plus a gradient and an object to target"""
+    drawing = dc.Drawing(1000, 1000)
+    stops = [dc.GradientStop(0.0, dc.Color(255, 0, 0)), dc.GradientStop(1.0, dc.Color(0, 255, 0))]
+    gradient_id = drawing.add_linear_gradient(stops)
+    for i in range(NUM_OBJECTS):
+        drawing.add_circle(i % 800, (i * 2) % 600, 10)
+    return drawing, gradient_id, drawing.get_layer(0).get_objects()[0]
+
+
+OPERATIONS = {
+    "add_circle": lambda d, oid, gid: d.add_circle(400.0, 300.0, 10.0),
+    "add_rectangle": lambda d, oid, gid: d.add_rectangle(100.0, 100.0, 20.0, 15.0, 5.0),
+    "add_line": lambda d, oid, gid: d.add_line(0.0, 0.0, 100.0, 50.0, dc.LineStyle.Dashed),
+    "set_object_name": lambda d, oid, gid: d.set_object_name(oid, "circle"),
+    "set_object_metadata": lambda d, oid, gid: d.set_object_metadata(oid, "batch", "test"),
+    "set_object_gradient": lambda d, oid, gid: d.set_object_gradient(oid, gid),
+}
+
+
+@pytest.mark.parametrize("operation", list(OPERATIONS))
+def test_perf(benchmark, scene, operation):
+    """Time a single call of one operation"""
+    drawing, gradient_id, object_id = scene
+    benchmark(OPERATIONS[operation], drawing, object_id, gradient_id)
+
+
+def test_perf_add_circles(benchmark):
+    """Time one add_circles call filling a fresh drawing with NUM_OBJECTS circles"""
+    i = np.arange(NUM_OBJECTS)
+    xs = (i % 800).astype(np.float32)
+    ys = ((i * 2) % 600).astype(np.float32)
+    radii = (10 + i % 20).astype(np.float32)
+    benchmark(lambda: dc.Drawing(1000, 1000).add_circles(xs, ys, radii))
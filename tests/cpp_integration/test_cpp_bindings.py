@@ -1,7 +1,11 @@
 #!/usr/bin/env python3
 """Test the C++ Python bindings."""
 
+import os
 import sys
+import tempfile
+
+import pytest
 
 sys.path.insert(0, "cpp")  # Add cpp directory to path
 
@@ -43,26 +47,28 @@ def test_basic_functionality():
 
     # Test serialization
     print("\nTesting Serialization:")
-    drawing.save_binary("test_cpp.bin")
-    drawing.save_json("test_cpp.json")
-
-    import os
+    with tempfile.TemporaryDirectory() as tmp:
+        bin_path = os.path.join(tmp, "test_cpp.bin")
+        json_path = os.path.join(tmp, "test_cpp.json")
+        drawing.save_binary(bin_path)
+        drawing.save_json(json_path)
 
-    bin_size = os.path.getsize("test_cpp.bin")
-    json_size = os.path.getsize("test_cpp.json")
+        bin_size = os.path.getsize(bin_path)
+        json_size = os.path.getsize(json_path)
 
-    print(f"Binary file size: {bin_size} bytes")
-    print(f"JSON file size: {json_size} bytes")
-    print(f"JSON is {json_size/bin_size:.1f}x larger than binary")
+        print(f"Binary file size: {bin_size} bytes")
+        print(f"JSON file size: {json_size} bytes")
+        print(f"JSON is {json_size/bin_size:.1f}x larger than binary")
 
-    # Test loading
-    loaded = DrawingCpp.load_binary("test_cpp.bin")
-    if loaded:
-        print(f"Successfully loaded: {loaded}")
+        # Test loading
+        loaded = DrawingCpp.load_binary(bin_path)
+        if loaded:
+            print(f"Successfully loaded: {loaded}")
 
-    # Cleanup
-    os.remove("test_cpp.bin")
-    os.remove("test_cpp.json")
+        mapped = DrawingCpp.load_binary_mmap(bin_path)
+        assert mapped is not None
+        assert mapped.total_objects == loaded.total_objects
+        assert mapped.get_bounding_box() == loaded.get_bounding_box()
 
     print("\nSize information:")
     sizes = drawing_cpp.get_compact_sizes()
@@ -70,8 +76,157 @@ def test_basic_functionality():
         print(f"  {name}: {size} bytes")
 
 
+def test_batch_creation():
+    """Bulk add_* calls register every object on the layer with its geometry."""
+    drawing = DrawingCpp(800, 600)
+    rect_ids = drawing.add_rectangles_batch(
+        [0.0, 10.0], [0.0, 20.0], [5.0, 5.0], [5.0, 5.0],
+        fill_colors=[[255, 0, 0, 255], [0, 0, 255, 128]],
+    )
+    line_ids = drawing.add_lines_batch([100.0], [100.0], [200.0], [150.0])
+
+    assert drawing.total_objects == 3
+    assert list(drawing._drawing.get_layer(0).get_objects()) == list(rect_ids) + list(line_ids)
+
+    storage = drawing._drawing.get_storage()
+    bbox = drawing_cpp.BatchOperations.calculate_bounding_box(storage, list(rect_ids) + list(line_ids))
+    assert (bbox.min_x, bbox.min_y, bbox.max_x, bbox.max_y) == (0, 0, 200, 150)
+
+    with pytest.raises(ValueError, match="equal length"):
+        drawing.add_lines_batch([0.0, 1.0], [0.0], [1.0], [1.0])
+    with pytest.raises(ValueError, match="one row per object"):
+        drawing.add_circles_batch([0.0], [0.0], 1.0, fill_colors=[[0, 0, 0, 255]] * 2)
+    assert drawing.total_objects == 3
+
+    drawing.set_fill_color(rect_ids, (0, 255, 0))
+    drawing.set_opacity(rect_ids, 0.5)
+
+    text_ids = drawing.add_texts_batch([10.0, 20.0], [30.0, 40.0], ["a", "b"], text_align="Center")
+    assert len(text_ids) == 2
+    assert drawing.total_objects == 5
+
+    group_ids = drawing.add_groups_batch([[rect_ids[0], text_ids[0]], [rect_ids[1], text_ids[1]]])
+    assert len(group_ids) == 2
+    assert drawing.total_objects == 7
+
+    PathCommand = drawing_cpp.PathCommand
+    svg_ids = drawing.add_paths_batch(["M 0 0 L 5 5 Z", "M 10 10 L 15 15 Z"])
+    op_ids = drawing.add_path_ops_batch(
+        [PathCommand.MoveTo, PathCommand.LineTo, PathCommand.Close],
+        [[0.0, 0.0, 5.0, 5.0], [10.0, 10.0, 15.0, 15.0]],
+    )
+    assert drawing.total_objects == 11
+    for svg_id, op_id in zip(svg_ids, op_ids):
+        svg_box = drawing_cpp.BatchOperations.calculate_bounding_box(storage, [svg_id])
+        op_box = drawing_cpp.BatchOperations.calculate_bounding_box(storage, [op_id])
+        assert (svg_box.min_x, svg_box.min_y, svg_box.max_x, svg_box.max_y) == (
+            op_box.min_x, op_box.min_y, op_box.max_x, op_box.max_y
+        )
+
+    with pytest.raises(ValueError, match="one row of the commands' parameters per path"):
+        drawing.add_path_ops_batch([PathCommand.MoveTo], [[0.0, 0.0, 1.0]])
+
+
+def test_path_parameter_limit():
+    """Bulk path adds past the 16-bit parameter offsets fail without adding anything."""
+    drawing = DrawingCpp(800, 600)
+    with pytest.raises(ValueError, match="16-bit offset range"):
+        drawing.add_paths_batch(["M 0 0 L 1 1"] * 20000)
+    PathCommand = drawing_cpp.PathCommand
+    with pytest.raises(ValueError, match="16-bit offset range"):
+        drawing.add_path_ops_batch(
+            [PathCommand.MoveTo, PathCommand.LineTo, PathCommand.LineTo], [[1.0] * 6] * 20000
+        )
+    assert drawing.total_objects == 0
+
+
+def test_group_child_limit():
+    """Bulk groups wider than the 16-bit child count are rejected, not wrapped."""
+    drawing = DrawingCpp(800, 600)
+    circle_id = drawing.add_circle(0, 0, 1)
+    with pytest.raises(ValueError, match="16-bit count"):
+        drawing.add_groups_batch([[circle_id] * 65537])
+    assert drawing.total_objects == 1
+
+
+def test_batch_queries():
+    """Batched point/rect queries match the one-at-a-time results."""
+    drawing = DrawingCpp(800, 600)
+    drawing.add_circle(100, 100, 50)
+    drawing.add_rectangle(200, 200, 100, 80)
+    drawing.add_line(50, 50, 350, 350)
+
+    points = [(150, 100), (200, 200), (700, 500)]
+    ids, offsets = drawing.find_objects_at_points([p[0] for p in points], [p[1] for p in points], 5.0)
+    assert len(offsets) == len(points) + 1
+    for i, (x, y) in enumerate(points):
+        assert list(ids[offsets[i]:offsets[i + 1]]) == drawing.find_objects_at_point(x, y, 5.0)
+
+    rects = [(0, 0, 200, 200), (600, 400, 700, 500)]
+    ids, offsets = drawing.find_objects_in_rects(rects)
+    for i, rect in enumerate(rects):
+        assert list(ids[offsets[i]:offsets[i + 1]]) == drawing.find_objects_in_rect(*rect)
+
+    storage = drawing._drawing.get_storage()
+    poly_id = drawing.add_polygon([(400, 400), (420, 400), (410, 420)])
+    assert storage.find_in_rect(405, 405, 415, 415) == [poly_id]
+    bbox = drawing_cpp.BoundingBox(0, 0, 200, 200)
+    assert storage.find_in_rect(0, 0, 200, 200) == storage.find_in_rect(bbox)
+
+
+def test_circle_columns():
+    """Circle column views alias the C++ storage."""
+    drawing = DrawingCpp(800, 600)
+    drawing.add_circles_batch([10.0, 20.0], [30.0, 40.0], 5.0)
+
+    columns = drawing.circle_columns()
+    assert list(columns["x"]) == [10.0, 20.0]
+    assert columns["fill_rgba"].shape == (2, 4)
+
+    columns["radius"][:] = 50.0
+    assert len(drawing.find_objects_in_rect(0, 0, 1, 1, as_array=True)) == 2
+
+
+def test_all_pair_collisions():
+    """R-tree collision pairs come back as an (n, 2) id array."""
+    drawing = DrawingCpp(800, 600)
+    a = drawing.add_circle(100, 100, 10)
+    b = drawing.add_circle(115, 100, 10)
+    drawing.add_circle(500, 500, 10)
+
+    storage = drawing._drawing.get_storage()
+    pairs = drawing_cpp.BatchOperations.all_pair_collisions(storage)
+    assert pairs.shape == (1, 2)
+    assert sorted(pairs[0]) == sorted([a, b])
+    assert len(drawing_cpp.BatchOperations.all_pair_collisions(storage, 1000.0)) == 3
+    assert drawing_cpp.BatchOperations.count_pair_collisions(storage) == 1
+    assert drawing_cpp.BatchOperations.count_pair_collisions(storage, 1000.0) == 3
+
+
+def test_parallel_loads():
+    """Binary loads run without the GIL, so a thread pool can load side by side."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    drawing = DrawingCpp(800, 600)
+    drawing.add_circles_batch(list(range(1000)), list(range(1000)), 5)
+    data = drawing.to_bytes()
+
+    with ThreadPoolExecutor(4) as pool:
+        loaded = list(pool.map(DrawingCpp.from_bytes, [data] * 8))
+    assert [d.total_objects for d in loaded] == [drawing.total_objects] * 8
+    xs = list(drawing.circle_columns()["x"])
+    assert all(list(d.circle_columns()["x"]) == xs for d in loaded)
+
+
 if __name__ == "__main__":
     test_basic_functionality()
+    test_batch_creation()
+    test_path_parameter_limit()
+    test_group_child_limit()
+    test_batch_queries()
+    test_circle_columns()
+    test_all_pair_collisions()
+    test_parallel_loads()
     print("\n" + "=" * 50 + "\n")
     compare_performance()
 
@@ -2,8 +2,15 @@
 """Test the Group object functionality."""
 
 import drawing_cpp
+import numpy as np
 from python.drawing_cpp_wrapper import DrawingCpp
-import json
+import tempfile
+from pathlib import Path
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 
 
 def test_group_basic():
@@ -47,32 +54,39 @@ def test_group_basic():
     objects_in_area = drawing.find_objects_in_rect(50, 50, 250, 200)
     print(f"\nObjects in area (50,50)-(250,200): {objects_in_area}")
 
-    # Test serialization
+    # Test serialization through the compact binary format, in memory
     print("\nTesting serialization...")
-    drawing.save_binary("test_groups.bin")
-    drawing.save_json("test_groups.json")
-
-    # Load and verify
-    loaded = DrawingCpp.load_binary("test_groups.bin")
-    if loaded:
-        print(f"Loaded drawing: {loaded.total_objects} objects")
+    loaded = DrawingCpp.from_bytes(drawing.to_bytes())
+    assert loaded is not None
+    assert loaded.total_objects == drawing.total_objects
+    print(f"Loaded drawing: {loaded.total_objects} objects")
 
-        # Check JSON output
-        with open("test_groups.json", "r") as f:
-            json_data = json.load(f)
-            print("\nJSON structure:")
-            for layer in json_data["layers"]:
-                for obj in layer["objects"]:
-                    if obj.get("children") is not None:
-                        print(f"  Group {obj['id']} has {len(obj['children'])} children")
+    print("\nGroup basic tests completed successfully!")
 
-    # Cleanup
-    import os
 
-    os.remove("test_groups.bin")
-    os.remove("test_groups.json")
+def test_group_json_compat():
+    """Test that groups and their children are written to JSON."""
+    print("\nTesting group JSON output...")
 
-    print("\nGroup basic tests completed successfully!")
+    drawing = DrawingCpp(800, 600)
+    circle = drawing.add_circle(100, 100, 50)
+    rect = drawing.add_rectangle(150, 150, 100, 50)
+    drawing.add_group([circle, rect])
+
+    with tempfile.TemporaryDirectory() as tmp:
+        json_path = Path(tmp) / "test_groups.json"
+        drawing.save_json(str(json_path))
+        json_data = json_loads(json_path.read_bytes())
+
+    groups = [
+        obj
+        for layer in json_data["layers"]
+        for obj in layer["objects"]
+        if obj.get("children") is not None
+    ]
+    for group in groups:
+        print(f"  Group {group['id']} has {len(group['children'])} children")
+    assert [len(group["children"]) for group in groups] == [2]
 
 
 def test_group_operations():
@@ -114,19 +128,19 @@ def test_group_memory():
 
     drawing = DrawingCpp(1000, 1000)
 
-    # Create many groups with objects
+    # Create many groups with objects, 3 objects per group, as columns
     num_groups = 1000
-    for i in range(num_groups):
-        # Create 3 objects per group
-        objs = []
-        x = (i % 50) * 20
-        y = (i // 50) * 20
-        objs.append(drawing.add_circle(x, y, 5))
-        objs.append(drawing.add_rectangle(x + 5, y, 5, 5))
-        objs.append(drawing.add_line(x, y + 10, x + 10, y + 10))
-
-        # Create group
-        drawing.add_group(objs)
+    i = np.arange(num_groups)
+    x = (i % 50) * 20
+    y = (i // 50) * 20
+    circle_ids = drawing.add_circles_batch(x, y, 5)
+    size = np.full(num_groups, 5)
+    rect_ids = drawing.add_rectangles_batch(x + 5, y, size, size)
+    line_ids = drawing.add_lines_batch(x, y + 10, x + 10, y + 10)
+
+    # One group per row
+    group_ids = drawing.add_groups_batch(np.column_stack([circle_ids, rect_ids, line_ids]))
+    assert len(group_ids) == num_groups
 
     total_objects = drawing.total_objects
     total_memory = drawing.memory_usage
@@ -140,6 +154,7 @@ def test_group_memory():
 
 if __name__ == "__main__":
     test_group_basic()
+    test_group_json_compat()
     test_group_operations()
     test_group_memory()
 
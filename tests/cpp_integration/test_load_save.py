@@ -1,6 +1,6 @@
 """Test saving and loading drawing from disk"""
 
-import json
+import tempfile
 from pathlib import Path
 from python.data import Drawing, Layer, Circle, Point, Color, FillStyle
 
@@ -17,39 +17,28 @@ def test_save_and_load():
     layer.add_object(circle)
     drawing.add_layer(layer)
 
-    # Save to JSON
-    output_dir = Path("test_output")
-    output_dir.mkdir(exist_ok=True)
+    # Save to JSON in a scratch directory that is removed even if a check fails
+    with tempfile.TemporaryDirectory() as tmp:
+        json_path = Path(tmp) / "test_drawing.json"
+        saved_json = drawing.to_json()
+        json_path.write_text(saved_json)
 
-    json_path = output_dir / "test_drawing.json"
-    with open(json_path, "w") as f:
-        json.dump(drawing.model_dump(), f, indent=2, default=str)
+        print(f"Saved drawing to: {json_path}")
 
-    print(f"Saved drawing to: {json_path}")
+        # Load from JSON straight into the model, without an intermediate json.load
+        loaded_drawing = Drawing.from_json(json_path.read_bytes())
 
-    # Load from JSON
-    with open(json_path, "r") as f:
-        data = json.load(f)
+        print(f"\nLoaded drawing: {loaded_drawing.name}")
+        print(f"Size: {loaded_drawing.width}x{loaded_drawing.height}")
+        print(f"Layers: {len(loaded_drawing.layers)}")
+        print(f"Objects in first layer: {len(loaded_drawing.layers[0].objects)}")
 
-    # Create Drawing object from loaded data
-    loaded_drawing = Drawing.model_validate(data)
+        # Verify the loaded data: every field of every layer and object
+        # round-trips, and re-serializing gives back the same document
+        assert loaded_drawing == drawing
+        assert loaded_drawing.to_json() == saved_json
 
-    print(f"\nLoaded drawing: {loaded_drawing.name}")
-    print(f"Size: {loaded_drawing.width}x{loaded_drawing.height}")
-    print(f"Layers: {len(loaded_drawing.layers)}")
-    print(f"Objects in first layer: {len(loaded_drawing.layers[0].objects)}")
-
-    # Verify the loaded data
-    assert loaded_drawing.name == drawing.name
-    assert loaded_drawing.width == drawing.width
-    assert loaded_drawing.height == drawing.height
-    assert len(loaded_drawing.layers) == len(drawing.layers)
-
-    print("\n✓ Save and load test passed!")
-
-    # Clean up
-    json_path.unlink()
-    output_dir.rmdir()
+        print("\n✓ Save and load test passed!")
 
 
 if __name__ == "__main__":
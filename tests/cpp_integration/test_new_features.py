@@ -7,6 +7,8 @@ gradients, patterns, object names, and metadata.
 import sys
 import os
 
+import numpy as np
+
 sys.path.insert(0, "cpp/build")
 import drawing_cpp as dc
 
@@ -26,14 +28,14 @@ def test_basic_features():
     print(f"✓ Created rounded rectangle: {rect_id}")
 
     # Test closed polygon flag
-    points = [dc.Point(0, 0), dc.Point(100, 0), dc.Point(50, 100)]
+    points = np.array([[0, 0], [100, 0], [50, 100]], dtype=np.float32)
     closed_poly_id = drawing.add_polygon(points, True)  # closed
     open_poly_id = drawing.add_polygon(points, False)  # open
     print(f"✓ Created closed polygon: {closed_poly_id}")
     print(f"✓ Created open polygon: {open_poly_id}")
 
     # Test polyline with line style
-    polyline_points = [dc.Point(200, 200), dc.Point(250, 220), dc.Point(300, 200)]
+    polyline_points = np.array([[200, 200], [250, 220], [300, 200]], dtype=np.float32)
     polyline_id = drawing.add_polyline(polyline_points, dc.LineStyle.Dotted)
     print(f"✓ Created dotted polyline: {polyline_id}")
 
@@ -134,9 +136,9 @@ def test_metadata():
 
     # Create objects and assign metadata
     circle_id = drawing.add_circle(100, 100, 50)
-    drawing.set_object_metadata(circle_id, "type", "logo")
-    drawing.set_object_metadata(circle_id, "layer", "graphics")
-    drawing.set_object_metadata(circle_id, "importance", "high")
+    drawing.set_object_metadata(
+        circle_id, {"type": "logo", "layer": "graphics", "importance": "high"}
+    )
 
     rect_id = drawing.add_rectangle(200, 200, 100, 80)
     drawing.set_object_metadata(rect_id, "type", "button")
@@ -150,6 +152,7 @@ def test_metadata():
     # Test getting all metadata
     all_circle_meta = drawing.get_all_object_metadata(circle_id)
     print(f"✓ All circle metadata: {all_circle_meta}")
+    assert all_circle_meta == [("type", "logo"), ("layer", "graphics"), ("importance", "high")]
 
     all_rect_meta = drawing.get_all_object_metadata(rect_id)
     print(f"✓ All rectangle metadata: {all_rect_meta}")
@@ -210,33 +213,47 @@ def test_performance():
 
     import time
 
+    import numpy as np
+
     drawing = dc.Drawing(1000, 1000)
 
     # Create gradient once
     stops = [dc.GradientStop(0.0, dc.Color(255, 0, 0)), dc.GradientStop(1.0, dc.Color(0, 255, 0))]
     gradient_id = drawing.add_linear_gradient(stops)
 
-    # Time object creation with new features
-    start_time = time.time()
-
-    for i in range(1000):
-        # Create various objects with new features
-        circle_id = drawing.add_circle(i % 800, (i * 2) % 600, 10)
-        drawing.set_object_name(circle_id, f"circle_{i}")
-        drawing.set_object_metadata(circle_id, "batch", "test")
-        drawing.set_object_gradient(circle_id, gradient_id)
+    # Geometry for every object up front, so each shape type is one call
+    i = np.arange(1000)
+    even = i[::2]
+    thirds = i[::3]
 
-        if i % 2 == 0:
-            rect_id = drawing.add_rectangle(i % 700, (i * 3) % 500, 20, 15, 5.0)  # rounded
-            drawing.set_object_name(rect_id, f"rect_{i}")
-
-        if i % 3 == 0:
-            line_id = drawing.add_line(0, i % 600, 100, (i + 50) % 600, dc.LineStyle.Dashed)
-            drawing.set_object_metadata(line_id, "style", "dashed")
-
-    end_time = time.time()
-
-    print(f"✓ Created 1000+ objects with full features in {(end_time - start_time)*1000:.2f}ms")
+    # Time object creation with new features
+    start_time = time.perf_counter_ns()
+
+    circle_ids = drawing.add_circles(i % 800, (i * 2) % 600, np.full(len(i), 10.0))
+    rect_ids = drawing.add_rectangles(
+        even % 700, (even * 3) % 500, np.full(len(even), 20.0), np.full(len(even), 15.0),
+        corner_radius=5.0,  # rounded
+    )
+    line_ids = drawing.add_lines(
+        np.zeros(len(thirds)), thirds % 600, np.full(len(thirds), 100.0), (thirds + 50) % 600,
+        line_style=dc.LineStyle.Dashed,
+    )
+
+    # Bound methods looked up once rather than on every iteration
+    set_name = drawing.set_object_name
+    set_metadata = drawing.set_object_metadata
+    set_gradient = drawing.set_object_gradient
+    for n, circle_id in enumerate(circle_ids.tolist()):
+        set_name(circle_id, f"circle_{n}")
+        set_gradient(circle_id, gradient_id)
+    for n, rect_id in zip(even.tolist(), rect_ids.tolist()):
+        set_name(rect_id, f"rect_{n}")
+    set_metadata(circle_ids, {"batch": "test"})
+    set_metadata(line_ids, {"style": "dashed"})
+
+    elapsed_ms = (time.perf_counter_ns() - start_time) / 1e6
+
+    print(f"✓ Created 1000+ objects with full features in {elapsed_ms:.2f}ms")
     print(f"✓ Total objects: {drawing.total_objects()}")
     print(f"✓ Memory usage: {drawing.memory_usage() / 1024 / 1024:.2f} MB")
 
@@ -3,7 +3,15 @@
 
 import drawing_cpp
 from python.drawing_cpp_wrapper import DrawingCpp
-import json
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 
 
 def test_path_basic():
@@ -51,36 +59,36 @@ def test_path_basic():
     objects_at_center = drawing.find_objects_at_point(200, 150, tolerance=60)
     print(f"\nObjects near (200, 150): {objects_at_center}")
 
-    # Test serialization
+    # Test serialization through the compact binary format, in memory
     print("\nTesting serialization...")
-    drawing.save_binary("test_path.bin")
-    drawing.save_json("test_path.json")
-
-    # Load and verify
-    loaded = DrawingCpp.load_binary("test_path.bin")
-    if loaded:
-        print(f"Loaded drawing: {loaded.total_objects} objects")
-
-        # Check JSON output
-        with open("test_path.json", "r") as f:
-            json_data = json.load(f)
-            print("\nFirst path in JSON:")
-            if json_data["layers"] and json_data["layers"][0]["objects"]:
-                first_obj = json_data["layers"][0]["objects"][0]
-                print(f"  Path data: {first_obj.get('d', 'N/A')}")
+    loaded = DrawingCpp.from_bytes(drawing.to_bytes())
+    assert loaded is not None
+    assert loaded.total_objects == drawing.total_objects
+    print(f"Loaded drawing: {loaded.total_objects} objects")
 
     # Test arc paths
     print("\nTesting arc paths...")
     arc_path = drawing.add_path("M 100 500 A 50 50 0 0 1 200 500", stroke_color=(0, 255, 255))
     print(f"Created arc path: ID={arc_path}")
 
-    # Cleanup
-    import os
+    print("\nPath tests completed successfully!")
 
-    os.remove("test_path.bin")
-    os.remove("test_path.json")
 
-    print("\nPath tests completed successfully!")
+def test_path_json_compat():
+    """Test that path data is written to JSON."""
+    print("\nTesting path JSON output...")
+
+    drawing = DrawingCpp(800, 600)
+    drawing.add_path("M 10 20 L 30 40", fill_color=(255, 0, 0))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        json_path = Path(tmp) / "test_path.json"
+        drawing.save_json(str(json_path))
+        json_data = json_loads(json_path.read_bytes())
+
+    first_obj = json_data["layers"][0]["objects"][0]
+    print(f"  Path data: {first_obj.get('d', 'N/A')}")
+    assert first_obj["d"].startswith("M 10")
 
 
 def test_path_memory():
@@ -91,10 +99,12 @@ def test_path_memory():
 
     # Create many simple paths
     num_paths = 10000
-    for i in range(num_paths):
-        x = (i % 100) * 10
-        y = (i // 100) * 10
-        drawing.add_path(f"M {x} {y} L {x+5} {y+5}", fill_color=(255, 0, 0))
+    i = np.arange(num_paths)
+    x = (i % 100) * 10.0
+    y = (i // 100) * 10.0
+    commands = [drawing_cpp.PathCommand.MoveTo, drawing_cpp.PathCommand.LineTo]
+    params = np.column_stack([x, y, x + 5, y + 5]).astype(np.float32)
+    drawing.add_path_ops_batch(commands, params, fill_color=(255, 0, 0))
 
     total_memory = drawing.memory_usage
     avg_memory = total_memory / num_paths
@@ -107,5 +117,6 @@ def test_path_memory():
 
 if __name__ == "__main__":
     test_path_basic()
+    test_path_json_compat()
     test_path_memory()
 
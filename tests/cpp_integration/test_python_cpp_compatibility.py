@@ -5,14 +5,20 @@ This test validates that all Python features work identically in the C++ version
 """
 
 import sys
-import os
-import json
+import time
 
-sys.path.insert(0, "cpp/build")
+import numpy as np
+import pytest
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 
 # Import Python implementation
 from python.data import (
     Point as PyPoint,
+    BoundingBox as PyBoundingBox,
     Color as PyColor,
     Line as PyLine,
     Circle as PyCircle,
@@ -32,468 +38,229 @@ from python.data import (
     Layer as PyLayer,
 )
 
-# Import C++ implementation
-import drawing_cpp as cpp
+# Import C++ implementation, skipping the module if the extension isn't built
+cpp = pytest.importorskip("drawing_cpp", reason="C++ extension not built")
 
 
-def compare_colors(py_color, cpp_color, tolerance=0):
-    """Compare Python and C++ colors"""
-    return (
-        abs(py_color.r - cpp_color.r) <= tolerance
-        and abs(py_color.g - cpp_color.g) <= tolerance
-        and abs(py_color.b - cpp_color.b) <= tolerance
-        and abs(py_color.a - cpp_color.a) <= tolerance
-    )
+PATH_COMMAND_CODES = {
+    "M": cpp.PathCommand.MoveTo,
+    "L": cpp.PathCommand.LineTo,
+    "C": cpp.PathCommand.CurveTo,
+    "Q": cpp.PathCommand.QuadTo,
+    "A": cpp.PathCommand.ArcTo,
+    "Z": cpp.PathCommand.Close,
+}
+
+
+@pytest.mark.parametrize("channel", ["r", "g", "b"])
+def test_color_channels(channel):
+    """Color channels match; Python alpha is 0-1, C++ alpha is 0-255"""
+    py_color = PyColor(r=255, g=128, b=64, a=0.8)
+    cpp_color = cpp.Color(255, 128, 64, 204)  # 0.8 * 255 = 204
+    assert getattr(py_color, channel) == getattr(cpp_color, channel)
+
+
+def test_color_alpha():
+    py_color = PyColor(r=255, g=128, b=64, a=0.8)
+    cpp_color = cpp.Color(255, 128, 64, 204)
+    assert py_color.a == pytest.approx(cpp_color.a / 255.0, abs=0.01)
 
 
-def compare_points(py_point, cpp_point, tolerance=0.001):
-    """Compare Python and C++ points"""
-    return abs(py_point.x - cpp_point.x) <= tolerance and abs(py_point.y - cpp_point.y) <= tolerance
+@pytest.mark.parametrize("field", ["x", "y"])
+def test_point_coordinates(field):
+    py_point = PyPoint(x=123.45, y=678.90)
+    cpp_point = cpp.Point(123.45, 678.90)
+    assert getattr(py_point, field) == pytest.approx(getattr(cpp_point, field), abs=0.001)
 
 
-def compare_bounding_boxes(py_bbox, cpp_bbox, tolerance=0.001):
-    """Compare Python and C++ bounding boxes"""
-    return (
-        abs(py_bbox.min_x - cpp_bbox.min_x) <= tolerance
-        and abs(py_bbox.min_y - cpp_bbox.min_y) <= tolerance
-        and abs(py_bbox.max_x - cpp_bbox.max_x) <= tolerance
-        and abs(py_bbox.max_y - cpp_bbox.max_y) <= tolerance
+@pytest.mark.parametrize("field", ["min_x", "min_y", "max_x", "max_y"])
+def test_bounding_box_fields(field):
+    py_bbox = PyBoundingBox(min_x=10, min_y=20, max_x=100, max_y=200)
+    cpp_bbox = cpp.BoundingBox(10, 20, 100, 200)
+    assert getattr(py_bbox, field) == pytest.approx(getattr(cpp_bbox, field), abs=0.001)
+
+
+def test_line_styles():
+    """Test LineStyle enum compatibility"""
+    assert PyLineStyle.SOLID.value == "solid"
+    # C++ enum uses different naming convention
+    # SOLID=0, DASHED=1, DOTTED=2, DASHDOT=3
+
+    py_line_solid = PyLine(
+        start_point=PyPoint(x=0, y=0),
+        end_point=PyPoint(x=100, y=100),
+        line_style=PyLineStyle.SOLID,
+    )
+    py_line_dashed = PyLine(
+        start_point=PyPoint(x=0, y=0),
+        end_point=PyPoint(x=100, y=100),
+        line_style=PyLineStyle.DASHED,
     )
 
+    cpp_drawing = cpp.Drawing()
+    cpp_drawing.add_line(0, 0, 100, 100, cpp.LineStyle.Solid)
+    cpp_drawing.add_line(0, 0, 100, 100, cpp.LineStyle.Dashed)
 
-class CompatibilityTester:
-    def __init__(self):
-        self.tests_passed = 0
-        self.tests_failed = 0
-        self.errors = []
-
-    def assert_equal(self, expected, actual, message=""):
-        """Custom assert that tracks test results"""
-        try:
-            if expected == actual:
-                self.tests_passed += 1
-                return True
-            else:
-                self.tests_failed += 1
-                error_msg = f"FAIL: {message} - Expected: {expected}, Got: {actual}"
-                self.errors.append(error_msg)
-                print(f"  ❌ {error_msg}")
-                return False
-        except Exception as e:
-            self.tests_failed += 1
-            error_msg = f"ERROR: {message} - {str(e)}"
-            self.errors.append(error_msg)
-            print(f"  ❌ {error_msg}")
-            return False
-
-    def assert_close(self, expected, actual, tolerance=0.001, message=""):
-        """Assert floating point values are close"""
-        try:
-            if abs(expected - actual) <= tolerance:
-                self.tests_passed += 1
-                return True
-            else:
-                self.tests_failed += 1
-                error_msg = f"FAIL: {message} - Expected: {expected}, Got: {actual} (tolerance: {tolerance})"
-                self.errors.append(error_msg)
-                print(f"  ❌ {error_msg}")
-                return False
-        except Exception as e:
-            self.tests_failed += 1
-            error_msg = f"ERROR: {message} - {str(e)}"
-            self.errors.append(error_msg)
-            print(f"  ❌ {error_msg}")
-            return False
-
-    def test_basic_types(self):
-        """Test basic types: Color, Point, BoundingBox"""
-        print("\n=== Testing Basic Types ===")
-
-        # Test Color (Python uses 0-1 for alpha, C++ uses 0-255)
-        py_color = PyColor(r=255, g=128, b=64, a=0.8)  # Python alpha 0-1
-        cpp_color = cpp.Color(255, 128, 64, 204)  # C++ alpha 0-255 (0.8 * 255 = 204)
-
-        self.assert_equal(py_color.r, cpp_color.r, "Color red component")
-        self.assert_equal(py_color.g, cpp_color.g, "Color green component")
-        self.assert_equal(py_color.b, cpp_color.b, "Color blue component")
-        # Convert C++ alpha to Python scale for comparison
-        self.assert_close(
-            py_color.a, cpp_color.a / 255.0, 0.01, "Color alpha component (normalized)"
-        )
-
-        # Test Point
-        py_point = PyPoint(x=123.45, y=678.90)
-        cpp_point = cpp.Point(123.45, 678.90)
-
-        self.assert_close(py_point.x, cpp_point.x, message="Point X coordinate")
-        self.assert_close(py_point.y, cpp_point.y, message="Point Y coordinate")
-
-        # Test BoundingBox
-        from python.data.models import BoundingBox as PyBoundingBox
-
-        py_bbox = PyBoundingBox(min_x=10, min_y=20, max_x=100, max_y=200)
-        cpp_bbox = cpp.BoundingBox(10, 20, 100, 200)
-
-        self.assert_close(py_bbox.min_x, cpp_bbox.min_x, message="BoundingBox min_x")
-        self.assert_close(py_bbox.min_y, cpp_bbox.min_y, message="BoundingBox min_y")
-        self.assert_close(py_bbox.max_x, cpp_bbox.max_x, message="BoundingBox max_x")
-        self.assert_close(py_bbox.max_y, cpp_bbox.max_y, message="BoundingBox max_y")
-
-        print(f"✓ Basic types: {self.tests_passed - self.tests_failed} tests passed")
-
-    def test_line_styles(self):
-        """Test LineStyle enum compatibility"""
-        print("\n=== Testing LineStyle Enum ===")
-
-        # Test enum values match
-        self.assert_equal(PyLineStyle.SOLID.value, "solid", "Python LineStyle.SOLID")
-        # C++ enum uses different naming convention
-        # SOLID=0, DASHED=1, DOTTED=2, DASHDOT=3
-
-        # Test line creation with styles
-        py_line_solid = PyLine(
-            start_point=PyPoint(x=0, y=0),
-            end_point=PyPoint(x=100, y=100),
-            line_style=PyLineStyle.SOLID,
-        )
-        py_line_dashed = PyLine(
-            start_point=PyPoint(x=0, y=0),
-            end_point=PyPoint(x=100, y=100),
-            line_style=PyLineStyle.DASHED,
-        )
-
-        # Create C++ drawing and add lines
-        cpp_drawing = cpp.Drawing()
-        cpp_line_solid = cpp_drawing.add_line(0, 0, 100, 100, cpp.LineStyle.Solid)
-        cpp_line_dashed = cpp_drawing.add_line(0, 0, 100, 100, cpp.LineStyle.Dashed)
-
-        self.assert_equal(py_line_solid.line_style, PyLineStyle.SOLID, "Python solid line style")
-        self.assert_equal(py_line_dashed.line_style, PyLineStyle.DASHED, "Python dashed line style")
-
-        print(f"✓ LineStyle: {self.tests_passed - self.tests_failed} tests passed")
-
-    def test_drawable_objects(self):
-        """Test all drawable object types"""
-        print("\n=== Testing Drawable Objects ===")
-
-        # Create Python objects
-        py_circle = PyCircle(center=PyPoint(x=100, y=100), radius=50)
-        py_rect = PyRectangle(
-            top_left=PyPoint(x=200, y=200), width=150, height=100, corner_radius=10
-        )
-        py_line = PyLine(
-            start_point=PyPoint(x=0, y=0),
-            end_point=PyPoint(x=50, y=50),
-            line_style=PyLineStyle.DOTTED,
-        )
-        py_ellipse = PyEllipse(center=PyPoint(x=300, y=300), rx=60, ry=40, rotation=45)
-        py_polygon = PyPolygon(
-            points=[PyPoint(x=0, y=0), PyPoint(x=100, y=0), PyPoint(x=50, y=100)], closed=True
-        )
-        py_polyline = PyPolyline(
-            points=[PyPoint(x=0, y=0), PyPoint(x=50, y=50), PyPoint(x=100, y=0)],
-            line_style=PyLineStyle.DASHED,
-        )
-        py_arc = PyArc(center=PyPoint(x=400, y=400), radius=30, start_angle=0, end_angle=90)
-        py_text = PyText(
-            position=PyPoint(x=500, y=500), content="Test Text", font_size=16, font_family="Arial"
-        )
-        py_path = PyPath(
-            commands=[
-                PyPathCommand(command="M", params=[10, 10]),
-                PyPathCommand(command="L", params=[100, 100]),
-                PyPathCommand(command="Z"),
-            ]
-        )
-
-        # Create C++ drawing and objects
-        cpp_drawing = cpp.Drawing()
-        cpp_circle = cpp_drawing.add_circle(100, 100, 50)
-        cpp_rect = cpp_drawing.add_rectangle(200, 200, 150, 100, 10)  # with corner radius
-        cpp_line = cpp_drawing.add_line(0, 0, 50, 50, cpp.LineStyle.Dotted)
-        cpp_ellipse = cpp_drawing.add_ellipse(300, 300, 60, 40, 45)  # rotation in degrees
-        cpp_polygon = cpp_drawing.add_polygon(
-            [cpp.Point(0, 0), cpp.Point(100, 0), cpp.Point(50, 100)], True
-        )
-        cpp_polyline = cpp_drawing.add_polyline(
-            [cpp.Point(0, 0), cpp.Point(50, 50), cpp.Point(100, 0)], cpp.LineStyle.Dashed
-        )
-        cpp_arc = cpp_drawing.add_arc(400, 400, 30, 0, 90)
-        cpp_text = cpp_drawing.add_text(500, 500, "Test Text", 16, "Arial")
-        cpp_path = cpp_drawing.add_path("M 10,10 L 100,100 Z")
-
-        # Test object creation succeeded
-        self.assert_equal(True, cpp_circle > 0, "C++ circle creation")
-        self.assert_equal(True, cpp_rect > 0, "C++ rectangle creation")
-        self.assert_equal(True, cpp_line > 0, "C++ line creation")
-        self.assert_equal(True, cpp_ellipse > 0, "C++ ellipse creation")
-        self.assert_equal(True, cpp_polygon > 0, "C++ polygon creation")
-        self.assert_equal(True, cpp_polyline > 0, "C++ polyline creation")
-        self.assert_equal(True, cpp_arc > 0, "C++ arc creation")
-        self.assert_equal(True, cpp_text > 0, "C++ text creation")
-        self.assert_equal(True, cpp_path > 0, "C++ path creation")
-
-        # Test object counts
-        self.assert_equal(9, cpp_drawing.total_objects(), "Total C++ objects created")
-
-        print(f"✓ Drawable objects: {self.tests_passed - self.tests_failed} tests passed")
-
-    def test_advanced_features(self):
-        """Test advanced features: gradients, patterns, naming, metadata"""
-        print("\n=== Testing Advanced Features ===")
-
-        # Test Python metadata
-        py_circle = PyCircle(
-            center=PyPoint(x=100, y=100), radius=50, metadata={"type": "logo", "layer": "graphics"}
-        )
-        self.assert_equal("logo", py_circle.metadata["type"], "Python metadata access")
-        self.assert_equal("graphics", py_circle.metadata["layer"], "Python metadata access")
-
-        # Test C++ advanced features
-        cpp_drawing = cpp.Drawing()
-
-        # Test gradients
-        stops = [
-            cpp.GradientStop(0.0, cpp.Color(255, 0, 0)),
-            cpp.GradientStop(1.0, cpp.Color(0, 255, 0)),
+    assert py_line_solid.line_style == PyLineStyle.SOLID
+    assert py_line_dashed.line_style == PyLineStyle.DASHED
+    assert cpp_drawing.total_objects() == 2
+
+
+def test_drawable_objects():
+    """Test all drawable object types"""
+    PyCircle(center=PyPoint(x=100, y=100), radius=50)
+    PyRectangle(top_left=PyPoint(x=200, y=200), width=150, height=100, corner_radius=10)
+    PyLine(
+        start_point=PyPoint(x=0, y=0),
+        end_point=PyPoint(x=50, y=50),
+        line_style=PyLineStyle.DOTTED,
+    )
+    PyEllipse(center=PyPoint(x=300, y=300), rx=60, ry=40, rotation=45)
+    PyPolygon(points=[PyPoint(x=0, y=0), PyPoint(x=100, y=0), PyPoint(x=50, y=100)], closed=True)
+    PyPolyline(
+        points=[PyPoint(x=0, y=0), PyPoint(x=50, y=50), PyPoint(x=100, y=0)],
+        line_style=PyLineStyle.DASHED,
+    )
+    PyArc(center=PyPoint(x=400, y=400), radius=30, start_angle=0, end_angle=90)
+    PyText(position=PyPoint(x=500, y=500), content="Test Text", font_size=16, font_family="Arial")
+    py_path = PyPath(
+        commands=[
+            PyPathCommand(command="M", params=[10, 10]),
+            PyPathCommand(command="L", params=[100, 100]),
+            PyPathCommand(command="Z"),
         ]
-        gradient_id = cpp_drawing.add_linear_gradient(stops, 45.0)
-        self.assert_equal(True, gradient_id >= 0, "C++ gradient creation")
-
-        # Test patterns
-        pattern_id = cpp_drawing.add_pattern("stripes")
-        self.assert_equal(True, pattern_id >= 0, "C++ pattern creation")
-
-        # Test object naming and metadata
-        circle_id = cpp_drawing.add_circle(100, 100, 50)
-        cpp_drawing.set_object_name(circle_id, "main_circle")
-        cpp_drawing.set_object_metadata(circle_id, "type", "logo")
-        cpp_drawing.set_object_metadata(circle_id, "layer", "graphics")
-
-        name = cpp_drawing.get_object_name(circle_id)
-        type_meta = cpp_drawing.get_object_metadata(circle_id, "type")
-        layer_meta = cpp_drawing.get_object_metadata(circle_id, "layer")
-
-        self.assert_equal("main_circle", name, "C++ object naming")
-        self.assert_equal("logo", type_meta, "C++ metadata retrieval")
-        self.assert_equal("graphics", layer_meta, "C++ metadata retrieval")
-
-        # Test applying features to objects
-        cpp_drawing.set_object_gradient(circle_id, gradient_id)
-        cpp_drawing.set_object_pattern(circle_id, pattern_id)
-
-        print(f"✓ Advanced features: {self.tests_passed - self.tests_failed} tests passed")
-
-    def test_bounding_boxes(self):
-        """Test bounding box calculations"""
-        print("\n=== Testing Bounding Boxes ===")
-
-        # Test Python bounding boxes
-        py_circle = PyCircle(center=PyPoint(x=100, y=100), radius=50)
-        py_bbox = py_circle.get_bounding_box()
-
-        # Expected: center(100,100) radius(50) -> bbox(50,50,150,150)
-        self.assert_close(50, py_bbox.min_x, message="Python circle bbox min_x")
-        self.assert_close(50, py_bbox.min_y, message="Python circle bbox min_y")
-        self.assert_close(150, py_bbox.max_x, message="Python circle bbox max_x")
-        self.assert_close(150, py_bbox.max_y, message="Python circle bbox max_y")
-
-        # Test C++ bounding box
-        cpp_drawing = cpp.Drawing()
-        cpp_drawing.add_circle(100, 100, 50)
-        cpp_bbox = cpp_drawing.get_bounding_box()
-
-        # Should match Python calculation
-        self.assert_close(50, cpp_bbox.min_x, message="C++ circle bbox min_x")
-        self.assert_close(50, cpp_bbox.min_y, message="C++ circle bbox min_y")
-        self.assert_close(150, cpp_bbox.max_x, message="C++ circle bbox max_x")
-        self.assert_close(150, cpp_bbox.max_y, message="C++ circle bbox max_y")
-
-        print(f"✓ Bounding boxes: {self.tests_passed - self.tests_failed} tests passed")
-
-    def test_layer_management(self):
-        """Test layer management"""
-        print("\n=== Testing Layer Management ===")
-
-        # Test C++ drawing and layers (focus on C++ since it's what we're testing)
-        cpp_drawing = cpp.Drawing(800, 600)
-        cpp_bg_layer = cpp_drawing.add_layer("Background")
-        cpp_fg_layer = cpp_drawing.add_layer("Foreground")
-
-        self.assert_close(800, cpp_drawing.get_width(), message="C++ drawing width")
-        self.assert_close(600, cpp_drawing.get_height(), message="C++ drawing height")
-        # Check if we can get the layers we created
-        bg_layer_obj = cpp_drawing.get_layer(cpp_bg_layer)
-        fg_layer_obj = cpp_drawing.get_layer(cpp_fg_layer)
-        self.assert_equal(True, bg_layer_obj is not None, "C++ background layer exists")
-        self.assert_equal(True, fg_layer_obj is not None, "C++ foreground layer exists")
-
-        # Test adding objects to specific layers
-        cpp_circle = cpp_drawing.add_circle(100, 100, 25, cpp_bg_layer)
-        cpp_rect = cpp_drawing.add_rectangle(200, 200, 50, 50, 0, cpp_fg_layer)
-
-        # Verify objects were created successfully
-        self.assert_equal(True, cpp_circle > 0, "C++ circle creation in background layer")
-        self.assert_equal(True, cpp_rect > 0, "C++ rectangle creation in foreground layer")
-        self.assert_equal(2, cpp_drawing.total_objects(), "C++ total objects in layers")
-
-        # Test layer properties
-        bg_layer = cpp_drawing.get_layer(cpp_bg_layer)
-        fg_layer = cpp_drawing.get_layer(cpp_fg_layer)
-
-        if bg_layer and fg_layer:
-            self.assert_equal("Background", bg_layer.get_name(), "Background layer name")
-            self.assert_equal("Foreground", fg_layer.get_name(), "Foreground layer name")
-            self.assert_equal(True, bg_layer.is_visible(), "Background layer visibility")
-            self.assert_equal(True, fg_layer.is_visible(), "Foreground layer visibility")
-
-        print(f"✓ Layer management: {self.tests_passed - self.tests_failed} tests passed")
-
-    def test_performance_comparison(self):
-        """Test performance characteristics"""
-        print("\n=== Testing Performance Characteristics ===")
-
-        import time
-
-        # Test C++ performance
-        cpp_drawing = cpp.Drawing(1000, 1000)
-        start_time = time.time()
-
-        for i in range(1000):
-            cpp_drawing.add_circle(i % 800, (i * 2) % 600, 10 + (i % 20))
-
-        cpp_time = time.time() - start_time
-        cpp_memory = cpp_drawing.memory_usage()
-
-        # Verify performance targets from CLAUDE.md
-        self.assert_equal(True, cpp_time < 1.0, "C++ creation time < 1 second for 1000 objects")
-        self.assert_equal(
-            True,
-            cpp_memory / cpp_drawing.total_objects() < 100,
-            "C++ memory < 100 bytes per object",
-        )
-
-        print(f"✓ C++ Performance: {cpp_time*1000:.2f}ms for 1000 objects")
-        print(f"✓ C++ Memory: {cpp_memory / cpp_drawing.total_objects():.1f} bytes per object")
-        print(f"✓ Performance tests: {self.tests_passed - self.tests_failed} tests passed")
-
-    def test_serialization_compatibility(self):
-        """Test serialization format compatibility"""
-        print("\n=== Testing Serialization Compatibility ===")
-
-        # Create C++ drawing with various objects
-        cpp_drawing = cpp.Drawing(800, 600)
-        cpp_drawing.add_circle(100, 100, 50)
-        cpp_drawing.add_rectangle(200, 200, 100, 80, 10)  # with corner radius
-        cpp_drawing.add_line(0, 0, 300, 300, cpp.LineStyle.Dashed)
-
-        # Test binary serialization
-        try:
-            cpp.save_binary(cpp_drawing, "test_compatibility.bin")
-            loaded_drawing = cpp.load_binary("test_compatibility.bin")
-
-            self.assert_equal(
-                cpp_drawing.total_objects(),
-                loaded_drawing.total_objects(),
-                "Binary serialization object count",
-            )
-            self.assert_close(
-                cpp_drawing.get_width(),
-                loaded_drawing.get_width(),
-                message="Binary serialization width",
-            )
-            self.assert_close(
-                cpp_drawing.get_height(),
-                loaded_drawing.get_height(),
-                message="Binary serialization height",
-            )
-
-            # Clean up
-            os.remove("test_compatibility.bin")
-
-        except Exception as e:
-            self.tests_failed += 1
-            self.errors.append(f"Binary serialization failed: {str(e)}")
-            print(f"  ❌ Binary serialization failed: {str(e)}")
-
-        # Test JSON serialization
-        try:
-            cpp.save_json(cpp_drawing, "test_compatibility.json")
-
-            # Verify JSON file was created and has content
-            self.assert_equal(True, os.path.exists("test_compatibility.json"), "JSON file creation")
-
-            with open("test_compatibility.json", "r") as f:
-                json_data = json.load(f)
-                self.assert_equal(
-                    True, "objects" in json_data or "width" in json_data, "JSON structure"
-                )
-
-            # Clean up
-            os.remove("test_compatibility.json")
-
-        except Exception as e:
-            self.tests_failed += 1
-            self.errors.append(f"JSON serialization failed: {str(e)}")
-            print(f"  ❌ JSON serialization failed: {str(e)}")
-
-        print(f"✓ Serialization: {self.tests_passed - self.tests_failed} tests passed")
-
-    def run_all_tests(self):
-        """Run all compatibility tests"""
-        print("🔍 Running comprehensive Python-C++ compatibility tests...")
-
-        self.test_basic_types()
-        self.test_line_styles()
-        self.test_drawable_objects()
-        self.test_advanced_features()
-        self.test_bounding_boxes()
-        self.test_layer_management()
-        self.test_performance_comparison()
-        self.test_serialization_compatibility()
-
-        # Final summary
-        total_tests = self.tests_passed + self.tests_failed
-        success_rate = (self.tests_passed / total_tests * 100) if total_tests > 0 else 0
-
-        print(f"\n{'='*60}")
-        print(f"🎯 COMPATIBILITY TEST RESULTS")
-        print(f"{'='*60}")
-        print(f"✅ Tests Passed: {self.tests_passed}")
-        print(f"❌ Tests Failed: {self.tests_failed}")
-        print(f"📊 Success Rate: {success_rate:.1f}%")
-        print(
-            f"🎯 Compatibility: {'EXCELLENT' if success_rate >= 95 else 'GOOD' if success_rate >= 85 else 'NEEDS_WORK'}"
-        )
-
-        if self.errors:
-            print(f"\n⚠️  Failed Tests:")
-            for error in self.errors:
-                print(f"   • {error}")
-
-        print(f"\n✨ C++ Implementation Status:")
-        print(f"   • All 10 core object types: ✅ IMPLEMENTED")
-        print(f"   • LineStyle support: ✅ IMPLEMENTED")
-        print(f"   • Corner radius: ✅ IMPLEMENTED")
-        print(f"   • Closed polygons: ✅ IMPLEMENTED")
-        print(f"   • Gradient system: ✅ IMPLEMENTED")
-        print(f"   • Pattern support: ✅ IMPLEMENTED")
-        print(f"   • Object naming: ✅ IMPLEMENTED")
-        print(f"   • Metadata system: ✅ IMPLEMENTED")
-        print(f"   • Python bindings: ✅ FULLY_FUNCTIONAL")
-        print(f"   • Performance targets: ✅ ACHIEVED")
-
-        return success_rate >= 85
-
-
-def main():
-    """Main test runner"""
-    tester = CompatibilityTester()
-    success = tester.run_all_tests()
-
-    return 0 if success else 1
+    )
+
+    cpp_drawing = cpp.Drawing()
+    cpp_ids = [
+        cpp_drawing.add_circle(100, 100, 50),
+        cpp_drawing.add_rectangle(200, 200, 150, 100, 10),  # with corner radius
+        cpp_drawing.add_line(0, 0, 50, 50, cpp.LineStyle.Dotted),
+        cpp_drawing.add_ellipse(300, 300, 60, 40, 45),  # rotation in degrees
+        cpp_drawing.add_polygon([cpp.Point(0, 0), cpp.Point(100, 0), cpp.Point(50, 100)], True),
+        cpp_drawing.add_polyline(
+            [cpp.Point(0, 0), cpp.Point(50, 50), cpp.Point(100, 0)], cpp.LineStyle.Dashed
+        ),
+        cpp_drawing.add_arc(400, 400, 30, 0, 90),
+        cpp_drawing.add_text(500, 500, "Test Text", 16, "Arial"),
+    ]
+    # py_path's commands go over as codes and numbers, no SVG text to parse
+    cpp_ids += cpp_drawing.add_path_ops(
+        [PATH_COMMAND_CODES[c.command] for c in py_path.commands],
+        [[p for c in py_path.commands for p in c.params]],
+    ).tolist()
+
+    assert min(cpp_ids) > 0, f"creation failed: {cpp_ids}"
+    assert cpp_drawing.total_objects() == len(cpp_ids) == 9
+
+
+def test_advanced_features():
+    """Test advanced features: gradients, patterns, naming, metadata"""
+    py_circle = PyCircle(
+        center=PyPoint(x=100, y=100), radius=50, metadata={"type": "logo", "layer": "graphics"}
+    )
+    assert py_circle.metadata == {"type": "logo", "layer": "graphics"}
 
+    cpp_drawing = cpp.Drawing()
 
-if __name__ == "__main__":
-    sys.exit(main())
+    stops = [
+        cpp.GradientStop(0.0, cpp.Color(255, 0, 0)),
+        cpp.GradientStop(1.0, cpp.Color(0, 255, 0)),
+    ]
+    gradient_id = cpp_drawing.add_linear_gradient(stops, 45.0)
+    assert gradient_id >= 0
+
+    pattern_id = cpp_drawing.add_pattern("stripes")
+    assert pattern_id >= 0
+
+    circle_id = cpp_drawing.add_circle(100, 100, 50)
+    cpp_drawing.set_object_name(circle_id, "main_circle")
+    cpp_drawing.set_object_metadata(circle_id, {"type": "logo", "layer": "graphics"})
+
+    assert cpp_drawing.get_object_name(circle_id) == "main_circle"
+    assert cpp_drawing.get_object_metadata(circle_id, "type") == "logo"
+    assert cpp_drawing.get_object_metadata(circle_id, "layer") == "graphics"
+
+    cpp_drawing.set_object_gradient(circle_id, gradient_id)
+    cpp_drawing.set_object_pattern(circle_id, pattern_id)
 
+
+def test_bounding_boxes():
+    """Python and C++ compute the same circle bounding box"""
+    py_bbox = PyCircle(center=PyPoint(x=100, y=100), radius=50).get_bounding_box()
+
+    cpp_drawing = cpp.Drawing()
+    cpp_drawing.add_circle(100, 100, 50)
+    cpp_bbox = cpp_drawing.get_bounding_box()
+
+    # center(100,100) radius(50) -> bbox(50,50,150,150)
+    expected = pytest.approx((50, 50, 150, 150), abs=0.001)
+    assert (py_bbox.min_x, py_bbox.min_y, py_bbox.max_x, py_bbox.max_y) == expected
+    assert (cpp_bbox.min_x, cpp_bbox.min_y, cpp_bbox.max_x, cpp_bbox.max_y) == expected
+
+
+def test_layer_management():
+    """Test layer management"""
+    cpp_drawing = cpp.Drawing(800, 600)
+    cpp_bg_layer = cpp_drawing.add_layer("Background")
+    cpp_fg_layer = cpp_drawing.add_layer("Foreground")
+
+    assert cpp_drawing.get_width() == 800
+    assert cpp_drawing.get_height() == 600
+
+    cpp_circle = cpp_drawing.add_circle(100, 100, 25, cpp_bg_layer)
+    cpp_rect = cpp_drawing.add_rectangle(200, 200, 50, 50, 0, cpp_fg_layer)
+
+    assert cpp_circle > 0
+    assert cpp_rect > 0
+    assert cpp_drawing.total_objects() == 2
+
+    bg_layer = cpp_drawing.get_layer(cpp_bg_layer)
+    fg_layer = cpp_drawing.get_layer(cpp_fg_layer)
+    assert bg_layer is not None and fg_layer is not None
+    assert bg_layer.get_name() == "Background"
+    assert fg_layer.get_name() == "Foreground"
+    assert bg_layer.is_visible()
+    assert fg_layer.is_visible()
+
+
+def test_performance_comparison():
+    """1000 circles in well under a second, at under 100 bytes each"""
+    cpp_drawing = cpp.Drawing(1000, 1000)
+    i = np.arange(1000)
+    xs, ys, radii = i % 800, (i * 2) % 600, 10 + (i % 20)
+    start_time = time.perf_counter()
+
+    cpp_drawing.add_circles(xs, ys, radii)
+
+    cpp_time = time.perf_counter() - start_time
+    bytes_per_object = cpp_drawing.memory_usage() / cpp_drawing.total_objects()
+
+    print(f"C++ Performance: {cpp_time*1000:.2f}ms for 1000 objects")
+    print(f"C++ Memory: {bytes_per_object:.1f} bytes per object")
+    assert cpp_time < 1.0
+    assert bytes_per_object < 100
+
+
+def test_serialization_compatibility(tmp_path):
+    """Test serialization format compatibility"""
+    cpp_drawing = cpp.Drawing(800, 600)
+    cpp_drawing.add_circle(100, 100, 50)
+    cpp_drawing.add_rectangle(200, 200, 100, 80, 10)  # with corner radius
+    cpp_drawing.add_line(0, 0, 300, 300, cpp.LineStyle.Dashed)
+
+    loaded_drawing = cpp.load_binary_bytes(cpp.save_binary_bytes(cpp_drawing))
+
+    assert loaded_drawing.total_objects() == cpp_drawing.total_objects()
+    assert loaded_drawing.get_width() == cpp_drawing.get_width()
+    assert loaded_drawing.get_height() == cpp_drawing.get_height()
+
+    json_path = tmp_path / "test_compatibility.json"
+    cpp.save_json(cpp_drawing, str(json_path))
+    json_data = json_loads(json_path.read_bytes())
+
+    assert "objects" in json_data or "width" in json_data
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__]))
@@ -69,6 +69,18 @@ class TestColor:
         assert color2.r == 255
         assert color2.g == 128
         assert color2.b == 64
+        assert color2 is color
+
+    def test_color_get_interns(self):
+        color = Color.get(10, 20, 30, 0.5)
+        assert color == Color(r=10, g=20, b=30, a=0.5)
+        assert Color.get(10, 20, 30, 0.5) is color
+        assert Color.get(10, 20, 30) is not color
+        with pytest.raises(ValidationError):
+            color.r = 0
+
+        with pytest.raises(ValidationError):
+            Color.get(256, 0, 0)
 
     @pytest.mark.parametrize(
         "r,g,b,expected",
@@ -80,6 +92,7 @@ class TestColor:
             (0, 255, 0, "#00ff00"),
             (0, 0, 255, "#0000ff"),
         ],
+        ids=["black", "white", "gray", "red", "green", "blue"],
     )
     def test_color_hex_conversion(self, r, g, b, expected):
         color = Color(r=r, g=g, b=b)
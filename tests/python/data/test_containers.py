@@ -1,18 +1,26 @@
+import gc
+import io
+import weakref
 from uuid import UUID
 
 import pytest
+from pydantic import ValidationError
 
 from python.data import (
     Circle,
     Color,
     Drawing,
     FillStyle,
+    Gradient,
+    GradientStop,
+    GradientType,
     Group,
     Layer,
     Line,
     Point,
     Rectangle,
     Text,
+    drawing_to_svg,
 )
 
 
@@ -89,6 +97,11 @@ class TestGroup:
 
         assert group.updated_at > initial_updated
 
+        single_updated = group.updated_at
+        group.add_objects([Circle(center=Point(x=i, y=i), radius=1) for i in range(3)])
+        assert len(group.objects) == 4
+        assert group.updated_at > single_updated
+
     def test_nested_groups(self):
         outer_group = Group(name="Outer")
         inner_group = Group(name="Inner")
@@ -129,6 +142,42 @@ class TestLayer:
         assert layer.objects[0] == circle
         assert circle.layer_id == layer.id
 
+    def test_layer_add_objects(self):
+        layer = Layer(name="Shapes")
+        circles = [Circle(center=Point(x=i, y=i), radius=5) for i in range(3)]
+
+        layer.add_objects(circles)
+
+        assert layer.objects == circles
+        assert all(circle.layer_id == layer.id for circle in circles)
+
+    def test_layer_ingest_circles(self):
+        layer = Layer(name="Bulk")
+        fill = FillStyle(color=Color(r=255, g=0, b=0))
+
+        circles = layer.ingest_circles([0, 10], [5, 15], [1.0, 2.0], fill=fill)
+
+        assert layer.objects == circles
+        assert circles[1].center.x == 10.0
+        assert circles[1].radius == 2.0
+        assert circles[0].fill.color.r == 255
+        assert circles[0].fill is not circles[1].fill
+        circles[0].fill.color = Color(r=0, g=0, b=255)
+        assert circles[1].fill.color.r == 255
+        assert all(circle.layer_id == layer.id for circle in circles)
+        assert circles[0].id != circles[1].id
+        assert all(circle.id.version == 4 for circle in circles)
+
+    def test_layer_ingest_circles_length_mismatch(self):
+        layer = Layer(name="Bulk")
+        with pytest.raises(ValueError):
+            layer.ingest_circles([0, 1], [0], [1.0, 1.0])
+
+    def test_layer_ingest_circles_validates(self):
+        layer = Layer(name="Bulk")
+        with pytest.raises(ValidationError):
+            layer.ingest_circles([0, 1], [0, 1], [1.0, 0.0])
+
     def test_layer_remove_object(self):
         layer = Layer(name="Test")
         circle = Circle(center=Point(x=0, y=0), radius=10)
@@ -170,6 +219,75 @@ class TestLayer:
         found = layer.get_object_by_id(circle.id)
         assert found == circle
 
+    def test_layer_get_object_by_id_after_changes(self):
+        layer = Layer(name="Test")
+        group = Group(name="Group")
+        circle = Circle(center=Point(x=0, y=0), radius=10)
+        rect = Rectangle(top_left=Point(x=0, y=0), width=50, height=50)
+        group.add_object(circle)
+        layer.add_objects([group, rect])
+        assert layer.get_object_by_id(circle.id) is circle
+
+        # Changes made behind the layer's back are still seen
+        group.remove_object(circle.id)
+        assert layer.get_object_by_id(circle.id) is None
+        group.add_object(circle)
+        assert layer.get_object_by_id(circle.id) is circle
+        layer.objects[1] = circle
+        assert layer.get_object_by_id(rect.id) is None
+        assert layer.get_object_by_id(circle.id) is circle
+
+    def test_layer_get_object_by_id_after_list_edits(self):
+        layer = Layer(name="Test")
+        group = Group(name="Group")
+        first, second = layer.ingest_circles([0, 1], [0, 1], [1.0, 1.0])
+        layer.add_object(group)
+        assert layer.get_object_by_id(second.id) is second
+
+        nested = Circle(center=Point(x=5, y=5), radius=2)
+        group.objects.append(nested)
+        assert layer.get_object_by_id(nested.id) is nested
+
+        replacement = Rectangle(top_left=Point(x=0, y=0), width=5, height=5)
+        layer.objects[0] = replacement
+        assert layer.get_object_by_id(replacement.id) is replacement
+        assert layer.get_object_by_id(first.id) is None
+
+        # Same length as before, different contents
+        appended = Circle(center=Point(x=9, y=9), radius=3)
+        layer.objects.pop(0)
+        layer.objects.append(appended)
+        assert layer.get_object_by_id(appended.id) is appended
+        assert layer.get_object_by_id(replacement.id) is None
+        assert layer.get_object_by_id(second.id) is second
+
+        group.objects[0] = first
+        assert layer.get_object_by_id(first.id) is first
+        assert layer.get_object_by_id(nested.id) is None
+
+    def test_layer_id_index_follows_layer_methods(self):
+        layer = Layer(name="Test")
+        first, second = layer.ingest_circles([0, 1], [0, 1], [1.0, 1.0])
+        assert layer.get_object_by_id(second.id) is second
+
+        rect = Rectangle(top_left=Point(x=0, y=0), width=50, height=50)
+        layer.add_object(rect)
+        assert layer.get_object_by_id(rect.id) is rect
+
+        # The index holds positions, not objects, so removal frees them
+        first_id, first_ref = first.id, weakref.ref(first)
+        assert layer.remove_object(first_id) is True
+        del first
+        gc.collect()
+        assert first_ref() is None
+        assert layer.get_object_by_id(first_id) is None
+        assert layer.get_object_by_id(rect.id) is rect
+        assert layer.get_object_by_id(second.id) is second
+
+        layer.objects = [rect]
+        assert layer.get_object_by_id(second.id) is None
+        assert layer.get_object_by_id(rect.id) is rect
+
     def test_layer_mixed_objects(self):
         layer = Layer(name="Mixed")
 
@@ -276,6 +394,20 @@ class TestDrawing:
         assert rect in all_objects
         assert line in all_objects
 
+    def test_drawing_walk_objects(self):
+        drawing = Drawing()
+        layer = Layer(name="Layer 1")
+        leaf = Circle(center=Point(x=50, y=50), radius=25)
+        group = Group(name="Group", objects=[leaf])
+        line = Line(start_point=Point(x=0, y=0), end_point=Point(x=100, y=100))
+        layer.add_objects([group, line])
+        drawing.add_layer(layer)
+
+        walked = list(drawing.walk_objects())
+        assert [depth for depth, _ in walked] == [0, 1, 0]
+        assert [obj for _, obj in walked] == [group, leaf, line]
+        assert len(drawing.get_all_objects()) == 2  # top level only
+
     def test_drawing_updated_timestamp(self):
         drawing = Drawing()
         initial_updated = drawing.updated_at
@@ -294,6 +426,65 @@ class TestDrawing:
         assert 'fill="#ffffff"' in svg
         assert "</svg>" in svg
 
+    def test_drawing_to_svg_stream(self):
+        drawing = Drawing(width=200, height=100)
+        layer = Layer(name="Shapes")
+        layer.add_object(
+            Circle(
+                center=Point(x=50, y=50),
+                radius=20,
+                fill=FillStyle(
+                    gradient=Gradient(
+                        type=GradientType.LINEAR,
+                        stops=[
+                            GradientStop(offset=0, color=Color(r=255, g=0, b=0)),
+                            GradientStop(offset=1, color=Color(r=0, g=0, b=255)),
+                        ],
+                    )
+                ),
+            )
+        )
+        drawing.add_layer(layer)
+
+        out = io.StringIO()
+        assert drawing_to_svg(drawing, out=out) is None
+        assert out.getvalue() == drawing.to_svg()
+        assert "<defs>" in out.getvalue()
+
+    def test_drawing_to_svg_circle_style_runs(self):
+        drawing = Drawing()
+        layer = Layer(name="Dots")
+        red = FillStyle(color=Color(r=255, g=0, b=0))
+        layer.add_objects(
+            [
+                Circle(center=Point(x=1, y=1), radius=1, fill=red),
+                Circle(center=Point(x=2, y=2), radius=2, fill=red),
+                Circle(center=Point(x=3, y=3), radius=3, fill=red, opacity=0.5),
+                Circle(center=Point(x=4, y=4), radius=4),
+            ]
+        )
+        drawing.add_layer(layer)
+
+        circles = [line for line in drawing.to_svg().splitlines() if "<circle" in line]
+        assert circles == [
+            '  <circle cx="1.0" cy="1.0" r="1.0" fill="#ff0000" stroke="#000000" stroke-width="1.0"/>',
+            '  <circle cx="2.0" cy="2.0" r="2.0" fill="#ff0000" stroke="#000000" stroke-width="1.0"/>',
+            '  <circle cx="3.0" cy="3.0" r="3.0" fill="#ff0000" stroke="#000000" stroke-width="1.0" opacity="0.5"/>',
+            '  <circle cx="4.0" cy="4.0" r="4.0" fill="none" stroke="#000000" stroke-width="1.0"/>',
+        ]
+
+    def test_drawing_json_round_trip(self):
+        drawing = Drawing(name="Round Trip", width=300, height=200)
+        layer = Layer(name="Shapes")
+        layer.add_object(Circle(center=Point(x=10, y=20), radius=5))
+        line = Line(start_point=Point(x=0, y=0), end_point=Point(x=1, y=1))
+        layer.add_object(Group(objects=[line]))
+        drawing.add_layer(layer)
+
+        loaded = Drawing.from_json(drawing.to_json())
+        assert loaded == drawing
+        assert isinstance(loaded.layers[0].objects[1], Group)
+
     def test_drawing_validation(self):
         with pytest.raises(ValueError):
             Drawing(width=0, height=100)  # width must be > 0
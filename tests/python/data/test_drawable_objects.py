@@ -86,6 +86,18 @@ class TestCircle:
         assert bbox.width == 100
         assert bbox.height == 100
 
+    def test_circle_bounding_box_tracks_changes(self):
+        circle = Circle(center=Point(x=100, y=100), radius=50)
+        circle.radius = 10
+        assert circle.get_bounding_box().max_x == 110
+        circle.center = Point(x=0, y=0)
+        assert circle.get_bounding_box().min_x == -10
+
+        moved = circle.model_copy(update={"center": Point(x=500, y=500)})
+        assert moved.get_bounding_box().min_x == 490
+        assert circle.get_bounding_box().min_x == -10
+        assert circle == circle.model_copy()
+
     def test_circle_with_fill(self):
         circle = Circle(
             center=Point(x=0, y=0),
@@ -178,6 +190,15 @@ class TestPolygon:
         assert bbox.max_x == 50
         assert bbox.max_y == 60
 
+    def test_polygon_bounding_box_tracks_point_edits(self):
+        polygon = Polygon(points=[Point(x=0, y=0), Point(x=10, y=0), Point(x=10, y=10)])
+        polygon.points.append(Point(x=-5, y=20))
+        assert polygon.get_bounding_box().min_x == -5
+        polygon.points[0] = Point(x=0, y=-8)
+        assert polygon.get_bounding_box().min_y == -8
+        polygon.points = polygon.points[1:]
+        assert polygon.get_bounding_box().min_y == 0
+
     def test_polygon_open(self):
         polygon = Polygon(
             points=[Point(x=0, y=0), Point(x=10, y=0), Point(x=10, y=10)], closed=False
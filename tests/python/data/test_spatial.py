@@ -0,0 +1,51 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from python.data import BoundingBox, Circle, Line, Point, Polygon, Rectangle  # noqa: E402
+from python.data.spatial import bbox_array, find_in_rect, points_bounding_box  # noqa: E402
+
+
+def make_objects():
+    return [
+        Circle(center=Point(x=10, y=10), radius=5),
+        Rectangle(top_left=Point(x=100, y=100), width=20, height=10),
+        Line(start_point=Point(x=50, y=0), end_point=Point(x=0, y=50)),
+    ]
+
+
+class TestSpatial:
+    def test_bbox_array(self):
+        objects = make_objects()
+        boxes = bbox_array(objects)
+
+        assert boxes.shape == (3, 4)
+        assert boxes.dtype == np.float64
+        for obj, row in zip(objects, boxes):
+            bbox = obj.get_bounding_box()
+            assert row.tolist() == [bbox.min_x, bbox.min_y, bbox.max_x, bbox.max_y]
+
+    def test_bbox_array_empty(self):
+        assert bbox_array([]).shape == (0, 4)
+
+    def test_find_in_rect(self):
+        boxes = bbox_array(make_objects())
+
+        hits = find_in_rect(boxes, BoundingBox(min_x=0, min_y=0, max_x=20, max_y=20))
+        assert hits.tolist() == [0, 2]
+
+        hits = find_in_rect(boxes, BoundingBox(min_x=115, min_y=105, max_x=200, max_y=200))
+        assert hits.tolist() == [1]
+
+        hits = find_in_rect(boxes, BoundingBox(min_x=60, min_y=60, max_x=90, max_y=90))
+        assert hits.tolist() == []
+
+    def test_points_bounding_box(self):
+        points = [Point(x=3, y=-1), Point(x=-2, y=4), Point(x=7, y=2), Point(x=0, y=0)]
+        xs = np.array([p.x for p in points])
+        ys = np.array([p.y for p in points])
+
+        assert points_bounding_box(xs, ys) == Polygon(points=points).get_bounding_box()
+
+        with pytest.raises(ValueError):
+            points_bounding_box(xs, ys[:2])